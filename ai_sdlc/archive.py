@@ -0,0 +1,191 @@
+"""Compressed archives of finished workstreams.
+
+With ``archive_format = "zip"`` in `.aisdlc`, `aisdlc done` packs a finished
+workstream into ``<done_dir>/<slug>.zip`` instead of moving its directory
+there.  Members are LZMA-compressed (deflate if the interpreter lacks
+`lzma`) and stored as ``<slug>/<file>``, so `unzip` recreates the usual
+layout.  The zip central directory gives random access to any single step,
+which is how `aisdlc show` reads archived steps without unpacking.
+
+``<done_dir>/index.json`` lists every archive with its steps and size, so
+tools can enumerate finished workstreams without opening each container.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+from ai_sdlc.utils import atomic_write_text, lock_transaction
+
+# Config key selecting how `done` archives workstreams, and its values
+ARCHIVE_KEY = "archive_format"
+ARCHIVE_FORMATS = ("dir", "zip")
+DEFAULT_ARCHIVE_FORMAT = "dir"
+
+INDEX_FILE = "index.json"
+
+
+def archive_format(conf: dict[str, Any]) -> str:
+    """Return the configured archive format.
+
+    Raises:
+        ValueError: If ``archive_format`` is not a known format.
+    """
+    fmt = conf.get(ARCHIVE_KEY, DEFAULT_ARCHIVE_FORMAT)
+    if fmt not in ARCHIVE_FORMATS:
+        raise ValueError(
+            f"Unknown {ARCHIVE_KEY} '{fmt}' (expected {' or '.join(map(repr, ARCHIVE_FORMATS))})"
+        )
+    return str(fmt)
+
+
+def _compression() -> int:
+    import zipfile
+
+    try:
+        import lzma  # noqa: F401  # Optional in some Python builds
+    except ImportError:  # pragma: no cover
+        return zipfile.ZIP_DEFLATED
+    return zipfile.ZIP_LZMA
+
+
+def archive_path(done: Path, slug: str) -> Path:
+    """Return the archive file of workstream *slug* in *done*."""
+    return done / f"{slug}.zip"
+
+
+def pack(src: Path, done: Path, slug: str) -> dict[str, Any]:
+    """Pack the files of directory *src* into the archive of *slug*.
+
+    The archive is written to a temporary file and renamed into place, so an
+    interrupted pack never leaves a truncated archive behind.  *src* is left
+    untouched.
+
+    Returns:
+        dict[str, Any]: The archive's entry for `update_index`.
+
+    Raises:
+        FileExistsError: If the archive already exists.
+        OSError: If reading *src* or writing the archive fails.
+    """
+    import tempfile
+    import zipfile
+
+    dest = archive_path(done, slug)
+    if dest.exists():
+        raise FileExistsError(f"'{dest}' already exists")
+    done.mkdir(parents=True, exist_ok=True)
+    names = sorted(
+        p.relative_to(src).as_posix()
+        for p in src.rglob("*")
+        if p.is_file() and not p.is_symlink()
+    )
+    fd, tmp = tempfile.mkstemp(dir=done, prefix=f".{slug}.", suffix=".zip.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, zipfile.ZipFile(f, "w", _compression()) as zf:
+            for name in names:
+                info = zipfile.ZipInfo.from_file(src / name, f"{slug}/{name}")
+                info.compress_type = _compression()
+                with (src / name).open("rb") as member, zf.open(info, "w") as out:
+                    shutil.copyfileobj(member, out, 1 << 20)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, dest)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    return {"file": dest.name, "files": names, "size": dest.stat().st_size}
+
+
+def index_entry(done: Path, slug: str) -> dict[str, Any]:
+    """Return the index entry describing the existing archive of *slug*.
+
+    Raises:
+        OSError: If the archive cannot be read.
+    """
+    dest = archive_path(done, slug)
+    return {
+        "file": dest.name,
+        "files": member_names(done, slug),
+        "size": dest.stat().st_size,
+    }
+
+
+def load_index(done: Path) -> dict[str, dict[str, Any]]:
+    """Return the archive index of *done* ({} if there is none)."""
+    import json
+
+    try:
+        data = json.loads((done / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def update_index(done: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """Merge *entries* into the archive index of *done*.
+
+    Raises:
+        OSError: If the index cannot be written.
+        TimeoutError: If the state lock cannot be acquired in time.
+    """
+    import json
+
+    with lock_transaction():
+        index = load_index(done)
+        index.update(entries)
+        atomic_write_text(
+            done / INDEX_FILE, json.dumps(dict(sorted(index.items())), indent=2) + "\n"
+        )
+
+
+def read_member(done: Path, slug: str, filename: str) -> bytes | None:
+    """Return file *filename* of archived workstream *slug*, or None if absent.
+
+    Looks in the archive file first, then in an unpacked ``<done>/<slug>/``.
+
+    Raises:
+        OSError: If the archive exists but cannot be read.
+    """
+    import zipfile
+
+    zpath = archive_path(done, slug)
+    if zpath.exists():
+        try:
+            with zipfile.ZipFile(zpath) as zf:
+                return zf.read(f"{slug}/{filename}")
+        except KeyError:
+            return None
+        except zipfile.BadZipFile as e:
+            raise OSError(f"'{zpath}' is not a valid archive: {e}") from e
+    try:
+        return (done / slug / filename).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def member_names(done: Path, slug: str) -> list[str]:
+    """Return the file names stored for archived workstream *slug*."""
+    import zipfile
+
+    zpath = archive_path(done, slug)
+    if zpath.exists():
+        with (
+            contextlib.suppress(OSError, zipfile.BadZipFile),
+            zipfile.ZipFile(zpath) as zf,
+        ):
+            prefix = f"{slug}/"
+            return [n[len(prefix) :] for n in zf.namelist() if n.startswith(prefix)]
+        return []
+    directory = done / slug
+    if directory.is_dir():
+        return sorted(
+            p.relative_to(directory).as_posix()
+            for p in directory.rglob("*")
+            if p.is_file()
+        )
+    return []
@@ -0,0 +1,167 @@
+"""Content-addressed store for generated prompts and archived step files.
+
+With ``blob_store = true`` in `.aisdlc`, every generated `_prompt-*.md` and
+every file archived by `aisdlc done` is hashed and hardlinked to
+``.aisdlc-cache/objects/<aa>/<rest of sha256>``.  Identical files across
+workstreams then share one inode, so large `doing/` and `done/` trees take a
+fraction of the space and copy faster with link-preserving tools
+(``cp -a``, ``rsync -H``, ``tar``).
+
+Stored files are made read-only: they are shared, so editing one in place
+would change every copy.  Tools that replace files by rename (including
+`aisdlc next`) are unaffected.  An object whose link count has dropped to 1
+is referenced by no workstream any more and is removed by `aisdlc gc`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ai_sdlc.utils import CACHE_DIR, cannot_hardlink, get_root
+
+# Config key enabling the store
+BLOB_STORE_KEY = "blob_store"
+
+OBJECTS_DIR = "objects"
+
+
+def enabled(conf: dict[str, Any]) -> bool:
+    """Return True if the project stores prompts and archives in the blob store."""
+    return bool(conf.get(BLOB_STORE_KEY, False))
+
+
+def objects_dir(root: Path | None = None) -> Path:
+    """Return the object directory of the project at *root* (default: current)."""
+    return (root or get_root()) / CACHE_DIR / OBJECTS_DIR
+
+
+def _object_path(objects: Path, digest: str) -> Path:
+    return objects / digest[:2] / digest[2:]
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of *path*, read in chunks."""
+    import hashlib
+
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def store(path: Path, objects: Path | None = None) -> bool:
+    """Replace *path* with a hardlink to its object, adding the object if new.
+
+    Args:
+        path: Regular file to deduplicate.
+        objects: Object directory (default: the current project's).
+
+    Returns:
+        bool: True if *path* is now linked to the store, False if the
+        filesystem does not support hardlinks there (the file is left as is).
+
+    Raises:
+        OSError: If the file cannot be read or the store cannot be written.
+    """
+    objects = objects or objects_dir()
+    digest = file_digest(path)
+    obj = _object_path(objects, digest)
+    obj.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.link")
+    for _ in range(3):  # `gc` may remove an object between our stat and link
+        try:
+            st = obj.stat()
+        except FileNotFoundError:
+            # First copy of this content: the file itself becomes the object
+            try:
+                os.link(path, obj)
+            except FileExistsError:
+                continue  # Another process stored the same content meanwhile
+            except OSError as e:
+                if cannot_hardlink(e):
+                    return False  # Left as a regular, writable copy
+                raise
+            # Objects are shared by every link: make them read-only once stored
+            os.chmod(obj, 0o444)
+            return True
+        if os.path.samestat(st, path.stat()):
+            return True  # Already linked
+
+        # Swap the file for a link to the existing object, atomically
+        try:
+            os.link(obj, tmp)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            if cannot_hardlink(e):
+                return False
+            raise
+        try:
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+        return True
+    return False
+
+
+def store_tree(directory: Path, objects: Path | None = None) -> tuple[int, int]:
+    """Store every regular file directly inside *directory*.
+
+    Returns:
+        tuple[int, int]: Files linked to the store and files left as they are.
+    """
+    linked = skipped = 0
+    for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+        if entry.is_file(follow_symlinks=False):
+            if store(Path(entry.path), objects):
+                linked += 1
+            else:
+                skipped += 1
+    return linked, skipped
+
+
+@dataclass
+class GcResult:
+    """What `gc` found in the object directory."""
+
+    kept: int = 0
+    removed: int = 0
+    reclaimed_bytes: int = 0
+    kept_bytes: int = 0
+
+
+def gc(objects: Path | None = None, *, dry_run: bool = False) -> GcResult:
+    """Remove objects no workstream file links to any more.
+
+    An object is unreferenced when its link count is 1 (only the store's own
+    name).  Empty fan-out directories are removed as well.
+
+    Raises:
+        OSError: If the object directory cannot be listed.
+    """
+    objects = objects or objects_dir()
+    result = GcResult()
+    if not objects.is_dir():
+        return result
+    for fan in sorted(os.scandir(objects), key=lambda e: e.name):
+        if not fan.is_dir(follow_symlinks=False):
+            continue
+        for entry in os.scandir(fan.path):
+            st = entry.stat(follow_symlinks=False)
+            if st.st_nlink > 1:
+                result.kept += 1
+                result.kept_bytes += st.st_size
+                continue
+            result.removed += 1
+            result.reclaimed_bytes += st.st_size
+            if not dry_run:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(entry.path)
+        if not dry_run:
+            with contextlib.suppress(OSError):
+                os.rmdir(fan.path)  # Only succeeds once the fan-out directory is empty
+    return result
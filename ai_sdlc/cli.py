@@ -1,13 +1,19 @@
 #!/usr/bin/env python
-"""Entry-point for the `aisdlc` CLI."""
+"""Entry-point for the `aisdlc` CLI.
+
+Only the standard library essentials are imported at module level; helpers,
+the daemon client and command modules are loaded on first use to keep startup
+cheap (see `aisdlc --startup-report`).
+"""
 
 from __future__ import annotations
 
+import os
 import sys
 from collections.abc import Callable
 from importlib import import_module
 
-from .utils import CONFIG_FILE, load_config, read_lock
+from . import timing
 
 _COMMANDS: dict[str, str] = {
     "init": "ai_sdlc.commands.init:run_init",
@@ -15,8 +21,54 @@ _COMMANDS: dict[str, str] = {
     "next": "ai_sdlc.commands.next:run_next",
     "status": "ai_sdlc.commands.status:run_status",
     "done": "ai_sdlc.commands.done:run_done",
+    "serve": "ai_sdlc.commands.serve:run_serve",
+    "gc": "ai_sdlc.commands.gc:run_gc",
+    "show": "ai_sdlc.commands.show:run_show",
+    "archive": "ai_sdlc.commands.archive:run_archive",
+    "search": "ai_sdlc.commands.search:run_search",
+    "watch": "ai_sdlc.commands.watch:run_watch",
+    "run": "ai_sdlc.commands.run:run_run",
+    "batch": "ai_sdlc.commands.batch:run_batch",
+    "stats": "ai_sdlc.commands.stats:run_stats",
+    "upgrade-prompts": "ai_sdlc.commands.upgrade_prompts:run_upgrade_prompts",
+}
+
+# Commands after which the compact status line is not shown
+_NO_STATUS_AFTER = {
+    "status",
+    "init",
+    "serve",
+    "gc",
+    "show",
+    "archive",
+    "search",
+    "watch",
+    "stats",
+    "upgrade-prompts",
 }
 
+# Long-running or streaming commands that always run in this process, never in the daemon
+_NOT_FORWARDED = {"serve", "watch", "run"}
+
+# Global flag printing per-phase startup timings to stderr
+STARTUP_REPORT_FLAG = "--startup-report"
+
+# Global flags saving a Chrome trace of the phases / a cProfile dump (`--trace=FILE`)
+TRACE_FLAG = "--trace"
+PROFILE_FLAG = "--profile"
+
+
+def _pop_file_flag(argv: list[str], flag: str, default: str) -> str | None:
+    """Remove ``flag`` or ``flag=FILE`` from *argv* and return the file it names."""
+    for i, arg in enumerate(argv):
+        if arg == flag:
+            del argv[i]
+            return default
+        if arg.startswith(flag + "="):
+            del argv[i]
+            return arg.split("=", 1)[1] or default
+    return None
+
 
 def _resolve(dotted: str) -> Callable[..., None]:
     """Import a function from a module using dotted path notation.
@@ -36,7 +88,8 @@ def _resolve(dotted: str) -> Callable[..., None]:
         raise ValueError(f"Invalid dotted path format: {dotted}. Expected 'module:function'")
     module_name, func_name = dotted.split(":", 1)
     try:
-        module = import_module(module_name)
+        with timing.phase(f"import {module_name}"):
+            module = import_module(module_name)
     except ImportError as e:
         raise ImportError(f"Could not import module '{module_name}': {e}") from e
     if not hasattr(module, func_name):
@@ -50,24 +103,38 @@ def _display_compact_status() -> None:
     Shows the active feature slug, current step, and progress bar.
     Silently handles errors to avoid disrupting the main command output.
     """
-    lock = read_lock()
-    if not lock or "slug" not in lock:
-        return  # No active workstream or invalid lock
+    from .state import get_backend
+    from .utils import CONFIG_FILE, get_root, load_config, read_lock
+
+    if not (get_root() / CONFIG_FILE).exists():
+        if read_lock():
+            print(
+                f"\n---\n📌 AI-SDLC config ({CONFIG_FILE}) not found or invalid. Cannot display status.\n---"
+            )
+        return
 
     try:
         conf = load_config()
+        with get_backend(conf) as backend:
+            lock = backend.get()
+        if not lock or "slug" not in lock:
+            return  # No active workstream or invalid lock
         steps = conf["steps"]
         slug = lock.get("slug", "N/A")
         current_step_name = lock.get("current", "N/A")
 
         if current_step_name in steps:
             idx = steps.index(current_step_name)
+            done = set(steps[: idx + 1])
+            if conf.get("depends"):  # DAG lifecycle: completion is per step file
+                from .graph import completed
+                from .utils import DEFAULT_ACTIVE_DIR
+
+                workdir = get_root() / conf.get("active_dir", DEFAULT_ACTIVE_DIR) / slug
+                done = completed(workdir, slug, steps)
             # Steps are in format like "01-idea", take the part after the dash
             bar = " ▸ ".join(
-                [
-                    ("✅" if i <= idx else "☐") + s.split("-", 1)[1]
-                    for i, s in enumerate(steps)
-                ]
+                [("✅" if s in done else "☐") + s.split("-", 1)[1] for s in steps]
             )
             print(f"\n---\n📌 Current: {slug} @ {current_step_name}\n   {bar}\n---")
         else:
@@ -84,13 +151,16 @@ def _display_compact_status() -> None:
         )
 
 
-def main() -> None:  # noqa: D401
-    """Run the requested sub-command.
+def run(argv: list[str]) -> None:
+    """Run a sub-command in this process.
+
+    Routes to the appropriate command handler and displays compact status after
+    most commands (except status, init, serve and the maintenance commands).
 
-    Parses command-line arguments and routes to the appropriate command handler.
-    Displays compact status after most commands (except status and init).
+    Args:
+        argv: Command-line arguments without the program name.
     """
-    cmd, *args = sys.argv[1:] or ["--help"]
+    cmd, *args = argv or ["--help"]
     if cmd not in _COMMANDS:
         valid = "|".join(_COMMANDS.keys())
         print(f"Usage: aisdlc [{valid}] [--help]")
@@ -98,14 +168,81 @@ def main() -> None:  # noqa: D401
 
     try:
         handler = _resolve(_COMMANDS[cmd])
-        handler(args) if args else handler()
+        with timing.phase(f"run {cmd}"):
+            handler(args) if args else handler()
     except (ValueError, ImportError, AttributeError) as e:
         print(f"❌ Error: Failed to load command '{cmd}': {e}")
         sys.exit(1)
+    except TimeoutError as e:  # State lock held by another aisdlc process
+        print(f"❌ Error: {e}")
+        sys.exit(1)
 
     # Display status after most commands, unless it's status itself or init (before lock exists)
-    if cmd not in ["status", "init"]:
-        _display_compact_status()
+    if cmd not in _NO_STATUS_AFTER:
+        with timing.phase("status display"):
+            _display_compact_status()
+
+    from .utils import CACHE_STATS_ENV, config_cache_stats
+
+    if os.environ.get(CACHE_STATS_ENV):
+        counters = " ".join(f"{k}={v}" for k, v in config_cache_stats().items())
+        print(f"config cache: {counters}", file=sys.stderr)
+        if "ai_sdlc.templates" in sys.modules:
+            from .templates import template_cache_stats
+
+            counters = " ".join(f"{k}={v}" for k, v in template_cache_stats().items())
+            print(f"template cache: {counters}", file=sys.stderr)
+        if "ai_sdlc.response_cache" in sys.modules:
+            from .response_cache import response_cache_stats
+
+            counters = " ".join(f"{k}={v}" for k, v in response_cache_stats().items())
+            print(f"response cache: {counters}", file=sys.stderr)
+
+
+def main() -> None:  # noqa: D401
+    """Run the requested sub-command.
+
+    Forwards the invocation to a running `aisdlc serve` daemon when one is
+    reachable and falls back to in-process execution otherwise.  With
+    ``--startup-report`` the time spent in each startup phase is printed to
+    stderr once the command finishes; ``--trace[=FILE]`` (or ``AISDLC_TRACE``)
+    saves the phases as a Chrome trace and ``--profile[=FILE]`` runs the
+    command under cProfile.
+    """
+    argv = sys.argv[1:]
+    report = STARTUP_REPORT_FLAG in argv
+    if report:
+        argv.remove(STARTUP_REPORT_FLAG)
+        timing.enable()
+    trace_file = _pop_file_flag(argv, TRACE_FLAG, timing.DEFAULT_TRACE_FILE)
+    trace_file = trace_file or os.environ.get(timing.TRACE_ENV) or None
+    profile_file = _pop_file_flag(argv, PROFILE_FLAG, timing.DEFAULT_PROFILE_FILE)
+    if trace_file:
+        timing.enable()
+    try:
+        # Traced and profiled commands run here: daemon phases would not be recorded
+        if not (trace_file or profile_file) and (
+            not argv or argv[0] not in _NOT_FORWARDED
+        ):
+            with timing.phase("import ai_sdlc.daemon"):
+                from . import daemon
+            with timing.phase("daemon round trip"):
+                code = daemon.forward(argv)
+            if code is not None:
+                sys.exit(code)
+        if profile_file:
+            timing.profile(lambda: run(argv), profile_file)
+        else:
+            run(argv)
+    finally:
+        if report:
+            timing.report()
+        if trace_file:
+            try:
+                timing.write_trace(trace_file, ["aisdlc", *argv])
+                print(f"Trace written to {trace_file}", file=sys.stderr)
+            except OSError as e:
+                print(f"Could not write trace '{trace_file}': {e}", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -5,8 +5,18 @@ Each command module provides a `run_*` function that handles the command logic.
 
 Available commands:
     - init: Initialize a new AI-SDLC project
-    - new: Create a new feature workstream
+    - new: Create a new feature workstream, or one per idea in a backlog file
     - next: Advance to the next step in the workflow
     - status: Display current workstream status
     - done: Archive a completed workstream
+    - serve: Run the resident daemon that answers CLI commands
+    - gc: Reclaim unreferenced blobs from the content-addressed store
+    - show: Print one step of an active or archived workstream
+    - archive: Compact archived workstreams into compressed containers
+    - search: Full-text search over active and archived step files
+    - watch: Advance workstreams automatically when step files are saved
+    - run: Execute the next step's prompt with the configured LLM
+    - batch: Export prompts for a provider batch API and import its results
+    - stats: Summarise cycle time, throughput and prompt size from the event history
+    - upgrade-prompts: Update unmodified prompt templates to the packaged versions
 """
@@ -0,0 +1,83 @@
+"""`aisdlc archive` – maintain the archived workstreams in the done directory."""
+
+from __future__ import annotations
+
+import shutil
+import sys
+
+from ai_sdlc import archive, search
+from ai_sdlc.utils import DEFAULT_DONE_DIR, get_root, load_config, pop_flag
+
+
+def run_archive(args: list[str] | None = None) -> None:
+    """Convert archived workstream directories into compressed archives.
+
+    Every ``<done_dir>/<slug>/`` directory is packed into ``<slug>.zip`` and
+    removed, and the archive index is brought up to date.  Existing archives
+    are left as they are.
+
+    Args:
+        args: `--compact` (required) and optional `--dry-run` to only list
+            what would be converted.
+
+    Raises:
+        SystemExit: If no action is given or a workstream cannot be converted.
+    """
+    args = list(args or [])
+    do_compact = pop_flag(args, "--compact")
+    dry_run = pop_flag(args, "--dry-run")
+    if not do_compact or args:
+        print("Usage: aisdlc archive --compact [--dry-run]")
+        sys.exit(1)
+
+    conf = load_config()
+    done = get_root() / conf.get("done_dir", DEFAULT_DONE_DIR)
+    if not done.is_dir():
+        print(f"ℹ️  Nothing to compact: {done.name}/ does not exist.")
+        return
+
+    index = archive.load_index(done)
+    entries = {}
+    converted = failed = 0
+    before_total = after_total = 0
+    for path in sorted(done.iterdir()):
+        if path.name.startswith("."):
+            continue
+        if path.is_file() and path.suffix == ".zip" and path.stem not in index:
+            entries[path.stem] = archive.index_entry(done, path.stem)  # Not indexed yet
+            continue
+        if not path.is_dir():
+            continue
+        slug = path.name
+        if dry_run:
+            print(f"  would pack {slug}/ -> {archive.archive_path(done, slug).name}")
+            continue
+        try:
+            before = sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+            entries[slug] = archive.pack(path, done, slug)
+            shutil.rmtree(path)
+        except OSError as e:
+            print(f"❌  {slug}: {e}")
+            failed += 1
+            continue
+        after = int(entries[slug]["size"])
+        converted += 1
+        before_total += before
+        after_total += after
+        print(f"📦  {slug}: {before:,} → {after:,} bytes")
+
+    if entries and not dry_run:
+        archive.update_index(done, entries)
+        search.refresh(
+            conf,
+            [archive.archive_path(done, slug) for slug in entries],
+            gone=[done / slug for slug in entries],
+        )
+    if not dry_run:
+        print(
+            f"\n✅  Packed {converted} workstream(s) in {done.name}/: "
+            f"{before_total:,} → {after_total:,} bytes"
+        )
+    if failed:
+        print(f"❌  {failed} workstream(s) could not be compacted.")
+        sys.exit(1)
@@ -0,0 +1,404 @@
+"""`aisdlc batch` – run next-step prompts through a provider's batch API.
+
+``aisdlc batch export`` renders the next prompt of every workstream waiting
+for a step into one JSONL request file in the OpenAI batch format::
+
+    {"custom_id": "<slug>::<step>", "method": "POST",
+     "url": "/v1/chat/completions", "body": {"model": ..., "messages": [...]}}
+
+Upload it to the provider's batch endpoint, and once the batch has finished,
+``aisdlc batch import <results.jsonl>`` writes every answer into its
+``<step>-<slug>.md`` file and advances all matching workstreams in a single
+state transaction.  The custom ID only depends on the workstream and step, so
+re-exporting is idempotent and results that no longer match a workstream's
+position are reported as stale instead of being written.  In a DAG lifecycle
+(see `ai_sdlc.graph`) every ready step of a workstream gets its own request.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ai_sdlc import events, llm, search
+from ai_sdlc.commands.next import (
+    Frontier,
+    StepError,
+    StepFiles,
+    advance,
+    derive_current_step,
+    generate_prompt,
+    plan_frontier,
+    plan_step,
+    step_dependencies,
+)
+from ai_sdlc.state import StateBackend, get_backend
+from ai_sdlc.utils import (
+    CONFIG_FILE,
+    DEFAULT_ACTIVE_DIR,
+    atomic_write_text,
+    get_root,
+    load_config,
+    pop_option,
+)
+
+_USAGE = "Usage: aisdlc batch export [--out FILE] | aisdlc batch import RESULTS"
+
+# Request file written by `batch export` when no --out is given
+DEFAULT_REQUESTS_FILE = "aisdlc-batch.jsonl"
+
+# Endpoint every batch request targets
+BATCH_URL = "/v1/chat/completions"
+
+_ID_SEP = "::"
+
+
+def custom_id(slug: str, step: str) -> str:
+    """Return the batch request ID of *step* of workstream *slug*."""
+    return f"{slug}{_ID_SEP}{step}"
+
+
+def parse_custom_id(value: object) -> tuple[str, str] | None:
+    """Return ``(slug, step)`` encoded in a request ID, or None if it is not ours."""
+    if not isinstance(value, str) or value.count(_ID_SEP) != 1:
+        return None
+    slug, step = value.split(_ID_SEP)
+    return (slug, step) if slug and step else None
+
+
+@dataclass
+class _Row:
+    slug: str
+    step: str
+    result: str
+    files: StepFiles | None = None
+    tracked: bool = False
+
+
+def _workstreams(
+    conf: dict[str, Any], backend: StateBackend
+) -> dict[str, tuple[str | None, bool]]:
+    """Return the current step of every active workstream and whether it is tracked.
+
+    Raises:
+        OSError: If the active directory cannot be listed.
+    """
+    active = get_root() / conf.get("active_dir", DEFAULT_ACTIVE_DIR)
+    result: dict[str, tuple[str | None, bool]] = {}
+    for slug in sorted(e.name for e in os.scandir(active) if e.is_dir()):
+        current = backend.get(slug).get("current")
+        if current is not None:
+            result[slug] = (current, True)
+        else:
+            result[slug] = (
+                derive_current_step(active / slug, slug, conf["steps"]),
+                False,
+            )
+    return result
+
+
+def _render(
+    conf: dict[str, Any], slug: str, current: str | None
+) -> tuple[_Row, str | None]:
+    """Render the next prompt of one workstream (runs on a worker thread)."""
+    if current is None:
+        return _Row(slug, "—", "❌ no step files found"), None
+    try:
+        files = plan_step(conf, slug, current)
+        if files is None:
+            return _Row(slug, current, "🎉 all steps complete"), None
+        if files.next_file.exists():
+            return _Row(
+                slug, files.next_step, "⏭️ output exists; run `aisdlc next`"
+            ), None
+        generate_prompt(files)
+        prompt = files.prompt_output_file.read_text(encoding="utf-8")
+    except StepError as e:
+        return _Row(slug, current, e.lines[0].strip()), None
+    except OSError as e:
+        return _Row(slug, current, f"❌ {e}"), None
+    return _Row(slug, files.next_step, "📤 exported", files), prompt
+
+
+def _render_graph(
+    conf: dict[str, Any], deps: dict[str, list[str]], slug: str
+) -> list[tuple[_Row, str | None]]:
+    """Render the prompt of every ready step of one DAG workstream (on a worker thread)."""
+    steps = conf["steps"]
+    try:
+        frontier = plan_frontier(conf, deps, slug)
+    except StepError as e:
+        return [(_Row(slug, "—", e.lines[0].strip()), None)]
+    if frontier.complete:
+        return [(_Row(slug, steps[-1], "🎉 all steps complete"), None)]
+    rendered: list[tuple[_Row, str | None]] = [
+        (_Row(slug, f.next_step, "⏭️ output exists; run `aisdlc next`"), None)
+        for f in frontier.finished
+    ]
+    if not frontier.ready and not frontier.finished:
+        rendered.append((_Row(slug, "—", "❌ no step files found"), None))
+    for files in frontier.ready:
+        try:
+            generate_prompt(files)
+            prompt = files.prompt_output_file.read_text(encoding="utf-8")
+        except StepError as e:
+            rendered.append((_Row(slug, files.next_step, e.lines[0].strip()), None))
+            continue
+        except OSError as e:
+            rendered.append((_Row(slug, files.next_step, f"❌ {e}"), None))
+            continue
+        rendered.append((_Row(slug, files.next_step, "📤 exported", files), prompt))
+    return rendered
+
+
+def export_requests(
+    conf: dict[str, Any], backend: StateBackend, settings: llm.Settings, out: Path
+) -> list[_Row]:
+    """Write a batch request for every workstream waiting for its next step.
+
+    Returns:
+        list[_Row]: What happened to each workstream.
+
+    Raises:
+        OSError: If the active directory cannot be listed or *out* cannot be written.
+        StepError: If the step dependencies are invalid.
+    """
+    deps = step_dependencies(conf)
+    jobs = [
+        (slug, current) for slug, (current, _) in _workstreams(conf, backend).items()
+    ]
+
+    def job(slug: str, current: str | None) -> list[tuple[_Row, str | None]]:
+        if deps is not None:
+            return _render_graph(conf, deps, slug)
+        return [_render(conf, slug, current)]
+
+    with ThreadPoolExecutor() as pool:
+        rendered = [
+            pair for pairs in pool.map(lambda j: job(*j), jobs) for pair in pairs
+        ]
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id(row.slug, row.step),
+                "method": "POST",
+                "url": BATCH_URL,
+                "body": llm.chat_body(settings, prompt),
+            }
+        )
+        + "\n"
+        for row, prompt in rendered
+        if prompt is not None
+    ]
+    if lines:
+        atomic_write_text(out, "".join(lines), durable=False)
+    return [row for row, _ in rendered]
+
+
+def _answer(record: dict[str, Any]) -> str:
+    """Return the completion text of one batch result.
+
+    Raises:
+        ValueError: If the request failed or the result is malformed.
+    """
+    error = record.get("error")
+    response = record.get("response") or {}
+    status = response.get("status_code")
+    if error or status != 200:
+        detail = error or (response.get("body") or {}).get("error") or f"HTTP {status}"
+        if isinstance(detail, dict):
+            detail = detail.get("message", detail)
+        raise ValueError(str(detail))
+    try:
+        content = response["body"]["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        raise ValueError("no completion in result") from None
+    if not isinstance(content, str):
+        raise ValueError("no completion in result")
+    return content
+
+
+def import_results(
+    conf: dict[str, Any], backend: StateBackend, lines: list[str]
+) -> list[_Row]:
+    """Write the answers of a batch results file and advance their workstreams.
+
+    A result is written only if its workstream is still waiting for that
+    step and the step file does not exist yet.  All tracked workstreams are
+    advanced in one state transaction afterwards.
+
+    Returns:
+        list[_Row]: What happened to each result.
+
+    Raises:
+        OSError: If the active directory cannot be listed.
+        StepError: If the step dependencies are invalid.
+    """
+    streams = _workstreams(conf, backend)
+    deps = step_dependencies(conf)
+    frontiers: dict[str, Frontier] = {}
+    rows: list[_Row] = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("not an object")
+        except ValueError:
+            rows.append(_Row(f"(line {number})", "—", "❌ malformed result"))
+            continue
+        ident = parse_custom_id(record.get("custom_id"))
+        if ident is None:
+            rows.append(_Row(f"(line {number})", "—", "❌ unknown custom_id"))
+            continue
+        slug, step = ident
+        try:
+            text = _answer(record)
+        except ValueError as e:
+            rows.append(_Row(slug, step, f"❌ request failed: {e}"))
+            continue
+        current, tracked = streams.get(slug, (None, False))
+        try:
+            if deps is not None and slug in streams:
+                if slug not in frontiers:
+                    frontiers[slug] = plan_frontier(conf, deps, slug)
+                frontier = frontiers[slug]
+                files = next((f for f in frontier.ready if f.next_step == step), None)
+                if files is None and step in frontier.done:
+                    rows.append(_Row(slug, step, "⏭️ output already exists"))
+                    continue
+            else:
+                files = plan_step(conf, slug, current) if current is not None else None
+        except StepError as e:
+            rows.append(_Row(slug, step, e.lines[0].strip()))
+            continue
+        if files is None or files.next_step != step:
+            where = f"at {current}" if current is not None else "not active"
+            if deps is not None and slug in streams:
+                where = "not waiting for it"
+            rows.append(_Row(slug, step, f"ℹ️ stale: workstream is {where}"))
+            continue
+        if files.next_file.exists():
+            rows.append(_Row(slug, step, "⏭️ output already exists"))
+            continue
+        try:
+            atomic_write_text(files.next_file, text)
+        except OSError as e:
+            rows.append(_Row(slug, step, f"❌ {e}"))
+            continue
+        rows.append(_Row(slug, step, "✅ written", files, tracked))
+
+    written = [r for r in rows if r.files is not None]
+    if written:
+        with backend.transaction():
+            for row in written:
+                assert row.files is not None
+                if row.tracked:
+                    moved_to = advance(backend, row.files)
+                    if moved_to is not None:
+                        row.result = f"ℹ️ written, changed concurrently ({moved_to})"
+                        continue
+                    row.result = "✅ advanced"
+                else:
+                    events.step_completed(row.files.next_file, row.step)
+                row.files.prompt_output_file.unlink(missing_ok=True)
+        search.refresh(conf, [r.files.next_file.parent for r in written if r.files])
+    return rows
+
+
+def _print_rows(rows: list[_Row]) -> None:
+    print(f"{'Workstream':28} {'Step':20} Result")
+    print(f"{'-' * 28} {'-' * 20} {'-' * 30}")
+    for r in rows:
+        print(f"{r.slug:28} {r.step:20} {r.result}")
+    counts: dict[str, int] = {}
+    for r in rows:
+        key = r.result.split(" ", 1)[0]
+        counts[key] = counts.get(key, 0) + 1
+    print(f"\n{len(rows)} entries: " + ", ".join(f"{k} {v}" for k, v in counts.items()))
+
+
+def run_batch(args: list[str] | None = None) -> None:
+    """Export next-step prompts as a batch request file, or import its results.
+
+    Args:
+        args: `export [--out FILE]` to write the requests (default
+            `aisdlc-batch.jsonl` in the project root), or `import RESULTS`
+            to ingest the provider's results file.
+
+    Raises:
+        SystemExit: If the arguments, the configuration or a file is invalid.
+    """
+    args = list(args or [])
+    try:
+        out = pop_option(args, "--out")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    action = args.pop(0) if args else None
+    if action == "export" and not args:
+        _export(Path(out) if out else None)
+    elif action == "import" and len(args) == 1 and out is None:
+        _import(Path(args[0]))
+    else:
+        print(_USAGE)
+        sys.exit(1)
+
+
+def _export(out: Path | None) -> None:
+    conf = load_config()
+    try:
+        settings = llm.settings(conf)
+    except (ValueError, TypeError) as e:
+        print(f"❌ Error: Invalid configuration in {CONFIG_FILE}: {e}")
+        sys.exit(1)
+    out = out or get_root() / DEFAULT_REQUESTS_FILE
+    try:
+        with get_backend(conf) as backend:
+            rows = export_requests(conf, backend, settings, out)
+    except OSError as e:
+        print(f"❌  Error: {e}")
+        sys.exit(1)
+    except StepError as e:
+        print("\n".join(e.lines))
+        sys.exit(1)
+    if not rows:
+        print("none – no workstreams to export")
+        return
+    _print_rows(rows)
+    exported = sum(r.result.startswith("📤") for r in rows)
+    if exported:
+        print(f"📦  Wrote {exported} request(s) for {settings.model} to {out}")
+        print(
+            "    Submit it to the batch API, then run `aisdlc batch import <results>`."
+        )
+    else:
+        print("ℹ️  No workstream is waiting for a step; nothing was written.")
+
+
+def _import(results: Path) -> None:
+    conf = load_config()
+    try:
+        lines = results.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        print(f"❌  Error: Could not read '{results}': {e}")
+        sys.exit(1)
+    try:
+        with get_backend(conf) as backend:
+            rows = import_results(conf, backend, lines)
+    except OSError as e:
+        print(f"❌  Error: {e}")
+        sys.exit(1)
+    except StepError as e:
+        print("\n".join(e.lines))
+        sys.exit(1)
+    if not rows:
+        print(f"none – no results in {results}")
+        return
+    _print_rows(rows)
@@ -3,29 +3,42 @@
 import shutil
 import sys
 
+from ai_sdlc import archive, blobs, events, graph, search, timing
+from ai_sdlc.state import get_backend
 from ai_sdlc.utils import (
     DEFAULT_ACTIVE_DIR,
     DEFAULT_DONE_DIR,
-    ROOT,
+    get_root,
     load_config,
-    read_lock,
-    write_lock,
+    pop_option,
 )
 
 
-def run_done() -> None:
+def run_done(args: list[str] | None = None) -> None:
     """Validate that all steps are complete and archive the workstream.
 
+    Args:
+        args: Optional `--slug SLUG` selecting the workstream (defaults to the
+            selected one).
+
     Checks that:
     - An active workstream exists
-    - The current step is the last step
+    - The current step is the last step (every leaf step, for a DAG lifecycle)
     - All step files exist
 
-    Then moves the workstream from doing/ to done/ and clears the lock file.
+    Then moves the workstream from doing/ to done/ (or packs it into
+    done/<slug>.zip with ``archive_format = "zip"``) and clears the lock file.
 
     Raises:
         SystemExit: If validation fails or archiving encounters an error.
     """
+    args = list(args or [])
+    try:
+        wanted = pop_option(args, "--slug")
+    except ValueError as e:
+        print(f"❌  {e}. Usage: aisdlc done [--slug SLUG]")
+        sys.exit(1)
+
     conf = load_config()
     try:
         steps = conf["steps"]
@@ -36,35 +49,100 @@ def run_done() -> None:
     
     active_dir = conf.get("active_dir", DEFAULT_ACTIVE_DIR)
     done_dir = conf.get("done_dir", DEFAULT_DONE_DIR)
+    try:
+        fmt = archive.archive_format(conf)
+    except ValueError as e:
+        print(f"❌  Error: {e}")
+        sys.exit(1)
 
-    lock = read_lock()
-    if not lock:
-        print("❌  No active workstream.")
-        return
+    with get_backend(conf) as backend:
+        lock = backend.get(wanted)
+        if not lock:
+            print(
+                f"❌  No active workstream '{wanted}'."
+                if wanted
+                else "❌  No active workstream."
+            )
+            return
 
-    try:
-        slug = lock["slug"]
-        current_step = lock["current"]
-    except KeyError as e:
-        print(f"❌  Error: Lock file missing required key: {e}")
-        print("   Please run `aisdlc new` to create a new workstream.")
-        return
+        try:
+            slug = lock["slug"]
+            current_step = lock["current"]
+        except KeyError as e:
+            print(f"❌  Error: Lock file missing required key: {e}")
+            print("   Please run `aisdlc new` to create a new workstream.")
+            return
 
-    if current_step != steps[-1]:
-        print("❌  Workstream not finished yet. Complete all steps before archiving.")
-        return
+        root = get_root()
+        workdir = root / active_dir / slug
+        try:
+            deps = graph.dependencies(conf)
+        except ValueError as e:
+            print(f"❌  Error: Invalid step dependencies: {e}")
+            sys.exit(1)
+        if deps is not None:
+            # Branches finish in any order: every leaf step must be written
+            done_steps = graph.completed(workdir, slug, steps)
+            waiting = [s for s in graph.leaves(deps, steps) if s not in done_steps]
+            if waiting:
+                print(
+                    f"❌  Workstream not finished yet. Waiting for: {', '.join(waiting)}"
+                )
+                return
+        elif current_step != steps[-1]:
+            print(
+                "❌  Workstream not finished yet. Complete all steps before archiving."
+            )
+            return
 
-    workdir = ROOT / active_dir / slug
-    missing = [s for s in steps if not (workdir / f"{s}-{slug}.md").exists()]
-    if missing:
-        print("❌  Missing files:", ", ".join(missing))
-        return
+        missing = [s for s in steps if not (workdir / f"{s}-{slug}.md").exists()]
+        if missing:
+            print("❌  Missing files:", ", ".join(missing))
+            return
 
-    dest = ROOT / done_dir / slug
-    try:
-        shutil.move(str(workdir), str(dest))
-        write_lock({})
-        print(f"🎉  Archived to {dest}")
-    except OSError as e:
-        print(f"❌  Error archiving work-stream '{slug}': {e}")
-        sys.exit(1)
+        done = root / done_dir
+        dest = archive.archive_path(done, slug) if fmt == "zip" else done / slug
+        try:
+            with backend.transaction():
+                if backend.get(slug).get("current") != current_step:
+                    print(
+                        f"❌  Workstream '{slug}' changed concurrently; not archiving."
+                    )
+                    return
+                with timing.phase("archive move", format=fmt) as span:
+                    if timing.enabled():
+                        span["bytes"] = sum(
+                            f.stat().st_size for f in workdir.rglob("*") if f.is_file()
+                        )
+                    if fmt == "zip":
+                        # The event goes in the archive: taken back if packing fails
+                        with events.provisional(workdir, "archived"):
+                            entry = archive.pack(workdir, done, slug)
+                        archive.update_index(done, {slug: entry})
+                    else:
+                        shutil.move(str(workdir), str(dest))
+                        events.record(dest, "archived")
+                backend.remove(slug)
+            print(f"🎉  Archived to {dest}")
+        except OSError as e:
+            print(f"❌  Error archiving work-stream '{slug}': {e}")
+            sys.exit(1)
+    if fmt == "zip":
+        # The archive and the state are already committed: only warn
+        try:
+            shutil.rmtree(workdir)
+        except OSError as e:
+            print(f"⚠️  Could not remove {workdir} after archiving it: {e}")
+            print("   It is no longer tracked; delete it by hand.")
+    search.refresh(conf, [dest], gone=[workdir])
+
+    if fmt == "dir" and blobs.enabled(conf):
+        try:
+            linked, skipped = blobs.store_tree(dest)
+        except OSError as e:
+            print(f"⚠️  Could not deduplicate archived files: {e}")
+            return
+        note = (
+            f" ({skipped} not linked: filesystem has no hardlinks)" if skipped else ""
+        )
+        print(f"🔗  Linked {linked} archived file(s) into the blob store{note}")
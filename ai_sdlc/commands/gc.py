@@ -0,0 +1,42 @@
+"""`aisdlc gc` – reclaim unreferenced blobs from the content-addressed store."""
+
+from __future__ import annotations
+
+import sys
+
+from ai_sdlc import blobs
+from ai_sdlc.utils import format_size, get_root, pop_flag
+
+
+def run_gc(args: list[str] | None = None) -> None:
+    """Remove blobs that no workstream file links to any more.
+
+    Blobs are added by `aisdlc next` and `aisdlc done` when ``blob_store = true``
+    is set in `.aisdlc`; see `ai_sdlc.blobs`.
+
+    Args:
+        args: Optional `--dry-run` to only report what would be removed.
+
+    Raises:
+        SystemExit: If the object directory cannot be read.
+    """
+    args = list(args or [])
+    dry_run = pop_flag(args, "--dry-run")
+    if args:
+        print("Usage: aisdlc gc [--dry-run]")
+        sys.exit(1)
+
+    objects = blobs.objects_dir()
+    try:
+        result = blobs.gc(objects, dry_run=dry_run)
+    except OSError as e:
+        print(f"❌  Error: Could not clean '{objects}': {e}")
+        sys.exit(1)
+
+    rel = objects.relative_to(get_root())
+    verb = "Would remove" if dry_run else "Removed"
+    print(
+        f"🧹  {verb} {result.removed} unreferenced blob(s), "
+        f"{format_size(result.reclaimed_bytes)} from {rel}/"
+    )
+    print(f"    {result.kept} blob(s) still in use ({format_size(result.kept_bytes)})")
@@ -4,9 +4,18 @@
 import importlib.resources as pkg_resources
 import json
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from ai_sdlc.utils import CONFIG_FILE, DEFAULT_ACTIVE_DIR, DEFAULT_DONE_DIR, DEFAULT_PROMPT_DIR, LOCK_FILE
+from ai_sdlc.utils import (
+    CONFIG_FILE,
+    DEFAULT_ACTIVE_DIR,
+    DEFAULT_DONE_DIR,
+    DEFAULT_PROMPT_DIR,
+    LOCK_FILE,
+    pop_flag,
+    pop_option,
+)
 
 ASCII_ART = """
    █████╗ ██╗███████╗██╗  ██╗ ██████╗██╗
@@ -80,17 +89,50 @@ PROMPT_FILE_NAMES = [
 ]
 
 
-def run_init() -> None:
-    """Scaffold AI-SDLC project: .aisdlc, prompts/, doing/, done/, .aisdlc.lock and print instructions."""
-    print("Initializing AI-SDLC project...")
+_USAGE = (
+    "Usage: aisdlc init [--link hardlink|symlink] [--recursive DIR... [--workers N]]"
+)
+
+
+@dataclass(frozen=True)
+class Scaffold:
+    """The packaged config and prompt templates, read once per process."""
+
+    config: str
+    #: Prompt file name -> text, or None if the package lacks it
+    prompts: dict[str, str | None]
 
-    # Use current working directory for init (since .aisdlc doesn't exist yet)
-    init_root = Path.cwd()
 
+@dataclass
+class InitResult:
+    """What `init_project` did in one directory."""
+
+    root: Path
+    config_created: bool = False
+    #: Prompt file name -> how it was created (copy, hardlink or symlink)
+    prompts: dict[str, str] = field(default_factory=dict)
+    missing: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    lock_created: bool = False
+    fatal: str | None = None
+
+
+def load_scaffold() -> Scaffold:
+    """Read the packaged templates, exiting with a hint if the install is broken."""
     try:
         scaffold_dir = pkg_resources.files("ai_sdlc").joinpath("scaffold_template")
-        default_config_content = scaffold_dir.joinpath(CONFIG_FILE).read_text(encoding="utf-8")
+        default_config_content = scaffold_dir.joinpath(CONFIG_FILE).read_text(
+            encoding="utf-8"
+        )
         prompt_files_source_dir = scaffold_dir.joinpath(DEFAULT_PROMPT_DIR)
+        prompts: dict[str, str | None] = {}
+        for fname in PROMPT_FILE_NAMES:
+            try:
+                prompts[fname] = prompt_files_source_dir.joinpath(fname).read_text(
+                    encoding="utf-8"
+                )
+            except FileNotFoundError:
+                prompts[fname] = None
     except Exception as e:
         print(
             f"❌ Critical Error: Could not load scaffold templates from the ai-sdlc package: {e}"
@@ -103,53 +145,183 @@ def run_init() -> None:
             "   If the issue persists, please report it on the project's issue tracker."
         )
         sys.exit(1)
+    return Scaffold(default_config_content, prompts)
+
+
+def shared_templates(scaffold: Scaffold) -> Path:
+    """Return the user-level cache of *scaffold*'s prompts; exit if unwritable."""
+    from ai_sdlc import template_cache
+
+    try:
+        packaged = {k: v for k, v in scaffold.prompts.items() if v is not None}
+        return template_cache.ensure(packaged)
+    except OSError as e:
+        print(f"❌ Error preparing the shared template cache: {e}")
+        print(
+            f"   Set {template_cache.CACHE_ENV} to a writable directory or drop --link."
+        )
+        sys.exit(1)
+
+
+def init_project(
+    root: Path,
+    scaffold: Scaffold,
+    *,
+    shared: Path | None = None,
+    link: str = "hardlink",
+    reset_lock: bool = True,
+) -> InitResult:
+    """Scaffold *root* without printing anything.
+
+    Existing config and prompt files are left alone.
+
+    Args:
+        root: The project directory, which must exist.
+        scaffold: The packaged templates.
+        shared: Directory of the shared template cache; prompts are then
+            linked to it (*link* is ``"hardlink"`` or ``"symlink"``) instead
+            of copied.
+        reset_lock: Whether to overwrite an existing lock file with an empty one.
+
+    Returns:
+        InitResult: What was created; ``fatal`` is set if the directories,
+        config or lock file could not be written.
+    """
+    from ai_sdlc import prompt_baseline, template_cache
+
+    prompts_target_dir = root / DEFAULT_PROMPT_DIR
+    result = InitResult(root)
+    try:
+        prompts_target_dir.mkdir(exist_ok=True)
+        (root / DEFAULT_ACTIVE_DIR).mkdir(exist_ok=True)
+        (root / DEFAULT_DONE_DIR).mkdir(exist_ok=True)
+    except OSError as e:
+        result.fatal = f"Error creating directories in {root}: {e}"
+        return result
+
+    config_target_path = root / CONFIG_FILE
+    if not config_target_path.exists():
+        try:
+            config_target_path.write_text(scaffold.config, encoding="utf-8")
+            result.config_created = True
+        except OSError as e:
+            result.fatal = f"Error writing config file {config_target_path}: {e}"
+            return result
+
+    for fname in PROMPT_FILE_NAMES:
+        target_file = prompts_target_dir / fname
+        if target_file.exists():
+            continue
+        content = scaffold.prompts.get(fname)
+        if content is None:
+            result.missing.append(fname)
+            continue
+        try:
+            if shared is not None:
+                result.prompts[fname] = template_cache.install(
+                    shared / fname, target_file, link
+                )
+            else:
+                target_file.write_text(content, encoding="utf-8")
+                result.prompts[fname] = "copy"
+        except OSError as e:
+            result.errors.append(f"Error creating prompt '{fname}': {e}")
+    # Remember what was installed so `aisdlc upgrade-prompts` can tell edits from releases
+    prompt_baseline.record(prompts_target_dir, list(result.prompts))
+
+    lock_file_path = root / LOCK_FILE
+    if reset_lock or not lock_file_path.exists():
+        try:
+            lock_file_path.write_text(json.dumps({}), encoding="utf-8")
+            result.lock_created = True
+        except OSError as e:
+            result.fatal = f"Error writing lock file: {e}"
+    return result
+
+
+def run_init(args: list[str] | None = None) -> None:
+    """Scaffold AI-SDLC project: .aisdlc, prompts/, doing/, done/, .aisdlc.lock and print instructions.
+
+    Args:
+        args: Optional `--link hardlink|symlink` to link the prompts to one
+            shared, versioned copy of the packaged templates instead of
+            copying them, and `--recursive DIR... [--workers N]` to
+            initialise many directories in parallel with a summary report.
+
+    Raises:
+        SystemExit: If the arguments are invalid or initialisation fails.
+    """
+    args = list(args or [])
+    try:
+        link = pop_option(args, "--link")
+        if link is not None and link not in ("hardlink", "symlink"):
+            raise ValueError(f"--link must be hardlink or symlink, not '{link}'")
+        workers = pop_option(args, "--workers")
+        max_workers = int(workers) if workers else None
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("--workers must be at least 1")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    recursive = pop_flag(args, "--recursive")
+    if recursive and not args:
+        print(f"❌  --recursive needs at least one directory. {_USAGE}")
+        sys.exit(1)
+    if args and not recursive:
+        print(f"❌  Unexpected arguments: {' '.join(args)}. {_USAGE}")
+        sys.exit(1)
+
+    if recursive:
+        scaffold = load_scaffold()
+        shared = shared_templates(scaffold) if link else None
+        _run_recursive([Path(d) for d in args], scaffold, shared, link, max_workers)
+        return
+
+    print("Initializing AI-SDLC project...")
+
+    # Use current working directory for init (since .aisdlc doesn't exist yet)
+    init_root = Path.cwd()
+    scaffold = load_scaffold()
+    shared = shared_templates(scaffold) if link else None
+    result = init_project(init_root, scaffold, shared=shared, link=link or "hardlink")
+    if result.fatal is not None:
+        print(f"❌ {result.fatal}")
+        sys.exit(1)
 
-    # Create directories
     prompts_target_dir = init_root / DEFAULT_PROMPT_DIR
-    prompts_target_dir.mkdir(exist_ok=True)
-    (init_root / DEFAULT_ACTIVE_DIR).mkdir(exist_ok=True)
-    (init_root / DEFAULT_DONE_DIR).mkdir(exist_ok=True)
     print(
         f"📂 Created/ensured directories: {prompts_target_dir.relative_to(Path.cwd())}, {DEFAULT_ACTIVE_DIR}/, {DEFAULT_DONE_DIR}/"
     )
 
-    # Write .aisdlc config file
     config_target_path = init_root / CONFIG_FILE
-    if not config_target_path.exists():
-        try:
-            config_target_path.write_text(default_config_content, encoding="utf-8")
-            print(
-                f"📄 Created default config: {config_target_path.relative_to(Path.cwd())}"
-            )
-        except OSError as e:
-            print(f"❌ Error writing config file {config_target_path}: {e}")
-            sys.exit(1)
+    if result.config_created:
+        print(
+            f"📄 Created default config: {config_target_path.relative_to(Path.cwd())}"
+        )
     else:
         print(
             f"📄 Config file {config_target_path.relative_to(Path.cwd())} already exists, skipping creation."
         )
 
-    # Copy prompt templates
     print("✨ Setting up prompt templates...")
-    all_prompts_exist = True
-    for fname in PROMPT_FILE_NAMES:
-        target_file = prompts_target_dir / fname
-        if not target_file.exists():
-            try:
-                content = prompt_files_source_dir.joinpath(fname).read_text(encoding="utf-8")
-                target_file.write_text(content, encoding="utf-8")
-                print(f"  - Created prompt: {target_file.relative_to(Path.cwd())}")
-            except FileNotFoundError:
-                print(
-                    f"  ⚠️ Warning: Packaged prompt template for '{fname}' not found within ai-sdlc package. Please create it manually in '{prompts_target_dir}'."
-                )
-                all_prompts_exist = False
-            except OSError as e:
-                print(f"  ❌ Error creating prompt '{fname}': {e}")
-                all_prompts_exist = False
-        # Existing files are silently skipped to avoid noise
-    if all_prompts_exist and all(
-        (prompts_target_dir / fname).exists() for fname in PROMPT_FILE_NAMES
+    for fname, how in result.prompts.items():
+        note = "" if how == "copy" else f" ({how})"
+        print(
+            f"  - Created prompt: {(prompts_target_dir / fname).relative_to(Path.cwd())}{note}"
+        )
+    if shared is not None and result.prompts:
+        print(f"  🔗 Shared template copy: {shared}")
+    for fname in result.missing:
+        print(
+            f"  ⚠️ Warning: Packaged prompt template for '{fname}' not found within ai-sdlc package. Please create it manually in '{prompts_target_dir}'."
+        )
+    for error in result.errors:
+        print(f"  ❌ {error}")
+    # Existing files are silently skipped to avoid noise
+    if (
+        not result.missing
+        and not result.errors
+        and all((prompts_target_dir / fname).exists() for fname in PROMPT_FILE_NAMES)
     ):
         print(
             f"  👍 All prompt templates are set up in {prompts_target_dir.relative_to(Path.cwd())}."
@@ -159,14 +331,8 @@ def run_init() -> None:
             f"  ℹ️ Some prompt templates might be missing or could not be created. Check {prompts_target_dir.relative_to(Path.cwd())}."
         )
 
-    # Create lock file
-    try:
-        lock_file_path = init_root / LOCK_FILE
-        lock_file_path.write_text(json.dumps({}), encoding="utf-8")
-        print(f"🔒 Created empty lock file: {lock_file_path.relative_to(Path.cwd())}")
-    except OSError as e:
-        print(f"❌ Error writing lock file: {e}")
-        sys.exit(1)
+    lock_file_path = init_root / LOCK_FILE
+    print(f"🔒 Created empty lock file: {lock_file_path.relative_to(Path.cwd())}")
 
     # Print instructions
     print(ASCII_ART)
@@ -179,3 +345,66 @@ def run_init() -> None:
     print(
         f"   Run `aisdlc new \"Your first feature idea\"` from '{Path.cwd()}' to get started."
     )
+
+
+def _outcome(result: InitResult) -> str:
+    if result.fatal is not None:
+        return f"❌ {result.fatal}"
+    if result.errors or result.missing:
+        return f"⚠️ {len(result.errors) + len(result.missing)} prompt(s) not created"
+    if result.config_created:
+        return "✅ initialised"
+    if result.prompts:
+        return f"✅ added {len(result.prompts)} prompt(s)"
+    return "ℹ️ already initialised"
+
+
+def _run_recursive(
+    roots: list[Path],
+    scaffold: Scaffold,
+    shared: Path | None,
+    link: str | None,
+    max_workers: int | None,
+) -> None:
+    """Initialise every directory in *roots* on a thread pool and print a summary table.
+
+    Existing lock files are kept, so re-running over initialised projects is safe.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def one(root: Path) -> InitResult:
+        if not root.is_dir():
+            return InitResult(root, fatal="not a directory")
+        return init_project(
+            root, scaffold, shared=shared, link=link or "hardlink", reset_lock=False
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(one, roots))
+
+    width = max(28, *(len(str(r.root)) for r in results))
+    print(f"{'Directory':{width}} Result")
+    print(f"{'-' * width} {'-' * 30}")
+    for r in results:
+        print(f"{str(r.root):{width}} {_outcome(r)}")
+
+    counts: dict[str, int] = {}
+    for r in results:
+        key = _outcome(r).split(" ", 1)[0]
+        counts[key] = counts.get(key, 0) + 1
+    files: dict[str, int] = {}
+    for r in results:
+        for how in r.prompts.values():
+            files[how] = files.get(how, 0) + 1
+    print(
+        f"\n{len(results)} directories: "
+        + ", ".join(f"{k} {v}" for k, v in counts.items())
+    )
+    if files:
+        print(
+            "Prompt files: " + ", ".join(f"{v} {k}" for k, v in sorted(files.items()))
+        )
+    if shared is not None:
+        print(f"Shared templates: {shared}")
+    if any(r.fatal is not None for r in results):
+        sys.exit(1)
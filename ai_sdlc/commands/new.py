@@ -2,41 +2,70 @@
 
 from __future__ import annotations
 
+import os
 import sys
-from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
 
+from ai_sdlc import events
+from ai_sdlc.state import get_backend, now
 from ai_sdlc.utils import (
+    CONFIG_FILE,
     DEFAULT_ACTIVE_DIR,
-    ROOT,
+    DEFAULT_DONE_DIR,
+    LOCK_FILE,
+    get_root,
     load_config,
+    pop_option,
     slugify,
-    write_lock,
 )
 
+_USAGE = 'Usage: aisdlc new "Idea title" | aisdlc new --from-file FILE [--format csv|jsonl|md]'
+
+
+def idea_text(title: str, body: str = "") -> str:
+    """Return the first step file of a workstream for the idea *title*."""
+    problem = f"{body}\n\n" if body else ""
+    return f"# {title}\n\n## Problem\n\n{problem}## Solution\n\n## Rabbit Holes\n"
+
 
 def run_new(args: list[str]) -> None:
     """Create the work-stream folder and first markdown file.
 
     Args:
-        args: List of command-line arguments. The first argument should be the idea title.
+        args: List of command-line arguments. The first argument should be the
+            idea title, or `--from-file FILE` (with an optional `--format`)
+            creates a workstream per idea listed in FILE.
 
     Raises:
         SystemExit: If no arguments provided or if work-stream already exists.
     """
-    if not args:
-        print('Usage: aisdlc new "Idea title"')
+    args = list(args or [])
+    try:
+        source = pop_option(args, "--from-file")
+        fmt = pop_option(args, "--format")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    if source is not None:
+        if args:
+            print(f"❌  Unexpected arguments: {' '.join(args)}. {_USAGE}")
+            sys.exit(1)
+        _run_bulk(Path(source), fmt)
+        return
+    if not args or fmt is not None:
+        print(_USAGE)
         sys.exit(1)
 
     # Load configuration to get the first step
     config = load_config()
     first_step = config["steps"][0]
 
-    idea_text = " ".join(args)
-    slug = slugify(idea_text)
+    title = " ".join(args)
+    slug = slugify(title)
 
-    config = load_config()
     active_dir = config.get("active_dir", DEFAULT_ACTIVE_DIR)
-    workdir = ROOT / active_dir / slug
+    workdir = get_root() / active_dir / slug
     if workdir.exists():
         print(f"❌  Work-stream '{slug}' already exists.")
         sys.exit(1)
@@ -44,18 +73,20 @@ def run_new(args: list[str]) -> None:
     try:
         workdir.mkdir(parents=True, exist_ok=False)
         idea_file = workdir / f"{first_step}-{slug}.md"
-        idea_file.write_text(
-            f"# {idea_text}\n\n## Problem\n\n## Solution\n\n## Rabbit Holes\n",
-            encoding="utf-8",
-        )
+        idea_file.write_text(idea_text(title), encoding="utf-8")
 
-        write_lock(
-            {
-                "slug": slug,
-                "current": first_step,
-                "created": datetime.now(timezone.utc).isoformat(),
-            },
-        )
+        with get_backend(config) as backend, backend.transaction():
+            if not backend.multi:
+                replaced = backend.get().get("slug")
+                if replaced and replaced != slug:
+                    print(
+                        f"⚠️  Replacing active workstream '{replaced}' in {LOCK_FILE} (its files stay in {active_dir}/)."
+                    )
+                    print(
+                        f'   Set state_backend = "sqlite" in {CONFIG_FILE} to track several workstreams at once.'
+                    )
+            backend.put({"slug": slug, "current": first_step, "created": now()})
+        events.record(workdir, "entered", step=first_step)
         print(f"✅  Created {idea_file}.  Fill it out, then run `aisdlc next`.")
     except OSError as e:
         print(f"❌  Error creating work-stream files for '{slug}': {e}")
@@ -64,3 +95,123 @@ def run_new(args: list[str]) -> None:
         print(f"❌  Error: Invalid configuration - missing key: {e}")
         print("   Please ensure your .aisdlc file has a 'steps' key with at least one step.")
         sys.exit(1)
+
+
+def _names(directory: Path) -> set[str]:
+    try:
+        return set(os.listdir(directory))
+    except OSError:
+        return set()
+
+
+def _run_bulk(source: Path, fmt: str | None) -> None:
+    """Create a workstream for every idea in *source* (see `ai_sdlc.ideas`).
+
+    Slugs taken by active or archived workstreams, or earlier in the file,
+    get a numeric suffix.  All workstreams are registered in one state
+    transaction; the JSON lock tracks a single workstream, so with it only
+    the first is selected and the rest are left for `aisdlc next --all`.
+
+    Raises:
+        SystemExit: If the file cannot be read, or a workstream cannot be created
+            or registered.
+    """
+    from ai_sdlc import ideas
+
+    config = load_config()
+    try:
+        first_step = config["steps"][0]
+    except (KeyError, IndexError):
+        print("❌  Error: Invalid configuration - 'steps' must list at least one step.")
+        sys.exit(1)
+    try:
+        items = ideas.read(source, fmt)
+    except (OSError, ValueError) as e:
+        print(f"❌  Error: Could not read ideas from '{source}': {e}")
+        sys.exit(1)
+    if not items:
+        print(f"❌  No ideas found in '{source}'.")
+        sys.exit(1)
+
+    root = get_root()
+    active_dir = config.get("active_dir", DEFAULT_ACTIVE_DIR)
+    active = root / active_dir
+    done = root / config.get("done_dir", DEFAULT_DONE_DIR)
+    archived = {name.removesuffix(".zip") for name in _names(done)}
+    wanted = [slugify(idea.title) for idea in items]
+    slugs = ideas.assign_slugs(wanted, _names(active) | archived)
+
+    created: list[tuple[str, Path]] = []
+    failed = None
+    for idea, slug in zip(items, slugs, strict=True):
+        workdir = active / slug
+        try:
+            workdir.mkdir(parents=True, exist_ok=False)
+            idea_file = workdir / f"{first_step}-{slug}.md"
+            idea_file.write_text(idea_text(idea.title, idea.body), encoding="utf-8")
+        except OSError as e:
+            failed = f"❌  Error creating work-stream files for '{slug}': {e}"
+            break
+        created.append((slug, workdir))
+
+    unregistered = None
+    try:
+        _register(config, first_step, [slug for slug, _ in created])
+    except OSError as e:  # Includes TimeoutError from a busy state lock
+        unregistered = e
+    for _, workdir in created:
+        events.record(workdir, "entered", step=first_step)
+
+    for base, slug in zip(wanted[: len(created)], slugs, strict=False):
+        if base != slug:
+            print(f"ℹ️  '{base}' is taken; created '{slug}'")
+    if created:
+        print(
+            f"✅  Created {len(created)} workstream(s) in {active_dir}/ from {source}."
+        )
+    if failed:
+        print(failed)
+    if unregistered:
+        print(f"❌  Error registering the new workstreams: {unregistered}")
+        print(f"   Created but untracked: {', '.join(slug for slug, _ in created)}.")
+        print("   Advance them with `aisdlc next --all`, or rerun after removing them.")
+    if failed or unregistered:
+        sys.exit(1)
+
+
+def _register(config: dict[str, Any], first_step: str, slugs: list[str]) -> None:
+    """Record *slugs* at *first_step* in one state transaction.
+
+    The JSON lock tracks a single workstream, so it selects the first of
+    *slugs*, as `aisdlc new` would, and the others are left untracked.
+
+    Raises:
+        OSError: If the state cannot be written, including `TimeoutError` when
+            the state lock stays busy.
+    """
+    if not slugs:
+        return
+    stamp = now()
+    with get_backend(config) as backend, backend.transaction():
+        if not backend.multi:
+            replaced = backend.get().get("slug")
+            if replaced and replaced not in slugs:
+                active_dir = config.get("active_dir", DEFAULT_ACTIVE_DIR)
+                print(
+                    f"⚠️  Replacing active workstream '{replaced}' in {LOCK_FILE} "
+                    f"(its files stay in {active_dir}/)."
+                )
+            backend.put({"slug": slugs[0], "current": first_step, "created": stamp})
+            if len(slugs) > 1:
+                print(
+                    f"ℹ️  {LOCK_FILE} tracks one workstream: selected '{slugs[0]}', "
+                    f"the other {len(slugs) - 1} are untracked."
+                )
+                print(
+                    "   Advance them with `aisdlc next --all`, or set "
+                    f'state_backend = "sqlite" in {CONFIG_FILE} to track them all.'
+                )
+            return
+        # Reversed, so the first idea of the file ends up as the selected workstream
+        for slug in reversed(slugs):
+            backend.put({"slug": slug, "current": first_step, "created": stamp})
@@ -2,144 +2,640 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
+from ai_sdlc import blobs, context, events, graph, search
+from ai_sdlc.state import StateBackend, get_backend
+from ai_sdlc.templates import Slots, TemplateError, render
 from ai_sdlc.utils import (
+    CACHE_DIR,
+    CONFIG_FILE,
     DEFAULT_ACTIVE_DIR,
     DEFAULT_PROMPT_DIR,
-    ROOT,
+    get_root,
     load_config,
-    read_lock,
-    write_lock,
+    pop_flag,
+    pop_option,
 )
 
-# Placeholder string used in prompt templates to inject previous step content
+# Original placeholder for the previous step's content (see ai_sdlc.templates for all slots)
 PLACEHOLDER = "<prev_step></prev_step>"
 
 
-def run_next() -> None:
-    """Generate the next step's prompt file and advance workflow state.
+class StepError(Exception):
+    """A workstream cannot move on; ``lines`` explain why and how to fix it."""
 
-    Reads the previous step's output, merges it with the next step's prompt template,
-    and creates a prompt file for the user to use with their AI tool. If the next
-    step file already exists, automatically advances the workflow state.
+    def __init__(self, *lines: str, fatal: bool = True) -> None:
+        super().__init__(lines[0])
+        self.lines = lines
+        self.fatal = fatal
 
-    Raises:
-        SystemExit: If required files are missing or configuration is invalid.
-    """
-    conf = load_config()
-    steps = conf["steps"]
-    lock = read_lock()
 
-    if not lock:
-        print("❌  No active workstream. Run `aisdlc new` first.")
-        return
+@dataclass
+class StepFiles:
+    """Every path involved in moving one workstream from one step to the next."""
 
-    try:
-        slug = lock["slug"]
-        current_step = lock["current"]
-    except KeyError as e:
-        print(f"❌  Error: Lock file missing required key: {e}")
-        print("   Please run `aisdlc new` to create a new workstream.")
-        return
+    slug: str
+    prev_step: str
+    next_step: str
+    prev_file: Path
+    template_file: Path
+    next_file: Path
+    prompt_output_file: Path
+    steps: list[str] = field(default_factory=list)
+    #: Output file of every step up to and including ``prev_step``
+    done_files: dict[str, Path] = field(default_factory=dict)
+    #: Extra steps to include besides ``prev_step``, most important first
+    context: list[str] = field(default_factory=list)
+    max_tokens: int | None = None
+    #: Link the generated prompt into the content-addressed store
+    blob_store: bool = False
+    #: Part of a DAG lifecycle (see `ai_sdlc.graph`): the state only moves forward
+    graph: bool = False
+
+
+def plan_step(conf: dict[str, Any], slug: str, current_step: str) -> StepFiles | None:
+    """Work out the files for the step after *current_step*.
 
+    Returns:
+        StepFiles | None: The paths involved, or None if *current_step* is the last step.
+
+    Raises:
+        StepError: If *current_step* is not a configured step, or the
+            ``context``/``max_tokens`` settings are invalid.
+    """
+    steps = conf["steps"]
     try:
         idx = steps.index(current_step)
     except ValueError:
-        print(f"❌  Error: Current step '{current_step}' not found in configuration steps.")
-        print(f"   Available steps: {', '.join(steps)}")
-        return
+        raise StepError(
+            f"❌  Error: Current step '{current_step}' not found in configuration steps.",
+            f"   Available steps: {', '.join(steps)}",
+            fatal=False,
+        ) from None
 
     if idx + 1 >= len(steps):
-        print("🎉  All steps complete. Run `aisdlc done` to archive.")
-        return
+        return None
 
     prev_step = steps[idx]
     next_step = steps[idx + 1]
+    try:
+        extra = context.context_steps(conf, next_step)
+    except ValueError as e:
+        raise StepError(
+            f"❌ Error: Invalid configuration in {CONFIG_FILE}: {e}"
+        ) from None
+    return _step_files(conf, slug, prev_step, next_step, steps[: idx + 1], extra)
 
-    active_dir = conf.get("active_dir", DEFAULT_ACTIVE_DIR)
-    prompt_dir = conf.get("prompt_dir", DEFAULT_PROMPT_DIR)
 
-    workdir = ROOT / active_dir / slug
-    prev_file = workdir / f"{prev_step}-{slug}.md"
-    prompt_file = ROOT / prompt_dir / f"{next_step}.instructions.md"
-    next_file = workdir / f"{next_step}-{slug}.md"
+def _step_files(
+    conf: dict[str, Any],
+    slug: str,
+    prev_step: str,
+    next_step: str,
+    done_steps: list[str],
+    extra: list[str],
+    *,
+    graph: bool = False,
+) -> StepFiles:
+    """Return the files for generating *next_step* from *prev_step* and *extra* context."""
+    try:
+        budget = context.max_tokens(conf)
+    except ValueError as e:
+        raise StepError(
+            f"❌ Error: Invalid configuration in {CONFIG_FILE}: {e}"
+        ) from None
+    root = get_root()
+    workdir = root / conf.get("active_dir", DEFAULT_ACTIVE_DIR) / slug
+    prompt_dir = root / conf.get("prompt_dir", DEFAULT_PROMPT_DIR)
+    return StepFiles(
+        slug=slug,
+        prev_step=prev_step,
+        next_step=next_step,
+        prev_file=workdir / f"{prev_step}-{slug}.md",
+        template_file=prompt_dir / f"{next_step}.instructions.md",
+        next_file=workdir / f"{next_step}-{slug}.md",
+        prompt_output_file=workdir / f"_prompt-{next_step}.md",
+        steps=conf["steps"],
+        done_files={s: workdir / f"{s}-{slug}.md" for s in done_steps},
+        context=extra,
+        max_tokens=budget,
+        blob_store=blobs.enabled(conf),
+        graph=graph,
+    )
 
-    if not prev_file.exists():
-        print(f"❌ Error: The previous step's output file '{prev_file}' is missing.")
-        print(f"   This file is required as input to generate the '{next_step}' step.")
-        print(
-            "   Please restore this file (e.g., from version control) or ensure it was correctly generated."
-        )
-        print(
-            f"   If you need to restart the '{prev_step}', you might need to adjust '.aisdlc.lock' or re-run the command that generates '{prev_step}'."
+
+def step_dependencies(conf: dict[str, Any]) -> dict[str, list[str]] | None:
+    """Return the configured step DAG (see `ai_sdlc.graph`), or None for linear steps.
+
+    Raises:
+        StepError: If the ``depends`` table is invalid.
+    """
+    try:
+        return graph.dependencies(conf)
+    except ValueError as e:
+        raise StepError(
+            f"❌ Error: Invalid configuration in {CONFIG_FILE}: {e}"
+        ) from None
+
+
+def plan_graph_step(
+    conf: dict[str, Any],
+    deps: dict[str, list[str]],
+    slug: str,
+    step: str,
+    done: set[str],
+) -> StepFiles:
+    """Work out the files for generating *step* of a DAG lifecycle.
+
+    The last dependency fills ``<prev_step>``; the other dependencies come
+    first in the context, followed by the configured ``context`` steps that
+    *step* depends on.
+
+    Raises:
+        StepError: If the ``context``/``max_tokens`` settings are invalid.
+    """
+    steps = conf["steps"]
+    try:
+        configured = context.context_steps(conf, step)
+    except ValueError as e:
+        raise StepError(
+            f"❌ Error: Invalid configuration in {CONFIG_FILE}: {e}"
+        ) from None
+    *others, prev_step = deps[step]
+    upstream = graph.ancestors(deps, step)
+    extra = others[::-1] + [
+        s for s in configured if s in upstream and s not in deps[step]
+    ]
+    done_steps = [s for s in steps if s in done]
+    return _step_files(conf, slug, prev_step, step, done_steps, extra, graph=True)
+
+
+@dataclass
+class Frontier:
+    """Where a workstream of a DAG lifecycle stands."""
+
+    #: Steps whose output file exists
+    done: set[str]
+    #: Complete steps whose prompt is still there: finished since the last run
+    finished: list[StepFiles]
+    #: Incomplete steps whose dependencies are all complete
+    ready: list[StepFiles]
+    #: Whether every leaf step is complete
+    complete: bool
+
+
+def plan_frontier(
+    conf: dict[str, Any], deps: dict[str, list[str]], slug: str
+) -> Frontier:
+    """Inspect the step files of *slug* and plan every step that can run now.
+
+    Raises:
+        StepError: If the ``context``/``max_tokens`` settings are invalid.
+    """
+    steps = conf["steps"]
+    workdir = get_root() / conf.get("active_dir", DEFAULT_ACTIVE_DIR) / slug
+    done = graph.completed(workdir, slug, steps)
+    finished = [
+        plan_graph_step(conf, deps, slug, s, done)
+        for s in steps
+        if s in done and deps[s] and (workdir / f"_prompt-{s}.md").exists()
+    ]
+    # The first step has no inputs: `aisdlc new` creates it
+    ready = [
+        plan_graph_step(conf, deps, slug, s, done)
+        for s in graph.ready(deps, steps, done)
+        if deps[s]
+    ]
+    complete = all(s in done for s in graph.leaves(deps, steps))
+    return Frontier(done, finished, ready, complete)
+
+
+def generate_prompt(files: StepFiles) -> None:
+    """Render the next step's template with the previous steps' outputs.
+
+    See `ai_sdlc.templates` for the placeholders a template may use.
+
+    Raises:
+        StepError: If an input file is missing or a file cannot be read or written.
+    """
+    if not files.prev_file.exists():
+        raise StepError(
+            f"❌ Error: The previous step's output file '{files.prev_file}' is missing.",
+            f"   This file is required as input to generate the '{files.next_step}' step.",
+            "   Please restore this file (e.g., from version control) or ensure it was correctly generated.",
+            f"   If you need to restart the '{files.prev_step}', you might need to adjust '.aisdlc.lock' or re-run the command that generates '{files.prev_step}'.",
         )
-        sys.exit(1)
-    if not prompt_file.exists():
-        print(f"❌ Critical Error: Prompt template file '{prompt_file}' is missing.")
-        print(f"   This file is essential for generating the '{next_step}' step.")
-        print(f"   Please ensure it exists in your '{prompt_dir}/' directory.")
-        print(
-            "   You may need to restore it from version control or your initial 'aisdlc init' setup."
+    if not files.template_file.exists():
+        raise StepError(
+            f"❌ Critical Error: Prompt template file '{files.template_file}' is missing.",
+            f"   This file is essential for generating the '{files.next_step}' step.",
+            f"   Please ensure it exists in your '{files.template_file.parent.name}/' directory.",
+            "   You may need to restore it from version control or your initial 'aisdlc init' setup.",
         )
-        sys.exit(1)
 
+    slots = Slots(files.slug, files.steps, files.done_files, files.prev_step)
+    preamble = trailer = ""
     try:
-        print(f"ℹ️  Reading previous step from: {prev_file}")
-        prev_step_content = prev_file.read_text(encoding="utf-8")
-        print(f"ℹ️  Reading prompt template from: {prompt_file}")
-        prompt_template_content = prompt_file.read_text(encoding="utf-8")
+        if files.context or files.max_tokens:
+            preamble, trailer = _assemble_context(files, slots)
+        render(
+            files.template_file,
+            files.prompt_output_file,
+            slots,
+            get_root() / CACHE_DIR,
+            preamble=preamble,
+            trailer=trailer,
+        )
+    except TemplateError as e:
+        raise StepError(
+            f"❌ Error: Cannot render prompt template '{files.template_file}': {e}"
+        ) from e
     except OSError as e:
-        print(f"❌ Error: Could not read required file: {e}")
-        sys.exit(1)
+        raise StepError(
+            f"❌ Error: Could not generate prompt file '{files.prompt_output_file}': {e}"
+        ) from e
+    if files.blob_store:
+        with contextlib.suppress(OSError):  # Deduplication is best effort
+            blobs.store(files.prompt_output_file)
+    events.prompt_generated(files.prompt_output_file, files.next_step)
+
 
-    merged_prompt = prompt_template_content.replace(PLACEHOLDER, prev_step_content)
+def _assemble_context(files: StepFiles, slots: Slots) -> tuple[str, str]:
+    """Fit the configured context into the token budget.
+
+    Fills ``slots.content`` with the (possibly trimmed) sources and returns
+    the preamble holding the extra context steps and the token report.
+    """
+    ctx = context.assemble(
+        files.template_file.read_text(encoding="utf-8"),
+        (files.prev_step, files.prev_file),
+        [(step, files.done_files[step]) for step in files.context],
+        files.max_tokens,
+    )
+    slots.content = {s.step: s.text for s in ctx.sources}
+    blocks = [
+        f'<context step="{s.step}">\n{s.text.rstrip()}\n</context>\n\n'
+        for s in sorted(ctx.sources[1:], key=lambda s: files.steps.index(s.step))
+    ]
+    return "".join(blocks), "\n" + ctx.report()
+
+
+def advance(backend: StateBackend, files: StepFiles) -> str | None:
+    """Move a tracked workstream from ``prev_step`` to ``next_step``.
+
+    The state is re-read inside a transaction so a concurrent command that
+    already moved the workstream is not overwritten.  In a DAG lifecycle the
+    state moves to ``next_step`` only if it is further along than the
+    recorded step.  The step change is recorded in the workstream's event
+    history.
+
+    Returns:
+        str | None: None on success, otherwise the step (or reason) that
+        prevented the update.
+    """
+    with backend.transaction():
+        latest = backend.get(files.slug)
+        current = latest.get("current")
+        if files.graph:
+            # Branches finish in any order: keep the furthest step in `steps` order
+            if current not in files.steps:
+                return str(current or "archived or replaced")
+            if files.steps.index(files.next_step) > files.steps.index(current):
+                latest["current"] = files.next_step
+                backend.put(latest)
+        else:
+            if current != files.prev_step:
+                return str(current or "archived or replaced")
+            latest["current"] = files.next_step
+            backend.put(latest)
+    events.step_completed(files.next_file, files.next_step)
+    return None
 
-    # Create a prompt file for the user to use with their preferred AI tool
-    prompt_output_file = workdir / f"_prompt-{next_step}.md"
+
+def derive_current_step(workdir: Path, slug: str, steps: list[str]) -> str | None:
+    """Return the last step whose ``<step>-<slug>.md`` file exists in *workdir*."""
     try:
-        prompt_output_file.write_text(merged_prompt, encoding="utf-8")
-    except OSError as e:
-        print(f"❌ Error: Could not write prompt file '{prompt_output_file}': {e}")
+        present = set(os.listdir(workdir))
+    except OSError:
+        return None
+    current = None
+    for step in steps:
+        if f"{step}-{slug}.md" in present:
+            current = step
+    return current
+
+
+def run_next(args: list[str] | None = None) -> None:
+    """Generate the next step's prompt file and advance workflow state.
+
+    Reads the previous step's output, merges it with the next step's prompt template,
+    and creates a prompt file for the user to use with their AI tool. If the next
+    step file already exists, automatically advances the workflow state.
+
+    Args:
+        args: Optional `--slug SLUG` selecting the workstream (defaults to the
+            selected one), or `--all [--workers N]` to process every workstream
+            in the active directory concurrently.
+
+    Raises:
+        SystemExit: If required files are missing or configuration is invalid.
+    """
+    args = list(args or [])
+    try:
+        wanted = pop_option(args, "--slug")
+        workers = pop_option(args, "--workers")
+        all_streams = pop_flag(args, "--all")
+        max_workers = int(workers) if workers else None
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("--workers must be at least 1")
+    except ValueError as e:
+        print(f"❌  {e}. Usage: aisdlc next [--slug SLUG | --all [--workers N]]")
         sys.exit(1)
 
-    print(f"📝  Generated AI prompt file: {prompt_output_file}")
-    print(
-        f"🤖  Please use this prompt with your preferred AI tool to generate content for step '{next_step}'"
-    )
-    print(f"    Then save the AI's response to: {next_file}")
-    print()
-    print("💡  Options:")
-    print(
-        "    • Copy the prompt content and paste into any AI chat (Claude, ChatGPT, etc.)"
-    )
-    print("    • Use with Cursor: cursor agent --file " + str(prompt_output_file))
-    print("    • Use with any other AI-powered editor or CLI tool")
-    print()
-    print(
-        f"⏭️   After saving the AI response, the next step file should be: {next_file}"
-    )
-    print("    Once ready, run 'aisdlc next' again to continue to the next step.")
+    conf = load_config()
+    with get_backend(conf) as backend:
+        if all_streams:
+            _run_next_all(conf, backend, max_workers)
+            return
+
+        lock = backend.get(wanted)
+
+        if not lock:
+            if wanted:
+                print(f"❌  No active workstream '{wanted}'.")
+            else:
+                print("❌  No active workstream. Run `aisdlc new` first.")
+            return
+
+        try:
+            slug = lock["slug"]
+            current_step = lock["current"]
+        except KeyError as e:
+            print(f"❌  Error: Lock file missing required key: {e}")
+            print("   Please run `aisdlc new` to create a new workstream.")
+            return
+
+        try:
+            deps = step_dependencies(conf)
+            if deps is not None:
+                _run_next_graph(conf, backend, deps, slug)
+                return
+            files = plan_step(conf, slug, current_step)
+            if files is None:
+                print("🎉  All steps complete. Run `aisdlc done` to archive.")
+                return
+            generate_prompt(files)
+        except StepError as e:
+            print("\n".join(e.lines))
+            if e.fatal:
+                sys.exit(1)
+            return
+
+        next_file = files.next_file
+        prompt_output_file = files.prompt_output_file
+        print(f"ℹ️  Reading previous step from: {files.prev_file}")
+        print(f"ℹ️  Reading prompt template from: {files.template_file}")
+        print(f"📝  Generated AI prompt file: {prompt_output_file}")
+        print(
+            f"🤖  Please use this prompt with your preferred AI tool to generate content for step '{files.next_step}'"
+        )
+        print(f"    Then save the AI's response to: {next_file}")
+        print()
+        print("💡  Options:")
+        print(
+            "    • Copy the prompt content and paste into any AI chat (Claude, ChatGPT, etc.)"
+        )
+        print("    • Use with Cursor: cursor agent --file " + str(prompt_output_file))
+        print("    • Use with any other AI-powered editor or CLI tool")
+        print()
+        print(
+            f"⏭️   After saving the AI response, the next step file should be: {next_file}"
+        )
+        print("    Once ready, run 'aisdlc next' again to continue to the next step.")
+
+        # Check if the user has already created the next step file
+        if next_file.exists():
+            print(f"✅  Found existing file: {next_file}")
+            print("    Proceeding to update the workflow state...")
 
-    # Check if the user has already created the next step file
-    if next_file.exists():
-        print(f"✅  Found existing file: {next_file}")
-        print("    Proceeding to update the workflow state...")
+            # Update the lock to reflect the current step, unless another process
+            # moved this workstream while the prompt was being generated
+            moved_to = advance(backend, files)
+            if moved_to is not None:
+                print(
+                    f"ℹ️  Workstream '{slug}' changed concurrently ({moved_to}); not advancing."
+                )
+                return
+            print(f"✅  Advanced to step: {files.next_step}")
+            search.refresh(conf, [next_file.parent])
 
-        # Update the lock to reflect the current step
-        lock["current"] = next_step
-        write_lock(lock)
-        print(f"✅  Advanced to step: {next_step}")
+            # Clean up the prompt file since it's no longer needed
+            if prompt_output_file.exists():
+                prompt_output_file.unlink()
+                print(f"🧹  Cleaned up prompt file: {prompt_output_file}")
 
-        # Clean up the prompt file since it's no longer needed
-        if prompt_output_file.exists():
-            prompt_output_file.unlink()
-            print(f"🧹  Cleaned up prompt file: {prompt_output_file}")
+            return
+        else:
+            print(f"⏸️   Waiting for you to create: {next_file}")
+            print(
+                "    Use the generated prompt with your AI tool, then run 'aisdlc next' again."
+            )
+            return
 
+
+def settle(
+    conf: dict[str, Any],
+    backend: StateBackend,
+    finished: list[StepFiles],
+    tracked: bool = True,
+) -> list[str]:
+    """Record the DAG steps in *finished* as complete and remove their prompts.
+
+    Returns:
+        list[str]: A message per step.
+    """
+    messages = []
+    for files in finished:
+        if tracked:
+            moved_to = advance(backend, files)
+            if moved_to is not None:
+                messages.append(
+                    f"ℹ️  Workstream '{files.slug}' changed concurrently ({moved_to}); "
+                    f"not recording {files.next_step}."
+                )
+                continue
+        else:
+            events.step_completed(files.next_file, files.next_step)
+        files.prompt_output_file.unlink(missing_ok=True)
+        messages.append(f"✅  Completed step: {files.next_step}")
+    if finished:
+        search.refresh(conf, [finished[0].next_file.parent])
+    return messages
+
+
+def _run_next_graph(
+    conf: dict[str, Any], backend: StateBackend, deps: dict[str, list[str]], slug: str
+) -> None:
+    """Run `next` for a DAG lifecycle: record finished steps, prompt every ready one.
+
+    Raises:
+        StepError: If a prompt cannot be generated.
+    """
+    frontier = plan_frontier(conf, deps, slug)
+    for line in settle(conf, backend, frontier.finished):
+        print(line)
+    if frontier.complete:
+        print("🎉  All steps complete. Run `aisdlc done` to archive.")
         return
-    else:
-        print(f"⏸️   Waiting for you to create: {next_file}")
+    if not frontier.ready:
+        first = conf["steps"][0]
+        raise StepError(
+            f"❌ Error: No step can start: the output of '{first}' is missing."
+        )
+    for files in frontier.ready:
+        generate_prompt(files)
+    if len(frontier.ready) > 1:
         print(
-            "    Use the generated prompt with your AI tool, then run 'aisdlc next' again."
+            f"🔀  {len(frontier.ready)} independent steps are ready; work on them in parallel."
         )
+    for files in frontier.ready:
+        print(f"📝  Generated AI prompt file: {files.prompt_output_file}")
+        print(f"    Then save the AI's response to: {files.next_file}")
+    print("    Once saved, run 'aisdlc next' again to record them and continue.")
+
+
+@dataclass
+class _Outcome:
+    slug: str
+    step: str
+    result: str
+    files: StepFiles | None = None
+    tracked: bool = False
+    #: DAG steps finished since the last run, recorded on the main thread
+    finished: list[StepFiles] = field(default_factory=list)
+
+
+def _next_one_graph(
+    conf: dict[str, Any], deps: dict[str, list[str]], slug: str, tracked: bool
+) -> _Outcome:
+    """Generate the prompts of every ready step of one DAG workstream (on a worker thread)."""
+    try:
+        frontier = plan_frontier(conf, deps, slug)
+        step = graph.latest(conf["steps"], frontier.done) or "—"
+        if frontier.complete:
+            return _Outcome(
+                slug, step, "🎉 all steps complete", None, tracked, frontier.finished
+            )
+        if not frontier.ready:
+            return _Outcome(slug, step, "❌ no step files found")
+        for files in frontier.ready:
+            generate_prompt(files)
+    except StepError as e:
+        return _Outcome(slug, "—", e.lines[0].strip())
+    ready = ", ".join(f.next_step for f in frontier.ready)
+    return _Outcome(
+        slug, step, f"📝 prompts ready: {ready}", None, tracked, frontier.finished
+    )
+
+
+def _next_one(
+    conf: dict[str, Any], slug: str, current: str | None, tracked: bool
+) -> _Outcome:
+    """Generate the next prompt for one workstream (runs on a worker thread)."""
+    if current is None:
+        return _Outcome(slug, "—", "❌ no step files found")
+    try:
+        files = plan_step(conf, slug, current)
+        if files is None:
+            return _Outcome(slug, current, "🎉 all steps complete")
+        if files.next_file.exists():
+            # Output already saved: nothing to generate, only the state moves on
+            return _Outcome(slug, files.next_step, "advance", files, tracked)
+        generate_prompt(files)
+    except StepError as e:
+        return _Outcome(slug, current, e.lines[0].strip())
+    rel = files.prompt_output_file.relative_to(get_root())
+    return _Outcome(slug, files.next_step, f"📝 prompt ready: {rel}", files, tracked)
+
+
+def _run_next_all(
+    conf: dict[str, Any], backend: StateBackend, max_workers: int | None
+) -> None:
+    """Run `next` for every workstream directory and print a summary table."""
+    steps = conf["steps"]
+    active = get_root() / conf.get("active_dir", DEFAULT_ACTIVE_DIR)
+    try:
+        slugs = sorted(e.name for e in os.scandir(active) if e.is_dir())
+    except OSError as e:
+        print(f"❌  Error: Could not list '{active}': {e}")
+        sys.exit(1)
+    if not slugs:
+        print(f"none – no workstreams in {active.name}/")
         return
+
+    # Tracked workstreams use their recorded step; others are derived from files.
+    # State is read and written on this thread only (SQLite connections are per-thread).
+    jobs = []
+    for slug in slugs:
+        current = backend.get(slug).get("current")
+        tracked = current is not None
+        if not tracked:
+            current = derive_current_step(active / slug, slug, steps)
+        jobs.append((slug, current, tracked))
+
+    try:
+        deps = step_dependencies(conf)
+    except StepError as e:
+        print("\n".join(e.lines))
+        sys.exit(1)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        if deps is None:
+            outcomes = list(pool.map(lambda job: _next_one(conf, *job), jobs))
+        else:
+            outcomes = list(
+                pool.map(lambda job: _next_one_graph(conf, deps, job[0], job[2]), jobs)
+            )
+
+    to_settle = [o for o in outcomes if o.finished]
+    if to_settle:
+        with backend.transaction():
+            for o in to_settle:
+                settle(conf, backend, o.finished, o.tracked)
+                done = ", ".join(f.next_step for f in o.finished)
+                o.result = f"✅ completed {done}; {o.result}"
+
+    to_advance = [o for o in outcomes if o.result == "advance"]
+    if to_advance:
+        with backend.transaction():
+            for o in to_advance:
+                assert o.files is not None
+                if o.tracked:
+                    moved_to = advance(backend, o.files)
+                    if moved_to is not None:
+                        o.result = f"ℹ️ changed concurrently ({moved_to})"
+                        continue
+                else:
+                    events.step_completed(o.files.next_file, o.files.next_step)
+                o.files.prompt_output_file.unlink(missing_ok=True)
+                o.result = "✅ advanced"
+        search.refresh(conf, [o.files.next_file.parent for o in to_advance if o.files])
+
+    print(f"{'Workstream':28} {'Step':20} Result")
+    print(f"{'-' * 28} {'-' * 20} {'-' * 30}")
+    for o in outcomes:
+        print(f"{o.slug:28} {o.step:20} {o.result}")
+    counts: dict[str, int] = {}
+    for o in outcomes:
+        key = o.result.split(" ", 1)[0]
+        counts[key] = counts.get(key, 0) + 1
+    print(
+        f"\n{len(outcomes)} workstreams: "
+        + ", ".join(f"{k} {v}" for k, v in counts.items())
+    )
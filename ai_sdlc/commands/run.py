@@ -0,0 +1,421 @@
+"""`aisdlc run` – execute step prompts with the configured LLM."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+from ai_sdlc import graph, llm, response_cache, search
+from ai_sdlc.commands.next import (
+    StepError,
+    StepFiles,
+    advance,
+    generate_prompt,
+    plan_frontier,
+    plan_step,
+    settle,
+    step_dependencies,
+)
+from ai_sdlc.state import StateBackend, get_backend
+from ai_sdlc.utils import (
+    CONFIG_FILE,
+    get_root,
+    load_config,
+    pop_flag,
+    pop_option,
+    resolve_step,
+)
+
+_USAGE = "Usage: aisdlc run [--slug SLUG] [--through STEP] [--quiet] [--no-cache | --refresh]"
+
+
+def _echo(piece: str) -> None:
+    sys.stdout.write(piece)
+    sys.stdout.flush()
+
+
+async def execute(
+    client: llm.Client, files: StepFiles, *, quiet: bool = False
+) -> llm.RunResult:
+    """Generate the prompt of *files* and stream the model's answer into ``next_file``.
+
+    Raises:
+        StepError: If the prompt cannot be generated.
+        llm.LLMError: If the model call fails after retries.
+        OSError: If the prompt or the output cannot be read or written.
+    """
+    generate_prompt(files)
+    prompt = files.prompt_output_file.read_text(encoding="utf-8")
+    result = await client.complete_to_file(
+        prompt, files.next_file, None if quiet else _echo
+    )
+    if not quiet and result.chars:
+        print()  # End the echoed response
+    return result
+
+
+def open_cache(settings: llm.Settings) -> response_cache.ResponseCache | None:
+    """Open the response cache, or warn and run without one if it is unusable."""
+    import sqlite3
+
+    try:
+        return response_cache.open_cache(settings)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  Response cache unavailable, calling the model: {e}")
+        return None
+
+
+def describe(result: llm.RunResult) -> str:
+    """Summarise *result*: size, latency and retries."""
+    parts = [f"{result.chars:,} chars"]
+    if result.first_token_seconds is not None:
+        parts.append(f"first token {result.first_token_seconds:.2f}s")
+    parts.append(f"total {result.seconds:.2f}s")
+    if result.attempts > 1:
+        retries = result.attempts - 1
+        parts.append(f"{retries} retr{'y' if retries == 1 else 'ies'}")
+    return ", ".join(parts + result.notes)
+
+
+def finish(conf: dict[str, Any], backend: StateBackend, files: StepFiles) -> str | None:
+    """Advance the workstream after its step file was written and drop the prompt.
+
+    Returns:
+        str | None: None on success, otherwise why the state was not moved.
+    """
+    moved_to = advance(backend, files)
+    if moved_to is not None:
+        return moved_to
+    files.prompt_output_file.unlink(missing_ok=True)
+    search.refresh(conf, [files.next_file.parent])
+    return None
+
+
+class PipelineError(Exception):
+    """A step of the pipeline failed; the steps before it are kept."""
+
+    def __init__(self, lines: list[str], timings: list[tuple[str, float, str]]) -> None:
+        super().__init__(lines[0])
+        self.lines = lines
+        self.timings = timings
+
+
+async def run_pipeline(
+    conf: dict[str, Any],
+    backend: StateBackend,
+    client: llm.Client,
+    slug: str,
+    current: str,
+    target: str,
+    *,
+    quiet: bool = False,
+) -> list[tuple[str, float, str]]:
+    """Run every step after *current* up to and including *target*.
+
+    Each step is rendered, executed and written, then the workstream is
+    advanced before the next step starts, so the state is a checkpoint: an
+    interrupted pipeline resumes from the last completed step.  A step file
+    that already exists (written before an interruption, or by hand) is
+    adopted without a model call.  If the workstream is moved by someone
+    else meanwhile, the pipeline stops without advancing it.
+
+    Returns:
+        list[tuple[str, float, str]]: ``(step, seconds, summary)`` per step.
+
+    Raises:
+        PipelineError: If a step fails; *timings* holds the completed ones.
+    """
+    timings: list[tuple[str, float, str]] = []
+    while current != target:
+        started = time.perf_counter()
+        try:
+            files = plan_step(conf, slug, current)
+        except StepError as e:
+            raise PipelineError(list(e.lines), timings) from None
+        if files is None:
+            break
+        rel = files.next_file.relative_to(get_root())
+        if files.next_file.exists():
+            summary = "existing file kept, no model call"
+            print(f"↪️  {files.next_step}: {rel} already exists; advancing")
+        else:
+            print(
+                f"🤖  Running {files.next_step} for '{slug}' with {client.settings.model} …"
+            )
+            sys.stdout.flush()
+            try:
+                summary = describe(await execute(client, files, quiet=quiet))
+            except (StepError, llm.LLMError, OSError) as e:
+                raise PipelineError(_failure(client, files, e), timings) from None
+            print(f"📝  Wrote {rel} ({summary})")
+        moved_to = finish(conf, backend, files)
+        if moved_to is not None:
+            print(f"ℹ️  '{slug}' changed concurrently ({moved_to}); not advancing.")
+            break
+        elapsed = time.perf_counter() - started
+        timings.append((files.next_step, elapsed, summary))
+        print(f"✅  Advanced to step: {files.next_step} ({elapsed:.2f}s)")
+        sys.stdout.flush()
+        current = files.next_step
+    return timings
+
+
+def _failure(client: llm.Client, files: StepFiles, error: Exception) -> list[str]:
+    """Explain why running the step of *files* failed."""
+    if isinstance(error, StepError):
+        return list(error.lines)
+    if isinstance(error, llm.LLMError):
+        return [
+            f"❌ Error: {client.settings.model} could not complete step "
+            f"'{files.next_step}': {error}",
+            f"   The prompt is kept in {files.prompt_output_file}; "
+            "run `aisdlc run` again to resume.",
+        ]
+    return [f"❌ Error: Could not write '{files.next_file}': {error}"]
+
+
+async def _run_branch(
+    client: llm.Client, files: StepFiles, *, quiet: bool
+) -> tuple[str, float]:
+    """Run one step of a DAG round; return its summary and wall time.
+
+    Raises:
+        StepError, llm.LLMError, OSError: As `execute`.
+    """
+    started = time.perf_counter()
+    print(
+        f"🤖  Running {files.next_step} for '{files.slug}' with {client.settings.model} …"
+    )
+    sys.stdout.flush()
+    summary = describe(await execute(client, files, quiet=quiet))
+    return summary, time.perf_counter() - started
+
+
+async def run_graph(
+    conf: dict[str, Any],
+    backend: StateBackend,
+    client: llm.Client,
+    deps: dict[str, list[str]],
+    slug: str,
+    target: str | None,
+    *,
+    quiet: bool = False,
+) -> list[tuple[str, float, str]]:
+    """Run the steps of a DAG lifecycle, independent branches concurrently.
+
+    Each round runs every ready step at once and records each completed
+    step as soon as the round ends, so an interrupted run resumes from the
+    completed ones.  Without *target* one round runs; otherwise rounds
+    continue, limited to the steps *target* depends on, until it is written.
+    Responses are not echoed while several steps stream at the same time.
+
+    Returns:
+        list[tuple[str, float, str]]: ``(step, seconds, summary)`` per step.
+
+    Raises:
+        PipelineError: If a step fails; the other steps of its round are kept.
+    """
+    wanted = None if target is None else graph.ancestors(deps, target) | {target}
+    timings: list[tuple[str, float, str]] = []
+    while True:
+        try:
+            frontier = plan_frontier(conf, deps, slug)
+        except StepError as e:
+            raise PipelineError(list(e.lines), timings) from None
+        for line in settle(conf, backend, frontier.finished):
+            print(line)
+        round_ = [f for f in frontier.ready if wanted is None or f.next_step in wanted]
+        if not round_ or (target is not None and target in frontier.done):
+            return timings
+        concurrent = len(round_) > 1
+        if concurrent:
+            names = ", ".join(f.next_step for f in round_)
+            print(f"🔀  Running {len(round_)} independent steps concurrently: {names}")
+        outcomes = await asyncio.gather(
+            *(_run_branch(client, f, quiet=quiet or concurrent) for f in round_),
+            return_exceptions=True,
+        )
+        failures: list[str] = []
+        for files, outcome in zip(round_, outcomes, strict=True):
+            if isinstance(outcome, StepError | llm.LLMError | OSError):
+                failures.extend(_failure(client, files, outcome))
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            summary, elapsed = outcome
+            print(f"📝  Wrote {files.next_file.relative_to(get_root())} ({summary})")
+            moved_to = finish(conf, backend, files)
+            if moved_to is not None:
+                print(
+                    f"ℹ️  '{slug}' changed concurrently ({moved_to}); not recording it."
+                )
+                return timings
+            timings.append((files.next_step, elapsed, summary))
+            print(f"✅  Completed step: {files.next_step} ({elapsed:.2f}s)")
+        sys.stdout.flush()
+        if failures:
+            raise PipelineError(failures, timings)
+        if target is None:
+            return timings
+
+
+def _print_timings(
+    timings: list[tuple[str, float, str]], total: float | None = None
+) -> None:
+    if not timings:
+        return
+    print(f"\n⏱️  {'Step':24} {'Wall time':>10}")
+    for step, seconds, _ in timings:
+        print(f"    {step:24} {seconds:>9.2f}s")
+    if total is not None:
+        print(f"    {'total':24} {total:>9.2f}s")
+
+
+def run_run(args: list[str] | None = None) -> None:
+    """Run the next step's prompt (or every step up to one) through the LLM and advance.
+
+    Instead of copying `_prompt-<step>.md` into a chat window, the merged
+    prompt is sent to the ``[llm]`` endpoint of `.aisdlc` and the answer is
+    streamed into `<next_step>-<slug>.md`, after which the workstream moves on.
+    With `--through STEP` this repeats, unattended, until STEP is written.
+    In a DAG lifecycle every ready step runs, independent ones concurrently.
+
+    Args:
+        args: Optional `--slug SLUG` selecting the workstream, `--through
+            STEP` (a step name or unique prefix) to chain steps, `--quiet` to
+            not echo the response while it streams, and `--no-cache` (neither
+            read nor store) or `--refresh` (call the model and overwrite) for
+            the response cache.
+
+    Raises:
+        SystemExit: If the configuration is invalid or the model call fails.
+    """
+    args = list(args or [])
+    try:
+        wanted = pop_option(args, "--slug")
+        through = pop_option(args, "--through")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    quiet = pop_flag(args, "--quiet")
+    no_cache = pop_flag(args, "--no-cache")
+    refresh = pop_flag(args, "--refresh")
+    if args:
+        print(f"❌  Unexpected arguments: {' '.join(args)}. {_USAGE}")
+        sys.exit(1)
+
+    conf = load_config()
+    try:
+        settings = llm.settings(conf)
+    except (ValueError, TypeError) as e:
+        print(f"❌ Error: Invalid configuration in {CONFIG_FILE}: {e}")
+        sys.exit(1)
+    if no_cache:
+        settings.cache = False
+    with get_backend(conf) as backend:
+        lock = backend.get(wanted)
+        if not lock or "current" not in lock:
+            if wanted:
+                print(f"❌  No active workstream '{wanted}'.")
+            else:
+                print("❌  No active workstream. Run `aisdlc new` first.")
+            sys.exit(1)
+
+        slug, current = lock["slug"], lock["current"]
+        steps = conf["steps"]
+        try:
+            deps = step_dependencies(conf)
+        except StepError as e:
+            print("\n".join(e.lines))
+            sys.exit(1)
+        if deps is not None:
+            _run_graph_command(
+                conf, backend, settings, deps, slug, through, quiet, refresh
+            )
+            return
+        if current not in steps:
+            print(
+                f"❌  Error: Current step '{current}' not found in configuration steps."
+            )
+            sys.exit(1)
+        if current == steps[-1]:
+            print("🎉  All steps complete. Run `aisdlc done` to archive.")
+            return
+        target = (
+            steps[steps.index(current) + 1]
+            if through is None
+            else resolve_step(steps, through)
+        )
+        if target is None:
+            print(f"❌  Unknown step '{through}'. Available steps: {', '.join(steps)}")
+            sys.exit(1)
+        if steps.index(target) <= steps.index(current):
+            print(f"ℹ️  '{slug}' is already at {current}, at or past {target}.")
+            return
+
+        async def pipeline() -> list[tuple[str, float, str]]:
+            async with llm.Client(
+                settings, open_cache(settings), refresh=refresh
+            ) as client:
+                return await run_pipeline(
+                    conf, backend, client, slug, current, target, quiet=quiet
+                )
+
+        start = time.perf_counter()
+        try:
+            timings = asyncio.run(pipeline())
+        except PipelineError as e:
+            print("\n".join(e.lines))
+            _print_timings(e.timings)
+            sys.exit(1)
+        if len(timings) > 1:
+            _print_timings(timings, time.perf_counter() - start)
+
+
+def _run_graph_command(
+    conf: dict[str, Any],
+    backend: StateBackend,
+    settings: llm.Settings,
+    deps: dict[str, list[str]],
+    slug: str,
+    through: str | None,
+    quiet: bool,
+    refresh: bool,
+) -> None:
+    """`aisdlc run` for a DAG lifecycle (see `run_graph`)."""
+    steps = conf["steps"]
+    target = None if through is None else resolve_step(steps, through)
+    if through is not None and target is None:
+        print(f"❌  Unknown step '{through}'. Available steps: {', '.join(steps)}")
+        sys.exit(1)
+    try:
+        frontier = plan_frontier(conf, deps, slug)
+    except StepError as e:
+        print("\n".join(e.lines))
+        sys.exit(1)
+    if frontier.complete:
+        print("🎉  All steps complete. Run `aisdlc done` to archive.")
+        return
+    if target is not None and target in frontier.done:
+        print(f"ℹ️  '{slug}' has already completed {target}.")
+        return
+
+    async def pipeline() -> list[tuple[str, float, str]]:
+        async with llm.Client(
+            settings, open_cache(settings), refresh=refresh
+        ) as client:
+            return await run_graph(
+                conf, backend, client, deps, slug, target, quiet=quiet
+            )
+
+    start = time.perf_counter()
+    try:
+        timings = asyncio.run(pipeline())
+    except PipelineError as e:
+        print("\n".join(e.lines))
+        _print_timings(e.timings)
+        sys.exit(1)
+    if len(timings) > 1:
+        _print_timings(timings, time.perf_counter() - start)
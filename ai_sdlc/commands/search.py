@@ -0,0 +1,96 @@
+"""`aisdlc search` – full-text search over active and archived step files."""
+
+from __future__ import annotations
+
+import sys
+
+from ai_sdlc import search
+from ai_sdlc.utils import get_root, load_config, pop_flag, pop_option, resolve_step
+
+_USAGE = (
+    "Usage: aisdlc search <query> [--step STEP] [--slug SLUG] [--limit N] [--rebuild]"
+)
+
+
+def _snippet(text: str, terms: set[str], width: int = 100) -> str:
+    """Return the first line of *text* containing one of *terms*, shortened."""
+    for line in text.splitlines():
+        if terms & set(search.tokenize(line)):
+            line = " ".join(line.split())
+            return line if len(line) <= width else line[: width - 1] + "…"
+    return ""
+
+
+def run_search(args: list[str] | None = None) -> None:
+    """Rank step files against a query with BM25.
+
+    The index lives in `.aisdlc-cache/search.db`.  It is built on first use,
+    kept current by `aisdlc next`/`aisdlc done`, and `--rebuild` re-reads
+    every file whose mtime or size changed (e.g. after manual edits).
+
+    Args:
+        args: Query words plus optional `--step STEP` (or a unique prefix),
+            `--slug SLUG`, `--limit N` (default 10) and `--rebuild`.
+
+    Raises:
+        SystemExit: On invalid arguments or if the index cannot be used.
+    """
+    import sqlite3
+
+    args = list(args or [])
+    try:
+        step = pop_option(args, "--step")
+        slug = pop_option(args, "--slug")
+        limit = int(pop_option(args, "--limit") or 10)
+        rebuild = pop_flag(args, "--rebuild")
+        if limit < 1:
+            raise ValueError("--limit must be at least 1")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    query = " ".join(args)
+    if not query and not rebuild:
+        print(_USAGE)
+        sys.exit(1)
+
+    conf = load_config()
+    if step is not None:
+        resolved = resolve_step(conf["steps"], step)
+        if resolved is None:
+            print(f"❌  Unknown step '{step}'. Steps: {', '.join(conf['steps'])}")
+            sys.exit(1)
+        step = resolved
+
+    root = get_root()
+    path = search.index_path(root)
+    try:
+        fresh = not path.exists()
+        with search.SearchIndex(path, root) as index:
+            if fresh or rebuild:
+                changed = index.update(
+                    list(search.all_docs(conf, root)), prune_prefixes=[""]
+                )
+                print(
+                    f"🔎  Index updated: {changed} change(s), {len(index)} document(s)"
+                )
+            hits = (
+                index.query(query, slug=slug, step=step, limit=limit) if query else []
+            )
+    except (OSError, sqlite3.Error) as e:
+        print(f"❌  Error: Could not use search index '{path}': {e}")
+        sys.exit(1)
+
+    if not query:
+        return
+    if not hits:
+        print(f"No matches for '{query}'.")
+        return
+    terms = set(search.tokenize(query))
+    for rank, hit in enumerate(hits, 1):
+        print(f"{rank:2}. {hit.score:6.2f}  {hit.slug}  {hit.step}  {hit.path}")
+        try:
+            snippet = _snippet(search.read_doc(root, hit.path), terms)
+        except OSError:
+            snippet = "(file no longer readable – run with --rebuild)"
+        if snippet:
+            print(f"      {snippet}")
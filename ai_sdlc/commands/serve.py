@@ -0,0 +1,50 @@
+"""`aisdlc serve` – run the resident daemon that answers CLI commands."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from ai_sdlc import daemon
+
+
+def run_serve(args: list[str] | None = None) -> None:
+    """Start (or stop) the resident daemon.
+
+    While it is running, every `aisdlc` invocation by the same user is forwarded
+    to it over a Unix socket and served from warm, in-memory state.
+
+    Args:
+        args: Optional `--socket PATH` to override the socket location and
+            `--stop` to shut down a running daemon.
+
+    Raises:
+        SystemExit: If the daemon cannot be started or stopped.
+    """
+    args = list(args or [])
+    path: Path | None = None
+    if "--socket" in args:
+        i = args.index("--socket")
+        try:
+            path = Path(args[i + 1])
+        except IndexError:
+            print("Usage: aisdlc serve [--socket PATH] [--stop]")
+            sys.exit(1)
+
+    if "--stop" in args:
+        if daemon.stop(path):
+            print("🛑  aisdlc daemon stopped.")
+        else:
+            print("ℹ️  No aisdlc daemon is running.")
+        return
+
+    target = path or daemon.socket_path()
+    print(f"🚀  aisdlc daemon listening on {target} (Ctrl-C to stop)")
+    sys.stdout.flush()
+    try:
+        daemon.serve(target)
+    except KeyboardInterrupt:
+        print("\n🛑  aisdlc daemon stopped.")
+    except OSError as e:
+        print(f"❌ Error: Could not start aisdlc daemon: {e}")
+        sys.exit(1)
@@ -0,0 +1,69 @@
+"""`aisdlc show` – print one step of an active or archived workstream."""
+
+from __future__ import annotations
+
+import sys
+
+from ai_sdlc import archive
+from ai_sdlc.utils import (
+    DEFAULT_ACTIVE_DIR,
+    DEFAULT_DONE_DIR,
+    get_root,
+    load_config,
+    resolve_step,
+)
+
+
+def run_show(args: list[str] | None = None) -> None:
+    """Write the output file of one step to stdout.
+
+    Active workstreams are read from the active directory; archived ones
+    from their directory or, without unpacking, from their zip archive in
+    the done directory.
+
+    Args:
+        args: `<slug> <step>`, where *step* may be a unique prefix such as `1`.
+
+    Raises:
+        SystemExit: If the workstream or step cannot be found.
+    """
+    args = list(args or [])
+    if len(args) != 2:
+        print("Usage: aisdlc show <slug> <step>")
+        sys.exit(1)
+    slug, wanted = args
+
+    conf = load_config()
+    steps = conf["steps"]
+    step = resolve_step(steps, wanted)
+    if step is None:
+        print(f"❌  Unknown step '{wanted}'. Steps: {', '.join(steps)}")
+        sys.exit(1)
+
+    root = get_root()
+    filename = f"{step}-{slug}.md"
+    active = root / conf.get("active_dir", DEFAULT_ACTIVE_DIR) / slug
+    done = root / conf.get("done_dir", DEFAULT_DONE_DIR)
+    try:
+        data = (active / filename).read_bytes()
+    except FileNotFoundError:
+        try:
+            data = archive.read_member(done, slug, filename)
+        except OSError as e:
+            print(f"❌  Error: {e}")
+            sys.exit(1)
+    except OSError as e:
+        print(f"❌  Error: Could not read '{active / filename}': {e}")
+        sys.exit(1)
+
+    if data is None:
+        stored = archive.member_names(done, slug)
+        if not stored and not active.is_dir():
+            print(
+                f"❌  No workstream '{slug}' in {active.parent.name}/ or {done.name}/."
+            )
+        else:
+            print(f"❌  Workstream '{slug}' has no '{step}' output ({filename}).")
+        sys.exit(1)
+
+    sys.stdout.write(data.decode("utf-8", "replace"))
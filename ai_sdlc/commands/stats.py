@@ -0,0 +1,197 @@
+"""`aisdlc stats` – cycle time, throughput and prompt size from the event history."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from ai_sdlc import events
+from ai_sdlc.utils import format_size, load_config, pop_flag, pop_option
+
+_USAGE = "Usage: aisdlc stats [--weeks N] [--json]"
+
+# Label of the time from entering the last step to `aisdlc done`
+ARCHIVE_ROW = "(archive)"
+
+
+@dataclass
+class Summary:
+    """Aggregated history of every workstream."""
+
+    workstreams: int = 0
+    archived: int = 0
+    #: Seconds spent producing each step (from entering the previous step)
+    durations: dict[str, list[float]] = field(default_factory=dict)
+    #: ISO week -> [steps completed, workstreams archived]
+    weekly: dict[str, list[int]] = field(default_factory=dict)
+    prompt_bytes: dict[str, list[int]] = field(default_factory=dict)
+    output_bytes: dict[str, list[int]] = field(default_factory=dict)
+
+
+def _week(t: float) -> str:
+    """Return the ISO week of timestamp *t* in UTC, e.g. ``2025-W07``."""
+    year, week, _ = datetime.fromtimestamp(t, tz=UTC).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def summarize(steps: list[str], facts: dict[str, events.Facts]) -> Summary:
+    """Aggregate the per-workstream *facts* over the configured *steps*."""
+    summary = Summary(workstreams=len(facts))
+    for f in facts.values():
+        for prev, step in zip(steps, steps[1:], strict=False):
+            start, end = f.entered.get(prev), f.entered.get(step)
+            if start is not None and end is not None and end >= start:
+                summary.durations.setdefault(step, []).append(end - start)
+            if end is not None:
+                summary.weekly.setdefault(_week(end), [0, 0])[0] += 1
+        if f.archived is not None:
+            summary.archived += 1
+            summary.weekly.setdefault(_week(f.archived), [0, 0])[1] += 1
+            start = f.entered.get(steps[-1])
+            if start is not None and f.archived >= start:
+                summary.durations.setdefault(ARCHIVE_ROW, []).append(f.archived - start)
+        for step, size in f.prompt_bytes.items():
+            summary.prompt_bytes.setdefault(step, []).append(size)
+        for step, size in f.output_bytes.items():
+            summary.output_bytes.setdefault(step, []).append(size)
+    return summary
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank *pct* percentile of *values* (which must not be empty)."""
+    import math
+
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def _duration(seconds: float) -> str:
+    """Format *seconds* with two units: ``45s``, ``12m 5s``, ``5h 20m``, ``3d 4h``."""
+    seconds = max(int(seconds), 0)
+    units = (("d", 86400), ("h", 3600), ("m", 60), ("s", 1))
+    for i, (unit, size) in enumerate(units[:-1]):
+        if seconds >= size:
+            small, small_size = units[i + 1]
+            return f"{seconds // size}{unit} {seconds % size // small_size}{small}"
+    return f"{seconds}s"
+
+
+def _tokens(size: float) -> int:
+    # The length-based floor of context.estimate_tokens; the history keeps no text
+    return int(size + 3) // 4
+
+
+def _as_json(steps: list[str], summary: Summary, weeks: list[str]) -> dict[str, Any]:
+    from statistics import median
+
+    rows = [s for s in [*steps, ARCHIVE_ROW] if s in summary.durations]
+    return {
+        "workstreams": summary.workstreams,
+        "archived": summary.archived,
+        "steps": {
+            s: {
+                "n": len(summary.durations[s]),
+                "median_seconds": median(summary.durations[s]),
+                "p90_seconds": percentile(summary.durations[s], 90),
+            }
+            for s in rows
+        },
+        "weekly": {
+            w: {"steps": summary.weekly[w][0], "archived": summary.weekly[w][1]}
+            for w in weeks
+        },
+        "prompts": {
+            s: {
+                "n": len(sizes),
+                "median_bytes": median(sizes),
+                "estimated_tokens": _tokens(median(sizes)),
+            }
+            for s in steps
+            if (sizes := summary.prompt_bytes.get(s))
+        },
+    }
+
+
+def run_stats(args: list[str] | None = None) -> None:
+    """Print cycle-time, throughput and prompt-size statistics of all workstreams.
+
+    Aggregates the event history (see `ai_sdlc.events`) of every workstream
+    in the active and done directories: median and p90 time per step,
+    throughput per ISO week, and prompt and output sizes per step with an
+    estimated token count.
+
+    Args:
+        args: Optional `--weeks N` (default 8) limiting the throughput table
+            and `--json` for machine-readable output.
+
+    Raises:
+        SystemExit: If the arguments are invalid.
+    """
+    import json
+    from statistics import median
+
+    args = list(args or [])
+    try:
+        weeks_arg = pop_option(args, "--weeks")
+        max_weeks = int(weeks_arg) if weeks_arg is not None else 8
+        if max_weeks < 1:
+            raise ValueError("--weeks must be at least 1")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    as_json = pop_flag(args, "--json")
+    if args:
+        print(f"❌  Unexpected arguments: {' '.join(args)}. {_USAGE}")
+        sys.exit(1)
+
+    conf = load_config()
+    steps = conf["steps"]
+    summary = summarize(steps, events.collect(conf))
+    weeks = sorted(summary.weekly)[-max_weeks:]
+    if as_json:
+        print(json.dumps(_as_json(steps, summary, weeks), indent=2))
+        return
+
+    if not summary.workstreams:
+        print(
+            "ℹ️  No event history yet; `new`, `next`, `run` and `done` record it from now on."
+        )
+        return
+    print(
+        f"Workstreams with history: {summary.workstreams} ({summary.archived} archived)"
+    )
+
+    print(f"\nTime per step\n{'STEP':24} {'N':>5} {'MEDIAN':>9} {'P90':>9}")
+    for step in [*steps, ARCHIVE_ROW]:
+        values = summary.durations.get(step)
+        if values:
+            med, p90 = _duration(median(values)), _duration(percentile(values, 90))
+            print(f"{step:24} {len(values):>5} {med:>9} {p90:>9}")
+
+    print(f"\nThroughput per week\n{'WEEK':24} {'STEPS':>5} {'ARCHIVED':>9}")
+    for week in weeks:
+        completed, archived = summary.weekly[week]
+        print(f"{week:24} {completed:>5} {archived:>9}")
+
+    print(
+        "\nPrompt and output size per step (median)\n"
+        f"{'STEP':24} {'N':>5} {'PROMPT':>9} {'~TOKENS':>9} {'OUTPUT':>9}"
+    )
+    for step in steps:
+        prompts, outputs = (
+            summary.prompt_bytes.get(step),
+            summary.output_bytes.get(step),
+        )
+        if not prompts and not outputs:
+            continue
+        prompt = median(prompts) if prompts else None
+        output = median(outputs) if outputs else None
+        prompt_size = format_size(prompt) if prompt is not None else "—"
+        tokens = _tokens(prompt) if prompt is not None else "—"
+        output_size = format_size(output) if output is not None else "—"
+        print(
+            f"{step:24} {len(prompts or outputs or []):>5} "
+            f"{prompt_size:>9} {tokens:>9} {output_size:>9}"
+        )
@@ -1,28 +1,20 @@
 """`aisdlc status` – show progress through lifecycle steps."""
 
-from ai_sdlc.utils import load_config, read_lock
+import sys
+from typing import Any
 
+from ai_sdlc.state import get_backend
+from ai_sdlc.utils import (
+    DEFAULT_ACTIVE_DIR,
+    get_root,
+    load_config,
+    pop_flag,
+    pop_option,
+)
 
-def run_status() -> None:
-    """Display the current status of active workstreams.
-
-    Shows the workstream slug, current step, and a progress bar indicating
-    which steps have been completed.
-    """
-    try:
-        conf = load_config()
-        steps = conf["steps"]
-    except KeyError:
-        print("❌  Error: Configuration missing 'steps' key.")
-        print("   Please ensure your .aisdlc file is properly configured.")
-        return
-
-    lock = read_lock()
-    print("Active workstreams\n------------------")
-    if not lock:
-        print("none – create one with `aisdlc new`")
-        return
 
+def _print_workstream(lock: dict[str, Any], steps: list[str]) -> None:
+    """Print one status row: slug, current step and progress bar."""
     try:
         slug = lock["slug"]
         cur = lock["current"]
@@ -41,3 +33,137 @@ def run_status() -> None:
     # Steps are in format like "01-idea", take the part after the dash
     bar = " ▸ ".join([("✅" if i <= idx else "☐") + s.split("-", 1)[1] if "-" in s else s[2:] for i, s in enumerate(steps)])
     print(f"{slug:20} {cur:12} {bar}")
+
+
+def _print_graph(conf: dict[str, Any], deps: dict[str, list[str]], slug: str) -> None:
+    """Print one DAG workstream: slug, completed steps and its step graph."""
+    import os
+
+    from ai_sdlc import graph
+
+    steps = conf["steps"]
+    workdir = get_root() / conf.get("active_dir", DEFAULT_ACTIVE_DIR) / slug
+    done = graph.completed(workdir, slug, steps)
+    try:
+        names = set(os.listdir(workdir))
+    except OSError:
+        names = set()
+    prompts = {s for s in steps if f"_prompt-{s}.md" in names}
+    print(
+        f"{slug:20} {graph.latest(steps, done) or '—':12} {len(done)}/{len(steps)} steps"
+    )
+    for line in graph.render(deps, steps, done, prompts):
+        print(f"    {line}")
+
+
+def _age(seconds: float) -> str:
+    """Format *seconds* compactly: ``45s``, ``12m``, ``5h``, ``3d``."""
+    seconds = max(int(seconds), 0)
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+
+def _print_all(conf: dict[str, Any], include_done: bool, per_step: bool) -> None:
+    """Print every workstream from the cached manifest.
+
+    With *per_step*, each row is followed by the age of every step file.
+    """
+    import time
+
+    from ai_sdlc import manifest
+
+    steps = conf["steps"]
+    snapshot = manifest.refresh(conf, include_done=include_done)
+    active = sum(not ws.done for ws in snapshot.workstreams)
+    title = f"Workstreams ({active} active"
+    title += f", {len(snapshot.workstreams) - active} done)" if include_done else ")"
+    print(f"{title}\n{'-' * len(title)}")
+    if not snapshot.workstreams:
+        print("none – create one with `aisdlc new`")
+        return
+
+    now = time.time_ns()
+    print(f"{'WORKSTREAM':20} {'STEP':20} {'AGE':>5}  PENDING PROMPT")
+    for ws in snapshot.workstreams:
+        cur = ws.current_step(steps)
+        age = _age((now - ws.step_mtimes[cur]) / 1e9) if cur else "—"
+        step = f"{cur or '—'}{' (done)' if ws.done else ''}"
+        print(
+            f"{ws.slug:20} {step:20} {age:>5}  {', '.join(ws.pending_prompts) or '—'}"
+        )
+        if per_step:
+            ages = (
+                f"{s} {_age((now - ws.step_mtimes[s]) / 1e9)}"
+                if s in ws.step_mtimes
+                else f"{s} —"
+                for s in steps
+            )
+            print(f"    {' · '.join(ages)}")
+
+
+def run_status(args: list[str] | None = None) -> None:
+    """Display the current status of active workstreams.
+
+    Shows the workstream slug, current step, and a progress bar indicating
+    which steps have been completed, or the step graph of a DAG lifecycle.
+
+    Args:
+        args: Optional `--slug SLUG` to show a single workstream, or `--all`
+            for a table of every workstream directory (`--done` adds finished
+            ones, `--steps` the age of every step), derived from the step
+            files on disk.
+    """
+    args = list(args or [])
+    try:
+        wanted = pop_option(args, "--slug")
+    except ValueError as e:
+        print(f"❌  {e}. Usage: aisdlc status [--slug SLUG | --all [--done] [--steps]]")
+        sys.exit(1)
+    show_done = pop_flag(args, "--done")
+    per_step = pop_flag(args, "--steps")
+    show_all = pop_flag(args, "--all") or show_done or per_step
+    if show_all and wanted:
+        print("❌  --slug cannot be combined with --all.")
+        print("   Usage: aisdlc status [--slug SLUG | --all [--done] [--steps]]")
+        sys.exit(1)
+
+    try:
+        conf = load_config()
+        steps = conf["steps"]
+    except KeyError:
+        print("❌  Error: Configuration missing 'steps' key.")
+        print("   Please ensure your .aisdlc file is properly configured.")
+        return
+
+    if show_all:
+        _print_all(conf, show_done, per_step)
+        return
+
+    with get_backend(conf) as backend:
+        if wanted:
+            lock = backend.get(wanted)
+            locks = [lock] if lock else []
+        else:
+            locks = backend.list()
+    print("Active workstreams\n------------------")
+    if not locks:
+        if wanted:
+            print(f"no active workstream '{wanted}'")
+        else:
+            print("none – create one with `aisdlc new`")
+        return
+
+    from ai_sdlc import graph
+
+    try:
+        deps = graph.dependencies(conf)
+    except ValueError as e:
+        print(f"❌  Error: Invalid step dependencies: {e}")
+        sys.exit(1)
+    for lock in locks:
+        if deps is not None and "slug" in lock:
+            _print_graph(conf, deps, lock["slug"])
+        else:
+            _print_workstream(lock, steps)
@@ -0,0 +1,233 @@
+"""`aisdlc upgrade-prompts` – bring unmodified prompt templates up to the packaged version."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ai_sdlc import prompt_baseline
+from ai_sdlc.commands.init import PROMPT_FILE_NAMES, load_scaffold
+from ai_sdlc.utils import (
+    CONFIG_FILE,
+    DEFAULT_PROMPT_DIR,
+    atomic_write_text,
+    get_root,
+    parse_toml,
+    pop_flag,
+    pop_option,
+)
+
+_USAGE = "Usage: aisdlc upgrade-prompts [--dry-run] [--workers N] [PROJECT_DIR...]"
+
+
+@dataclass
+class Upgrade:
+    """What `upgrade_project` found (and did) in one project."""
+
+    root: Path
+    prompt_dir: Path | None = None
+    updated: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    #: Customised file name -> why it is considered customised
+    customised: dict[str, str] = field(default_factory=dict)
+    current: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class _Packaged:
+    """Hash manifest of the packaged prompts, shared by every project of one run."""
+
+    def __init__(self, prompts: dict[str, str]) -> None:
+        self.texts = prompts
+        self.hashes = {
+            name: prompt_baseline.text_digest(text) for name, text in prompts.items()
+        }
+        self._shared: Path | None = None
+        self._lock = threading.Lock()
+
+    def shared(self) -> Path:
+        """Return the shared template cache of this version, created on first use.
+
+        Raises:
+            OSError: If the cache cannot be written.
+        """
+        from ai_sdlc import template_cache
+
+        with self._lock:
+            if self._shared is None:
+                self._shared = template_cache.ensure(self.texts)
+            return self._shared
+
+
+def _prompt_dir(root: Path) -> Path:
+    """Return the prompt directory configured in the project at *root*.
+
+    Raises:
+        OSError: If the config cannot be read.
+        ValueError: If the config is not valid TOML.
+    """
+    conf = parse_toml((root / CONFIG_FILE).read_text(encoding="utf-8"))
+    return root / str(conf.get("prompt_dir", DEFAULT_PROMPT_DIR))
+
+
+def _replace(target: Path, name: str, packaged: _Packaged) -> None:
+    """Write the packaged *name* over *target*, keeping a link to the shared cache a link.
+
+    The old file is replaced by rename, never rewritten in place, so a
+    hardlinked or symlinked template shared with other projects is not touched.
+
+    Raises:
+        OSError: If the file cannot be replaced.
+    """
+    from ai_sdlc import template_cache
+
+    mode = None
+    if target.is_symlink():
+        mode = "symlink"
+    elif target.exists() and target.stat().st_nlink > 1:
+        mode = "hardlink"
+    if mode is None:
+        atomic_write_text(target, packaged.texts[name])
+        return
+    tmp = target.with_name(f".{name}.upgrade")
+    tmp.unlink(missing_ok=True)
+    template_cache.install(packaged.shared() / name, tmp, mode)
+    os.replace(tmp, target)
+
+
+def upgrade_project(
+    root: Path, packaged: _Packaged, *, dry_run: bool = False
+) -> Upgrade:
+    """Upgrade the prompts of the project at *root* without printing anything.
+
+    Each packaged prompt is compared by content hash with the local file and
+    the project's baseline: an up-to-date file is kept, an unmodified
+    outdated one (its hash is the baseline, or any released version of the
+    template) is replaced, a missing one is added, and any other content is
+    reported as customised.
+    """
+    result = Upgrade(root)
+    try:
+        prompt_dir = _prompt_dir(root)
+    except (OSError, ValueError) as e:
+        result.errors.append(f"{root}: not an ai-sdlc project ({e})")
+        return result
+    result.prompt_dir = prompt_dir
+
+    baseline = prompt_baseline.load(prompt_dir)
+    new_baseline = dict(baseline)
+    for name, wanted in packaged.hashes.items():
+        target = prompt_dir / name
+        try:
+            local = prompt_baseline.local_digest(target)
+        except OSError as e:
+            result.errors.append(str(e))
+            continue
+        if local == wanted:
+            result.current += 1
+            new_baseline[name] = wanted
+            continue
+        unmodified = baseline.get(name) == local or (
+            local is not None and prompt_baseline.released(name, local)
+        )
+        if local is not None and not unmodified:
+            known = name in baseline
+            result.customised[name] = (
+                "edited since it was installed"
+                if known
+                else "no baseline; differs from package"
+            )
+            continue
+        try:
+            if not dry_run:
+                if local is None:
+                    prompt_dir.mkdir(parents=True, exist_ok=True)
+                _replace(target, name, packaged)
+        except OSError as e:
+            result.errors.append(f"{target}: {e}")
+            continue
+        (result.updated if local is not None else result.added).append(name)
+        new_baseline[name] = wanted
+
+    if not dry_run and new_baseline != baseline:
+        try:
+            prompt_baseline.save(prompt_dir, new_baseline)
+        except OSError as e:
+            result.errors.append(f"{prompt_dir / prompt_baseline.BASELINE_FILE}: {e}")
+    return result
+
+
+def _print(result: Upgrade, *, dry_run: bool) -> None:
+    update, add = ("Would update", "Would add") if dry_run else ("Updated", "Added")
+    prompt_dir = result.prompt_dir or result.root
+    for name in result.updated:
+        print(f"⬆️  {update} {prompt_dir / name}")
+    for name in result.added:
+        print(f"➕  {add} {prompt_dir / name}")
+    for name, why in result.customised.items():
+        print(f"✋  Kept customised {prompt_dir / name} ({why})")
+    for error in result.errors:
+        print(f"❌  {error}")
+
+
+def run_upgrade_prompts(args: list[str] | None = None) -> None:
+    """Replace outdated, unmodified prompt templates with the packaged versions.
+
+    Compares the SHA-256 of each local prompt with the packaged template and
+    with the baseline recorded when it was installed, so only files nobody
+    edited are rewritten.  Customised files are reported and left alone.
+
+    Args:
+        args: Optional project directories (default: the current project),
+            `--workers N` for the thread pool over several projects and
+            `--dry-run` to report without writing.
+
+    Raises:
+        SystemExit: If the arguments are invalid or any project failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    args = list(args or [])
+    try:
+        workers = pop_option(args, "--workers")
+        max_workers = int(workers) if workers else None
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("--workers must be at least 1")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    dry_run = pop_flag(args, "--dry-run")
+    unknown = [a for a in args if a.startswith("--")]
+    if unknown:
+        print(f"❌  Unknown option: {' '.join(unknown)}. {_USAGE}")
+        sys.exit(1)
+
+    roots = [Path(a) for a in args] or [get_root()]
+    scaffold = load_scaffold()
+    packaged = _Packaged(
+        {n: t for n in PROMPT_FILE_NAMES if (t := scaffold.prompts.get(n)) is not None}
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(
+            pool.map(lambda r: upgrade_project(r, packaged, dry_run=dry_run), roots)
+        )
+
+    for r in results:
+        _print(r, dry_run=dry_run)
+    updated = sum(len(r.updated) for r in results)
+    added = sum(len(r.added) for r in results)
+    customised = sum(len(r.customised) for r in results)
+    current = sum(r.current for r in results)
+    failed = sum(1 for r in results if r.errors)
+    where = f" across {len(results)} projects" if len(results) > 1 else ""
+    update, add = ("to update", "to add") if dry_run else ("updated", "added")
+    print(
+        f"\n{'🔎' if dry_run else '✅'}  {updated} {update}, {added} {add}, "
+        f"{customised} customised, {current} up to date{where}."
+    )
+    if failed:
+        print(f"❌  {failed} project(s) had errors.")
+        sys.exit(1)
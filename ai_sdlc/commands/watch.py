@@ -0,0 +1,221 @@
+"""`aisdlc watch` – advance workstreams as soon as their step files are saved."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ai_sdlc import events, graph, search, watch
+from ai_sdlc.commands.next import (
+    StepError,
+    StepFiles,
+    advance,
+    derive_current_step,
+    generate_prompt,
+    plan_frontier,
+    plan_step,
+    step_dependencies,
+)
+from ai_sdlc.state import StateBackend, get_backend
+from ai_sdlc.utils import (
+    DEFAULT_ACTIVE_DIR,
+    get_root,
+    load_config,
+    pop_flag,
+    pop_option,
+)
+
+_USAGE = "Usage: aisdlc watch [--settle SECONDS] [--poll [--interval SECONDS]]"
+
+
+def awaited(
+    conf: dict[str, Any], backend: StateBackend, workdir: Path
+) -> tuple[StepFiles, bool] | None:
+    """Return the step the workstream in *workdir* is waiting for, if its file exists.
+
+    Tracked workstreams wait for the step after their recorded one.  For
+    untracked ones (see `aisdlc next --all`) the step is derived from the
+    files present: the last step file counts once its prompt is still there.
+    In a DAG lifecycle every step file whose prompt is still there counts,
+    tracked or not, and the first of them in ``steps`` order is returned.
+
+    Returns:
+        tuple[StepFiles, bool] | None: The step's files and whether the
+        workstream is tracked, or None if there is nothing to advance.
+    """
+    slug = workdir.name
+    steps = conf["steps"]
+    current = backend.get(slug).get("current")
+    tracked = current is not None
+    deps = graph.dependencies(conf)
+    if deps is not None:
+        try:
+            finished = plan_frontier(conf, deps, slug).finished
+        except StepError:
+            return None
+        return (finished[0], tracked) if finished else None
+    if not tracked:
+        derived = derive_current_step(workdir, slug, steps)
+        if derived is None or derived == steps[0]:
+            return None
+        if not (workdir / f"_prompt-{derived}.md").exists():
+            return None
+        current = steps[steps.index(derived) - 1]
+    assert current is not None
+    try:
+        files = plan_step(conf, slug, current)
+    except StepError:
+        return None
+    if files is None or not files.next_file.exists():
+        return None
+    return files, tracked
+
+
+def step_forward(
+    conf: dict[str, Any], backend: StateBackend, files: StepFiles, tracked: bool
+) -> list[str]:
+    """Advance a workstream whose next step file is complete.
+
+    Moves the state on (for tracked workstreams), removes the used prompt and
+    generates the prompt of the following step.
+
+    Returns:
+        list[str]: Messages describing what happened.
+    """
+    slug = files.slug
+    if tracked:
+        moved_to = advance(backend, files)
+        if moved_to is not None:
+            return [f"ℹ️  {slug}: changed concurrently ({moved_to}); not advancing."]
+    else:
+        events.step_completed(files.next_file, files.next_step)
+    verb = "completed" if files.graph else "advanced to"
+    messages = [f"✅  {slug}: {verb} {files.next_step}"]
+    if files.prompt_output_file.exists():
+        files.prompt_output_file.unlink()
+        messages.append(f"🧹  {slug}: cleaned up {files.prompt_output_file.name}")
+    search.refresh(conf, [files.next_file.parent])
+    if files.graph:
+        return messages + _prompt_ready_steps(conf, slug)
+
+    try:
+        following = plan_step(conf, slug, files.next_step)
+        if following is None:
+            messages.append(
+                f"🎉  {slug}: all steps complete. Run `aisdlc done` to archive."
+            )
+            return messages
+        generate_prompt(following)
+    except StepError as e:
+        messages.extend(f"   {slug}: {line.strip()}" for line in e.lines)
+        return messages
+    rel = following.prompt_output_file.relative_to(get_root())
+    messages.append(
+        f"📝  {slug}: prompt ready: {rel} – save the response as {following.next_file.name}"
+    )
+    return messages
+
+
+def _prompt_ready_steps(conf: dict[str, Any], slug: str) -> list[str]:
+    """Generate the prompts of the DAG steps of *slug* that just became ready."""
+    deps = graph.dependencies(conf) or {}
+    try:
+        frontier = plan_frontier(conf, deps, slug)
+        if frontier.complete:
+            return [f"🎉  {slug}: all steps complete. Run `aisdlc done` to archive."]
+        fresh = [f for f in frontier.ready if not f.prompt_output_file.exists()]
+        for files in fresh:
+            generate_prompt(files)
+    except StepError as e:
+        return [f"   {slug}: {line.strip()}" for line in e.lines]
+    return [
+        f"📝  {slug}: prompt ready: {files.prompt_output_file.relative_to(get_root())}"
+        f" – save the response as {files.next_file.name}"
+        for files in fresh
+    ]
+
+
+def watch_loop(
+    conf: dict[str, Any],
+    backend: StateBackend,
+    watcher: watch.Watcher,
+    debouncer: watch.Debouncer,
+    *,
+    stop: Callable[[], bool] = lambda: False,
+) -> None:
+    """Advance workstreams as their step files become stable, until *stop* returns True."""
+    active = get_root() / conf.get("active_dir", DEFAULT_ACTIVE_DIR)
+    changed = set(watch.workdirs(active))
+    while not stop():
+        for workdir in sorted(changed):
+            found = awaited(conf, backend, workdir)
+            if found is not None:
+                debouncer.touch(found[0].next_file)
+        changed = set()
+        for path in debouncer.due():
+            found = awaited(conf, backend, path.parent)
+            if found is None or found[0].next_file != path:
+                continue  # Advanced by something else meanwhile
+            for line in step_forward(conf, backend, *found):
+                print(line)
+            sys.stdout.flush()
+            changed.add(path.parent)  # The following step's file may already exist
+        if not changed:
+            changed = watcher.wait(debouncer.timeout())
+
+
+def run_watch(args: list[str] | None = None) -> None:
+    """Watch the active workstreams and advance them when step files are saved.
+
+    Replaces running `aisdlc next` by hand after saving each AI response: when
+    the file a workstream is waiting for has been written and left unchanged
+    for the settle period, its state moves on, the used prompt is removed and
+    the next prompt is generated.  Runs until interrupted with Ctrl-C.
+
+    Args:
+        args: Optional `--settle SECONDS` (default 2) to wait for a file to
+            stop changing, `--poll` to poll instead of using inotify (e.g. on
+            network filesystems) and `--interval SECONDS` between polls.
+
+    Raises:
+        SystemExit: If the arguments are invalid.
+    """
+    args = list(args or [])
+    try:
+        settle = float(pop_option(args, "--settle") or watch.DEFAULT_SETTLE)
+        interval = float(pop_option(args, "--interval") or watch.DEFAULT_POLL_INTERVAL)
+        poll = pop_flag(args, "--poll")
+        if settle < 0 or interval <= 0:
+            raise ValueError("--settle and --interval must be positive")
+    except ValueError as e:
+        print(f"❌  {e}. {_USAGE}")
+        sys.exit(1)
+    if args:
+        print(f"❌  Unexpected arguments: {' '.join(args)}. {_USAGE}")
+        sys.exit(1)
+
+    conf = load_config()
+    try:
+        step_dependencies(conf)
+    except StepError as e:
+        print("\n".join(e.lines))
+        sys.exit(1)
+    active = get_root() / conf.get("active_dir", DEFAULT_ACTIVE_DIR)
+    if not active.is_dir():
+        print(f"❌  No active directory '{active}'. Run `aisdlc new` first.")
+        sys.exit(1)
+
+    watcher = watch.open_watcher(active, poll=poll, interval=interval)
+    polling = isinstance(watcher, watch.PollingWatcher)
+    mode = f"polling every {interval:g}s" if polling else "inotify"
+    print(f"👀  Watching {active} ({mode}, settle {settle:g}s). Press Ctrl-C to stop.")
+    sys.stdout.flush()
+    try:
+        with get_backend(conf) as backend:
+            watch_loop(conf, backend, watcher, watch.Debouncer(settle))
+    except KeyboardInterrupt:
+        print("\n🛑  Stopped watching.")
+    finally:
+        watcher.close()
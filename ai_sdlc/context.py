@@ -0,0 +1,243 @@
+"""Token-budgeted context assembly for `aisdlc next`.
+
+By default a prompt receives only the previous step's output.  Two optional
+`.aisdlc` settings widen and bound that context:
+
+* ``[context]`` – per step, the earlier steps to include as well, most
+  important first, e.g. ``"7.tests" = ["1.prd", "3.system-template"]``.
+* ``max_tokens`` – an estimated-token budget for the whole prompt.
+
+Over budget, sources are trimmed deterministically: whole context steps are
+dropped starting with the least important one, then trailing sections (split
+at markdown headings) of the remaining sources, and finally the text itself.
+The previous step is never dropped as a whole.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Config keys
+CONTEXT_KEY = "context"
+MAX_TOKENS_KEY = "max_tokens"
+
+_PIECE_PATTERN = r"\w+|[^\w\s]+"
+_piece_re: Any = None
+
+_TRIM_NOTE = "\n\n[… {n} section(s) trimmed to fit the token budget …]\n"
+_TRUNCATE_NOTE = "\n\n[… truncated to fit the token budget …]\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the LLM token count of *text* without a tokenizer.
+
+    Counts words and punctuation runs, but at least one token per four
+    characters, which tracks BPE tokenizers closely for English prose,
+    markdown and code.
+    """
+    global _piece_re
+    if _piece_re is None:
+        import re
+
+        _piece_re = re.compile(_PIECE_PATTERN)
+    return max(len(_piece_re.findall(text)), (len(text) + 3) // 4)
+
+
+def split_sections(text: str) -> list[str]:
+    """Split markdown *text* before each heading line outside code fences.
+
+    The pieces concatenate back to *text*; the first one holds everything
+    before the first heading (possibly empty).
+    """
+    sections: list[str] = []
+    start = 0
+    pos = 0
+    fenced = False
+    for line in text.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if stripped.startswith(("```", "~~~")):
+            fenced = not fenced
+        elif (
+            not fenced
+            and stripped.startswith("#")
+            and pos > 0
+            and stripped.lstrip("#")[:1] in (" ", "\t", "\n", "")
+        ):
+            sections.append(text[start:pos])
+            start = pos
+        pos += len(line)
+    sections.append(text[start:])
+    return sections
+
+
+@dataclass
+class Source:
+    """One step's output as included in a prompt."""
+
+    step: str
+    text: str
+    tokens: int
+    original_tokens: int
+    status: str = "full"  # "full", "trimmed", "truncated", "dropped" or "missing"
+
+
+@dataclass
+class Context:
+    """The assembled context for one prompt."""
+
+    #: Included sources, highest priority (the previous step) first
+    sources: list[Source]
+    template_tokens: int
+    max_tokens: int | None
+    #: Sources left out entirely, in the order they were dropped
+    left_out: list[Source] = field(default_factory=list)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.template_tokens + sum(s.tokens for s in self.sources)
+
+    def report(self) -> str:
+        """Return the per-source token report appended to the prompt file."""
+        budget = f"budget {self.max_tokens:,}" if self.max_tokens else "no budget"
+        lines = [f"<!-- aisdlc context (estimated tokens, {budget}):"]
+        lines.append(f"     {'template':24} {self.template_tokens:>8,}")
+        for s in self.sources:
+            note = (
+                ""
+                if s.status == "full"
+                else f"  ({s.status}, was {s.original_tokens:,})"
+            )
+            lines.append(f"     {s.step:24} {s.tokens:>8,}{note}")
+        for s in self.left_out:
+            note = "dropped" if s.status == "dropped" else "missing"
+            lines.append(f"     {s.step:24} {'—':>8}  ({note}, {s.original_tokens:,})")
+        lines.append(f"     {'total':24} {self.total_tokens:>8,}")
+        lines.append("-->")
+        return "\n".join(lines) + "\n"
+
+
+def context_steps(conf: dict[str, Any], step: str) -> list[str]:
+    """Return the extra context steps configured for generating *step*.
+
+    Raises:
+        ValueError: If the configuration is malformed or names a step that
+            does not come before *step*.
+    """
+    table = conf.get(CONTEXT_KEY, {})
+    if not isinstance(table, dict):
+        raise ValueError(f"'{CONTEXT_KEY}' must be a table of step = [steps]")
+    wanted = table.get(step, [])
+    if not isinstance(wanted, list) or not all(isinstance(s, str) for s in wanted):
+        raise ValueError(f"'{CONTEXT_KEY}.\"{step}\"' must be a list of step names")
+    steps = conf["steps"]
+    earlier = steps[: steps.index(step)] if step in steps else []
+    for name in wanted:
+        if name not in earlier:
+            raise ValueError(
+                f"context step '{name}' for '{step}' is not an earlier step"
+            )
+    return wanted
+
+
+def max_tokens(conf: dict[str, Any]) -> int | None:
+    """Return the configured token budget, or None if prompts are unbounded.
+
+    Raises:
+        ValueError: If ``max_tokens`` is not a positive integer.
+    """
+    value = conf.get(MAX_TOKENS_KEY)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(
+            f"'{MAX_TOKENS_KEY}' must be a positive integer, got {value!r}"
+        )
+    return value
+
+
+def assemble(
+    template_text: str,
+    prev: tuple[str, Path],
+    extra: list[tuple[str, Path]],
+    budget: int | None,
+) -> Context:
+    """Read the context sources and trim them to fit *budget*.
+
+    Args:
+        template_text: The template, used to account for its own tokens.
+        prev: ``(step, file)`` of the previous step.
+        extra: ``(step, file)`` of each additional context step, most important first.
+        budget: Token budget for the whole prompt, or None.
+
+    Returns:
+        Context: The sources to include and what was left out.
+
+    Raises:
+        OSError: If the previous step's output cannot be read.
+    """
+    sources = [_load(*prev)]
+    left_out: list[Source] = []
+    for step, path in extra:
+        if step == prev[0]:
+            continue
+        try:
+            sources.append(_load(step, path))
+        except FileNotFoundError:
+            left_out.append(Source(step, "", 0, 0, "missing"))
+    ctx = Context(sources, estimate_tokens(template_text), budget, left_out)
+    if budget is None:
+        return ctx
+
+    # 1. Drop whole context steps, least important first
+    while ctx.total_tokens > budget and len(ctx.sources) > 1:
+        dropped = ctx.sources.pop()
+        dropped.status = "dropped"
+        ctx.left_out.append(dropped)
+
+    # 2. Trim trailing sections, then text, of what is left
+    for source in reversed(ctx.sources):
+        over = ctx.total_tokens - budget
+        if over <= 0:
+            break
+        _trim(source, max(source.tokens - over, 0))
+    return ctx
+
+
+def _load(step: str, path: Path) -> Source:
+    text = path.read_text(encoding="utf-8")
+    tokens = estimate_tokens(text)
+    return Source(step, text, tokens, tokens)
+
+
+def _trim(source: Source, allowed: int) -> None:
+    """Shrink *source* to at most *allowed* tokens."""
+    sections = split_sections(source.text)
+    kept = len(sections)
+    while kept > 1:
+        kept -= 1
+        text = "".join(sections[:kept]).rstrip("\n") + _TRIM_NOTE.format(
+            n=len(sections) - kept
+        )
+        if estimate_tokens(text) <= allowed:
+            source.text, source.tokens, source.status = (
+                text,
+                estimate_tokens(text),
+                "trimmed",
+            )
+            return
+
+    # A single section is still too large: cut the text itself
+    text = source.text[: max(allowed, 0) * 4]
+    while text and estimate_tokens(text + _TRUNCATE_NOTE) > allowed:
+        text = text[: len(text) * 9 // 10]
+    # End on a line, or at least a word, boundary within the last fifth
+    floor = len(text) * 4 // 5
+    cut = text.rfind("\n", floor)
+    if cut <= 0:
+        cut = text.rfind(" ", floor)
+    if cut > 0:
+        text = text[:cut]
+    text = text.rstrip() + _TRUNCATE_NOTE if text.strip() else ""
+    source.text, source.tokens, source.status = text, estimate_tokens(text), "truncated"
@@ -0,0 +1,233 @@
+"""Resident `aisdlc serve` daemon and the thin client used by the entry point.
+
+The daemon keeps the interpreter, the imported command modules and
+stat-validated caches of the parsed config, lock state and compiled prompt
+templates warm, then
+executes ordinary CLI invocations sent to it over a Unix socket.  The client
+side is deliberately import-light so that forwarding a command costs little
+more than a socket round trip.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import socket
+    from pathlib import Path
+
+# Environment variables understood by the client/daemon pair
+SOCKET_ENV = "AISDLC_SOCKET"
+NO_DAEMON_ENV = "AISDLC_NO_DAEMON"
+
+# Only project-related variables are forwarded to the daemon with a request
+_FORWARDED_ENV_PREFIX = "AISDLC_"
+
+_CONNECT_TIMEOUT = 0.5
+
+
+def _socket_file() -> str:
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return override
+    runtime_dir = (
+        os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    )
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(runtime_dir, f"aisdlc-{uid}.sock")
+
+
+def socket_path() -> Path:
+    """Return the Unix socket path the daemon listens on for this user."""
+    from pathlib import Path
+
+    return Path(_socket_file())
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _trusted(st: os.stat_result) -> bool:
+    """Return whether a socket with status *st* may be sent this user's commands.
+
+    The default path can sit in the shared ``/tmp``, where another local user
+    could bind it first, read the forwarded requests and inject output.
+    """
+    return stat.S_ISSOCK(st.st_mode) and (
+        not hasattr(os, "getuid") or st.st_uid == os.getuid()
+    )
+
+
+def _request(
+    payload: dict[str, Any], path: Path | None = None
+) -> dict[str, Any] | None:
+    """Send one request to the daemon and return its reply, or None if it is not running."""
+    target = str(path) if path is not None else _socket_file()
+    try:
+        st = os.stat(target)
+    except OSError:
+        return None  # Common case: answered with a single stat, before any import
+    if not _trusted(st):
+        return None
+    import json
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(_CONNECT_TIMEOUT)
+        conn.connect(target)
+        conn.settimeout(None)
+        conn.sendall(json.dumps(payload).encode("utf-8"))
+        conn.shutdown(socket.SHUT_WR)
+        reply = _recv_all(conn)
+    except OSError:
+        return None
+    finally:
+        conn.close()
+    try:
+        return json.loads(reply)  # type: ignore[no-any-return]
+    except json.JSONDecodeError:
+        return None
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run *argv* in the resident daemon, if one is reachable.
+
+    Args:
+        argv: Command-line arguments without the program name.
+
+    Returns:
+        int | None: The command's exit code, or None when the caller should
+        fall back to in-process execution.
+    """
+    if os.environ.get(NO_DAEMON_ENV):
+        return None
+    env = {k: v for k, v in os.environ.items() if k.startswith(_FORWARDED_ENV_PREFIX)}
+    reply = _request({"op": "run", "argv": argv, "cwd": os.getcwd(), "env": env})
+    if reply is None:
+        return None
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.stdout.flush()
+    return int(reply.get("code", 1))
+
+
+def stop(path: Path | None = None) -> bool:
+    """Ask a running daemon to exit. Returns False if none was reachable."""
+    return _request({"op": "shutdown"}, path) is not None
+
+
+# --- Server side --------------------------------------------------------------
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _run_request(argv: list[str], cwd: str, env: dict[str, str]) -> dict[str, Any]:
+    """Execute one CLI invocation inside the daemon and capture its output."""
+    import contextlib
+    import io
+    import traceback
+
+    from ai_sdlc import cli, utils
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_env = {
+        k: v for k, v in os.environ.items() if k.startswith(_FORWARDED_ENV_PREFIX)
+    }
+    code = 0
+    try:
+        os.chdir(cwd)
+        for key in saved_env:
+            del os.environ[key]
+        os.environ.update(env)
+        utils.set_root(utils.find_project_root())
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                cli.run(argv)
+            except SystemExit as e:
+                code = _exit_code(e)
+            except Exception:  # Report command crashes to the client, keep serving
+                traceback.print_exc()
+                code = 1
+    except OSError as e:
+        stderr.write(f"❌ Error: aisdlc daemon could not run command in '{cwd}': {e}\n")
+        code = 1
+    finally:
+        for key in env:
+            os.environ.pop(key, None)
+        os.environ.update(saved_env)
+    return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "code": code}
+
+
+def serve(path: Path | None = None) -> None:
+    """Listen on the daemon socket and execute requests until told to stop.
+
+    Requests are handled one at a time: commands change the working directory
+    and redirect standard streams, both of which are process-wide.
+
+    Raises:
+        OSError: If the socket cannot be bound.
+    """
+    import json
+    import socketserver
+    import threading
+
+    from ai_sdlc import utils
+
+    path = path or socket_path()
+    if path.exists():
+        if _request({"op": "ping"}, path) is not None:
+            raise OSError(f"an aisdlc daemon is already listening on {path}")
+        path.unlink()  # Stale socket left behind by a killed daemon
+
+    utils.enable_file_cache()
+    original_cwd = os.getcwd()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                request = json.loads(self.rfile.read())
+            except json.JSONDecodeError:
+                return
+            op = request.get("op")
+            if op == "run":
+                reply = _run_request(
+                    request["argv"], request["cwd"], request.get("env", {})
+                )
+                os.chdir(original_cwd)
+            elif op == "shutdown":
+                reply = {"ok": True}
+                # shutdown() blocks until serve_forever returns, so call it elsewhere
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                reply = {"ok": True}
+            self.wfile.write(json.dumps(reply).encode("utf-8"))
+
+    old_umask = os.umask(0o177)  # Socket is only usable by the current user
+    try:
+        server = socketserver.UnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(old_umask)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
@@ -0,0 +1,274 @@
+"""Per-workstream event history and its incremental aggregation for `aisdlc stats`.
+
+Every workstream directory holds an append-only ``.events.jsonl`` with one
+JSON object per line::
+
+    {"t": 1760000000.123, "event": "entered", "step": "1-prd"}
+
+Events:
+
+* ``entered``  – the workstream moved to ``step`` (`new`, `next`, `run`, ...);
+* ``prompt``   – the prompt for ``step`` was generated (``bytes``);
+* ``output``   – the output file of ``step`` was detected (``bytes``);
+* ``archived`` – `aisdlc done` archived the workstream.
+
+The file travels with the workstream into ``done_dir`` (or its zip archive),
+so the history of finished work stays available.  Recording is best effort:
+a read-only checkout never fails a command because of it.
+
+`collect` folds the logs into per-workstream `Facts` cached in
+``.aisdlc-cache/stats.json``.  Logs only grow, so a log whose size changed
+is read from the offset reached last time, and archived logs are parsed once.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ai_sdlc.utils import (
+    CACHE_DIR,
+    DEFAULT_ACTIVE_DIR,
+    DEFAULT_DONE_DIR,
+    atomic_write_text,
+    get_root,
+)
+
+EVENTS_FILE = ".events.jsonl"
+STATS_CACHE_FILE = "stats.json"
+
+_FORMAT = 1
+
+
+def _line(event: str, fields: dict[str, Any]) -> str:
+    record = {"t": round(time.time(), 3), "event": event, **fields}
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _append(workdir: Path, text: str) -> None:
+    # One O_APPEND write per call keeps concurrent writers' lines intact
+    try:
+        fd = os.open(
+            workdir / EVENTS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        try:
+            os.write(fd, text.encode("utf-8"))
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # History is best effort
+
+
+def record(workdir: Path, event: str, **fields: Any) -> None:
+    """Append *event* with *fields* to the history of the workstream in *workdir*."""
+    _append(workdir, _line(event, fields))
+
+
+@contextlib.contextmanager
+def provisional(workdir: Path, event: str, **fields: Any) -> Iterator[None]:
+    """Record *event* for the files the block packs, and take it back if the block fails."""
+    log = workdir / EVENTS_FILE
+    try:
+        size: int | None = log.stat().st_size
+    except OSError:
+        size = None
+    record(workdir, event, **fields)
+    try:
+        yield
+    except BaseException:
+        with contextlib.suppress(OSError):
+            if size is None:
+                log.unlink()
+            else:
+                os.truncate(log, size)
+        raise
+
+
+def _size(path: Path) -> int | None:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def prompt_generated(prompt: Path, step: str) -> None:
+    """Record that *prompt* was generated for *step*."""
+    record(prompt.parent, "prompt", step=step, bytes=_size(prompt))
+
+
+def step_completed(output: Path, step: str) -> None:
+    """Record that *output* of *step* was detected and the workstream entered *step*."""
+    fields = {"step": step}
+    _append(
+        output.parent,
+        _line("output", {**fields, "bytes": _size(output)}) + _line("entered", fields),
+    )
+
+
+# --- Aggregation ---------------------------------------------------------------
+
+
+@dataclass
+class Facts:
+    """What one workstream's history says, reduced to what `aisdlc stats` needs."""
+
+    #: Time the workstream (last) entered each step
+    entered: dict[str, float] = field(default_factory=dict)
+    #: Size of the (last) prompt and output of each step
+    prompt_bytes: dict[str, int] = field(default_factory=dict)
+    output_bytes: dict[str, int] = field(default_factory=dict)
+    archived: float | None = None
+
+    def fold(self, data: bytes) -> None:
+        """Apply the complete event lines in *data*; malformed lines are skipped."""
+        for raw in data.splitlines():
+            try:
+                ev = json.loads(raw)
+                t, kind, step = float(ev["t"]), ev["event"], ev.get("step")
+            except (ValueError, KeyError, TypeError):
+                continue
+            if kind == "entered" and isinstance(step, str):
+                self.entered[step] = t
+            elif kind in ("prompt", "output") and isinstance(step, str):
+                size = ev.get("bytes")
+                if isinstance(size, int):
+                    target = (
+                        self.prompt_bytes if kind == "prompt" else self.output_bytes
+                    )
+                    target[step] = size
+            elif kind == "archived":
+                self.archived = t
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Facts:
+        return cls(
+            dict(data.get("entered", {})),
+            dict(data.get("prompt_bytes", {})),
+            dict(data.get("output_bytes", {})),
+            data.get("archived"),
+        )
+
+
+_EMPTY = asdict(Facts())
+
+
+def _sources(conf: dict[str, Any], root: Path) -> dict[str, tuple[Path, bool]]:
+    """Return every event log as ``key -> (file, whether it is a zip archive)``."""
+    sources: dict[str, tuple[Path, bool]] = {}
+    for key, default in (
+        ("active_dir", DEFAULT_ACTIVE_DIR),
+        ("done_dir", DEFAULT_DONE_DIR),
+    ):
+        base_name = conf.get(key, default)
+        base = root / base_name
+        try:
+            entries = list(os.scandir(base))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir():
+                sources[f"{base_name}/{entry.name}"] = (
+                    Path(entry.path) / EVENTS_FILE,
+                    False,
+                )
+            elif key == "done_dir" and entry.name.endswith(".zip"):
+                sources[f"{base_name}/{entry.name}"] = (Path(entry.path), True)
+    return sources
+
+
+def _read(path: Path, zipped: bool, offset: int) -> bytes:
+    """Return the complete lines of a log from *offset* on.
+
+    Raises:
+        OSError: If the log cannot be read.
+    """
+    if zipped:
+        from ai_sdlc import archive
+
+        data = archive.read_member(path.parent, path.stem, EVENTS_FILE) or b""
+    else:
+        with path.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+    end = data.rfind(b"\n") + 1  # A line being appended right now is read next time
+    return data[:end]
+
+
+def collect(conf: dict[str, Any], root: Path | None = None) -> dict[str, Facts]:
+    """Return the facts of every workstream with a history, keyed by its location.
+
+    Only logs that changed since the last call are read, and only their new
+    lines; the result is saved back to the stats cache.
+    """
+    root = root or get_root()
+    cache_file = root / CACHE_DIR / STATS_CACHE_FILE
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if not isinstance(cached, dict) or cached.get("format") != _FORMAT:
+            cached = {}
+    except (OSError, ValueError):
+        cached = {}
+    old_entries: dict[str, Any] = cached.get("sources", {})
+
+    entries: dict[str, Any] = {}
+    result: dict[str, Facts] = {}
+    changed = False
+    for key, (path, zipped) in sorted(_sources(conf, root).items()):
+        try:
+            st = path.stat()
+        except OSError:
+            continue  # No history (yet)
+        sig: list[int] | None = [st.st_size, st.st_mtime_ns, st.st_ino]
+        old = old_entries.get(key)
+        if old is not None and old.get("sig") == sig:
+            entries[key] = old
+            if old["facts"] != _EMPTY:
+                result[key] = Facts.from_json(old["facts"])
+            continue
+
+        changed = True
+        facts, offset = Facts(), 0
+        if (
+            old is not None
+            and not zipped
+            and old.get("ino") == st.st_ino
+            and old["offset"] <= st.st_size
+        ):
+            facts, offset = Facts.from_json(old["facts"]), old["offset"]
+        try:
+            data = _read(path, zipped, offset)
+        except OSError:
+            continue
+        facts.fold(data)
+        offset += len(data)
+        if not zipped and offset != st.st_size:
+            # Stopped before a partial last line: read the log again next time
+            sig = None
+        entries[key] = {
+            "sig": sig,
+            "ino": st.st_ino,
+            "offset": offset,
+            "facts": asdict(facts),
+        }
+        # Archives from before the history was recorded have none
+        if entries[key]["facts"] != _EMPTY:
+            result[key] = facts
+
+    if changed or set(entries) != set(old_entries):
+        try:
+            cache_file.parent.mkdir(exist_ok=True)
+            payload = json.dumps(
+                {"format": _FORMAT, "sources": entries}, separators=(",", ":")
+            )
+            atomic_write_text(cache_file, payload, durable=False)
+        except OSError:
+            pass  # The cache only saves time
+    return result
@@ -0,0 +1,137 @@
+"""Step dependencies: lifecycles shaped as a DAG instead of a straight line.
+
+By default every step depends on the one before it in ``steps``.  A
+``[depends]`` table in `.aisdlc` overrides that for individual steps::
+
+    [depends]
+    "7.tests" = ["5.tasks"]        # planned in parallel with 6.tasks-plus
+
+``steps`` stays the canonical order and must list every dependency before
+the steps that need it, which also rules out cycles.  A step is complete
+once its ``<step>-<slug>.md`` exists, and ready once all of its dependencies
+are complete; several steps can be ready at the same time.  The state's
+``current`` step is the last complete step in ``steps`` order, and a
+workstream is finished when every leaf step (one nothing depends on) is.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+DEPENDS_KEY = "depends"
+
+
+def dependencies(conf: dict[str, Any]) -> dict[str, list[str]] | None:
+    """Return the dependencies of every step, or None if the steps are linear.
+
+    Dependencies are listed in ``steps`` order, so the last one is the step
+    whose output fills ``<prev_step>``.
+
+    Raises:
+        ValueError: If the ``depends`` table is malformed, names an unknown
+            step, or makes a step depend on itself or on a later step.
+    """
+    table = conf.get(DEPENDS_KEY)
+    if not table:
+        return None
+    if not isinstance(table, dict):
+        raise ValueError(f"'{DEPENDS_KEY}' must be a table of step = [steps]")
+    steps = conf["steps"]
+    position = {step: i for i, step in enumerate(steps)}
+    for step, needs in table.items():
+        if step not in position:
+            raise ValueError(f"'{DEPENDS_KEY}' names unknown step '{step}'")
+        if not isinstance(needs, list) or not all(isinstance(s, str) for s in needs):
+            raise ValueError(f"'{DEPENDS_KEY}.\"{step}\"' must be a list of step names")
+        if position[step] > 0 and not needs:
+            raise ValueError(f"step '{step}' must depend on at least one step")
+        for need in needs:
+            if position.get(need, len(steps)) >= position[step]:
+                raise ValueError(
+                    f"dependency '{need}' of '{step}' is not an earlier step"
+                )
+
+    deps: dict[str, list[str]] = {}
+    for i, step in enumerate(steps):
+        needs = table.get(step, steps[i - 1 : i])
+        deps[step] = sorted(set(needs), key=position.__getitem__)
+    return deps
+
+
+def completed(workdir: Path, slug: str, steps: list[str]) -> set[str]:
+    """Return the steps whose output file exists in *workdir*."""
+    try:
+        present = set(os.listdir(workdir))
+    except OSError:
+        return set()
+    return {step for step in steps if f"{step}-{slug}.md" in present}
+
+
+def ready(deps: dict[str, list[str]], steps: list[str], done: set[str]) -> list[str]:
+    """Return the incomplete steps whose dependencies are all complete, in order."""
+    return [s for s in steps if s not in done and all(d in done for d in deps[s])]
+
+
+def leaves(deps: dict[str, list[str]], steps: list[str]) -> list[str]:
+    """Return the steps no other step depends on."""
+    needed = {d for needs in deps.values() for d in needs}
+    return [s for s in steps if s not in needed]
+
+
+def ancestors(deps: dict[str, list[str]], step: str) -> set[str]:
+    """Return every step *step* depends on, directly or not."""
+    seen: set[str] = set()
+    todo = list(deps[step])
+    while todo:
+        need = todo.pop()
+        if need not in seen:
+            seen.add(need)
+            todo.extend(deps[need])
+    return seen
+
+
+def latest(steps: list[str], done: set[str]) -> str | None:
+    """Return the last complete step in ``steps`` order."""
+    return next((s for s in reversed(steps) if s in done), None)
+
+
+def render(
+    deps: dict[str, list[str]], steps: list[str], done: set[str], prompts: set[str]
+) -> list[str]:
+    """Draw the steps as a tree, each under its last dependency.
+
+    Other dependencies are noted after the step.  Marks: ✅ complete,
+    📝 prompt generated, ▶ ready, ☐ waiting.
+    """
+    children: dict[str, list[str]] = {}
+    roots = []
+    for step in steps:
+        if deps[step]:
+            children.setdefault(deps[step][-1], []).append(step)
+        else:
+            roots.append(step)
+
+    def mark(step: str) -> str:
+        if step in done:
+            return "✅"
+        if step in prompts:
+            return "📝"
+        return "▶" if all(d in done for d in deps[step]) else "☐"
+
+    lines: list[str] = []
+
+    def walk(step: str, prefix: str, branch: str, last: bool) -> None:
+        also = deps[step][:-1]
+        note = f"  (also needs {', '.join(also)})" if also else ""
+        lines.append(f"{prefix}{branch}{mark(step)} {step}{note}")
+        kids = children.get(step, [])
+        extend = prefix + ("" if not branch else "   " if last else "│  ")
+        for i, kid in enumerate(kids):
+            end = i == len(kids) - 1
+            walk(kid, extend, "└─ " if end else "├─ ", end)
+
+    for root in roots:
+        walk(root, "", "", True)
+    return lines
@@ -0,0 +1,176 @@
+"""Idea lists for `aisdlc new --from-file`: CSV, JSONL and markdown bullet lists.
+
+* **CSV** – a header row, then one idea per row.  The title is read from the
+  ``title``, ``summary`` or ``name`` column (else the first one) and an
+  optional ``body`` or ``description`` column fills the problem section.
+* **JSONL** – one idea per line: a string title, or an object with the same
+  keys as the CSV columns.
+* **Markdown** – one idea per top-level bullet (``-``, ``*``, ``+`` or
+  ``1.``, task boxes allowed); indented lines below a bullet are its body.
+
+Slugs for a whole list are assigned in one pass, in file order: a slug that
+is already taken gets the first free ``-2``, ``-3``, … suffix.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+FORMATS = ("csv", "jsonl", "md")
+
+_SUFFIXES = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".md": "md",
+    ".markdown": "md",
+    ".txt": "md",
+}
+_TITLE_KEYS = ("title", "summary", "name")
+_BODY_KEYS = ("body", "description")
+_BULLET = re.compile(r"(?:[-*+]|\d+[.)])\s+(?:\[[ xX]\]\s+)?(.*)")
+
+
+@dataclass
+class Idea:
+    """One workstream to create."""
+
+    title: str
+    body: str = ""
+
+
+def detect_format(path: Path) -> str | None:
+    """Return the format implied by the extension of *path*, if any."""
+    return _SUFFIXES.get(path.suffix.lower())
+
+
+def _clean(title: str) -> str:
+    return " ".join(title.split())
+
+
+def _pick(record: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    lowered = {k.strip().lower(): v for k, v in record.items() if isinstance(k, str)}
+    return next((lowered[k] for k in keys if k in lowered), None)
+
+
+def _parse_csv(text: str) -> list[Idea]:
+    import csv
+    import io
+
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        return []
+    first = reader.fieldnames[0]
+    ideas = []
+    for row in reader:
+        values = [v for v in row.values() if isinstance(v, str)]
+        if not any(v.strip() for v in values):
+            continue  # Blank row
+        title = _clean(_pick(row, _TITLE_KEYS) or row.get(first) or "")
+        if not title:
+            raise ValueError(f"line {reader.line_num}: empty title")
+        ideas.append(Idea(title, (_pick(row, _BODY_KEYS) or "").strip()))
+    return ideas
+
+
+def _parse_jsonl(text: str) -> list[Idea]:
+    import json
+
+    ideas = []
+    for number, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"line {number}: invalid JSON ({e})") from None
+        if isinstance(record, str):
+            title, body = record, ""
+        elif isinstance(record, dict):
+            title, body = (
+                _pick(record, _TITLE_KEYS) or "",
+                _pick(record, _BODY_KEYS) or "",
+            )
+        else:
+            raise ValueError(f"line {number}: expected a string or an object")
+        if not isinstance(title, str) or not _clean(title):
+            raise ValueError(f"line {number}: no title")
+        if not isinstance(body, str):
+            raise ValueError(f"line {number}: the body must be a string")
+        ideas.append(Idea(_clean(title), body.strip()))
+    return ideas
+
+
+def _parse_markdown(text: str) -> list[Idea]:
+    ideas: list[Idea] = []
+    body: list[str] | None = None  # Lines below the current bullet
+
+    def close() -> None:
+        if body is not None:
+            ideas[-1].body = "\n".join(body).strip("\n")
+
+    for line in text.splitlines():
+        bullet = _BULLET.fullmatch(line.rstrip()) if line[:1] not in " \t" else None
+        if bullet and _clean(bullet.group(1)):
+            close()
+            ideas.append(Idea(_clean(bullet.group(1))))
+            body = []
+        elif body is not None and (not line.strip() or line[:1] in " \t"):
+            body.append(line)
+        else:
+            close()  # Headings and prose between lists end the current idea
+            body = None
+    close()
+    for idea in ideas:
+        lines = idea.body.splitlines()
+        indent = min((len(s) - len(s.lstrip()) for s in lines if s.strip()), default=0)
+        idea.body = "\n".join(s[indent:] for s in lines)
+    return ideas
+
+
+def parse(text: str, fmt: str) -> list[Idea]:
+    """Return the ideas in *text*, written in *fmt* (one of `FORMATS`).
+
+    Raises:
+        ValueError: If *fmt* is unknown or an entry is malformed.
+    """
+    parsers = {"csv": _parse_csv, "jsonl": _parse_jsonl, "md": _parse_markdown}
+    if fmt not in parsers:
+        raise ValueError(
+            f"unknown format '{fmt}' (expected one of: {', '.join(FORMATS)})"
+        )
+    return parsers[fmt](text.removeprefix("\ufeff"))
+
+
+def read(path: Path, fmt: str | None = None) -> list[Idea]:
+    """Read the ideas in *path*, in *fmt* or the format its extension implies.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the format is unknown or an entry is malformed.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt is None:
+        raise ValueError(f"cannot tell the format of '{path.name}'; pass --format")
+    return parse(path.read_text(encoding="utf-8"), fmt)
+
+
+def assign_slugs(slugs: list[str], taken: set[str]) -> list[str]:
+    """Make every slug in *slugs* unique against *taken* and the ones before it.
+
+    The first free ``-2``, ``-3``, … suffix is appended to a slug already in
+    use, so the same list and *taken* always yield the same slugs.
+    """
+    used = set(taken)
+    result = []
+    for base in slugs:
+        slug, n = base, 1
+        while slug in used:
+            n += 1
+            slug = f"{base}-{n}"
+        used.add(slug)
+        result.append(slug)
+    return result
@@ -0,0 +1,578 @@
+"""Asynchronous LLM runner used by `aisdlc run`.
+
+A prompt is sent to the provider configured in the ``[llm]`` table of
+`.aisdlc` and the response is streamed to disk as it arrives.  The bundled
+``openai`` provider speaks the OpenAI-compatible ``/chat/completions`` API
+(OpenAI, Azure/OpenRouter-style gateways, vLLM, llama.cpp, Ollama, ...) over
+a small HTTP/1.1 client built on asyncio streams:
+
+* connections are kept alive and reused across requests (`ConnectionPool`);
+* connecting and every read are bounded by timeouts;
+* connection failures, timeouts and 429/5xx replies are retried with
+  exponential backoff (honouring ``Retry-After``).
+
+Other providers register themselves in `PROVIDERS`.  `ai_sdlc.mock_llm`
+serves the same API locally so the whole flow can run offline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import time
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from ai_sdlc.response_cache import ResponseCache
+
+# Config table holding the runner settings
+LLM_KEY = "llm"
+
+_RETRY_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+_MAX_BACKOFF = 30.0
+
+
+class LLMError(Exception):
+    """A prompt could not be completed."""
+
+
+class HTTPError(LLMError):
+    """The endpoint answered with an error status."""
+
+    def __init__(
+        self, status: int, body: str, retry_after: float | None = None
+    ) -> None:
+        super().__init__(f"HTTP {status}: {body[:200].strip() or 'no details'}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+@dataclass
+class Settings:
+    """The ``[llm]`` settings of a project."""
+
+    provider: str = "openai"
+    base_url: str = "https://api.openai.com/v1"
+    model: str = "gpt-4o-mini"
+    #: Environment variable holding the API key (no auth header if unset)
+    api_key_env: str = "OPENAI_API_KEY"
+    system: str | None = None
+    temperature: float | None = None
+    max_output_tokens: int | None = None
+    #: Seconds to wait for the connection and then for each piece of the response
+    connect_timeout: float = 10.0
+    timeout: float = 120.0
+    retries: int = 3
+    backoff: float = 1.0
+    #: Response cache (see `ai_sdlc.response_cache`)
+    cache: bool = True
+    cache_max_mb: float = 256.0
+    cache_max_age_days: float = 30.0
+
+    def sampling(self) -> dict[str, Any]:
+        """Return the parameters that influence the model's output."""
+        return {
+            "provider": self.provider,
+            "base_url": self.base_url,
+            "model": self.model,
+            "system": self.system,
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_output_tokens,
+        }
+
+
+def settings(conf: dict[str, Any]) -> Settings:
+    """Return the runner settings of *conf*.
+
+    Raises:
+        ValueError: If the ``[llm]`` table is malformed.
+    """
+    table = conf.get(LLM_KEY, {})
+    if not isinstance(table, dict):
+        raise ValueError(f"'{LLM_KEY}' must be a table")
+    unknown = sorted(set(table) - {f.name for f in fields(Settings)})
+    if unknown:
+        raise ValueError(f"unknown '{LLM_KEY}' setting(s): {', '.join(unknown)}")
+    result = Settings(**table)
+    if result.provider not in PROVIDERS:
+        raise ValueError(
+            f"unknown {LLM_KEY}.provider '{result.provider}' "
+            f"(available: {', '.join(sorted(PROVIDERS))})"
+        )
+    for name in (
+        "connect_timeout",
+        "timeout",
+        "backoff",
+        "cache_max_mb",
+        "cache_max_age_days",
+    ):
+        value = getattr(result, name)
+        if isinstance(value, bool) or not isinstance(value, int | float) or value < 0:
+            raise ValueError(f"'{LLM_KEY}.{name}' must be a non-negative number")
+    retries = result.retries
+    if isinstance(retries, bool) or not isinstance(retries, int) or retries < 0:
+        raise ValueError(f"'{LLM_KEY}.retries' must be a non-negative integer")
+    if not isinstance(result.cache, bool):
+        raise ValueError(f"'{LLM_KEY}.cache' must be true or false")
+    if not result.base_url.startswith(("http://", "https://")):
+        raise ValueError(f"'{LLM_KEY}.base_url' must be an http:// or https:// URL")
+    return result
+
+
+# --- HTTP/1.1 over asyncio streams ---------------------------------------------
+
+_Key = tuple[str, str, int]
+_Conn = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+def _split_url(url: str) -> tuple[_Key, str]:
+    from urllib.parse import urlsplit
+
+    parts = urlsplit(url)
+    scheme = parts.scheme
+    port = parts.port or (443 if scheme == "https" else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+    return (scheme, parts.hostname or "localhost", port), path
+
+
+class ConnectionPool:
+    """Keep-alive connections, reused by host."""
+
+    def __init__(self, connect_timeout: float = 10.0) -> None:
+        self.connect_timeout = connect_timeout
+        self._idle: dict[_Key, list[_Conn]] = {}
+        self.opened = 0
+
+    async def acquire(self, key: _Key) -> tuple[_Conn, bool]:
+        """Return an idle connection to *key* (and True), or a new one (and False)."""
+        idle = self._idle.get(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return (reader, writer), True
+            writer.close()
+        scheme, host, port = key
+        ssl_context: Any = None
+        if scheme == "https":
+            import ssl
+
+            ssl_context = ssl.create_default_context()
+        conn = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context), self.connect_timeout
+        )
+        self.opened += 1
+        return conn, False
+
+    def release(self, key: _Key, conn: _Conn) -> None:
+        """Return a connection whose response was read completely."""
+        self._idle.setdefault(key, []).append(conn)
+
+    async def close(self) -> None:
+        """Close every idle connection."""
+        for conns in self._idle.values():
+            for _, writer in conns:
+                writer.close()
+                with contextlib.suppress(OSError, asyncio.TimeoutError):
+                    await asyncio.wait_for(writer.wait_closed(), 1)
+        self._idle.clear()
+
+
+class Response:
+    """A response whose body is read incrementally."""
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        key: _Key,
+        conn: _Conn,
+        status: int,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self._pool = pool
+        self._key = key
+        self._conn: _Conn | None = conn
+        self._timeout = timeout
+
+    async def _read(self, coro: Any) -> Any:
+        return await asyncio.wait_for(coro, self._timeout)
+
+    async def chunks(self) -> AsyncGenerator[bytes, None]:
+        """Yield the body as it arrives, then return the connection to the pool."""
+        assert self._conn is not None
+        reader = self._conn[0]
+        reusable = self.headers.get("connection", "").lower() != "close"
+        try:
+            if self.headers.get("transfer-encoding", "").lower() == "chunked":
+                while True:
+                    size_line = await self._read(reader.readuntil(b"\r\n"))
+                    size = int(size_line.split(b";", 1)[0], 16)
+                    if size == 0:
+                        while await self._read(reader.readuntil(b"\r\n")) != b"\r\n":
+                            pass  # Trailer fields
+                        break
+                    data = await self._read(reader.readexactly(size + 2))
+                    yield data[:-2]
+            elif "content-length" in self.headers:
+                remaining = int(self.headers["content-length"])
+                while remaining:
+                    data = await self._read(reader.read(min(remaining, 65536)))
+                    if not data:
+                        raise asyncio.IncompleteReadError(b"", remaining)
+                    remaining -= len(data)
+                    yield data
+            else:
+                reusable = False  # The body ends when the server closes the connection
+                while data := await self._read(reader.read(65536)):
+                    yield data
+        except BaseException:
+            reusable = False
+            raise
+        finally:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                if reusable:
+                    self._pool.release(self._key, conn)
+                else:
+                    conn[1].close()
+
+    async def text(self) -> str:
+        """Return the whole body as text."""
+        return b"".join([c async for c in self.chunks()]).decode("utf-8", "replace")
+
+
+async def request(
+    pool: ConnectionPool,
+    method: str,
+    url: str,
+    body: bytes,
+    headers: dict[str, str],
+    timeout: float,
+) -> Response:
+    """Send one HTTP/1.1 request and return once the response headers arrived.
+
+    Raises:
+        OSError: If the connection fails.
+        TimeoutError: If connecting or reading the headers times out.
+        asyncio.IncompleteReadError: If the server closes the connection early.
+    """
+    key, path = _split_url(url)
+    scheme, host, port = key
+    default_port = 443 if scheme == "https" else 80
+    lines = [
+        f"{method} {path} HTTP/1.1",
+        f"Host: {host}" + (f":{port}" if port != default_port else ""),
+        f"Content-Length: {len(body)}",
+        "Connection: keep-alive",
+        *(f"{k}: {v}" for k, v in headers.items()),
+    ]
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+    while True:
+        conn, reused = await pool.acquire(key)
+        reader, writer = conn
+        try:
+            writer.write(head + body)
+            await asyncio.wait_for(writer.drain(), timeout)
+            raw = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+        except (OSError, asyncio.IncompleteReadError):
+            writer.close()
+            if reused:
+                continue  # The server closed an idle connection: use a fresh one
+            raise
+        except BaseException:
+            writer.close()
+            raise
+        break
+    status_line, *header_lines = raw.decode("latin-1").split("\r\n")
+    status = int(status_line.split(" ", 2)[1])
+    response_headers = {}
+    for line in header_lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            response_headers[name.strip().lower()] = value.strip()
+    return Response(pool, key, conn, status, response_headers, timeout)
+
+
+# --- Providers -------------------------------------------------------------------
+
+
+class Provider(Protocol):
+    """Turns a prompt into a stream of response text."""
+
+    def stream(self, prompt: str) -> AsyncGenerator[str, None]:
+        """Yield the response to *prompt* piece by piece.
+
+        Raises:
+            HTTPError: If the endpoint rejects the request.
+            LLMError: If the response is malformed.
+            OSError, TimeoutError: On connection problems (retried by the caller).
+        """
+        ...
+
+
+def chat_body(
+    settings: Settings, prompt: str, *, stream: bool = False
+) -> dict[str, Any]:
+    """Return the ``/chat/completions`` request body sending *prompt* with *settings*."""
+    s = settings
+    messages = [{"role": "system", "content": s.system}] if s.system else []
+    messages.append({"role": "user", "content": prompt})
+    body: dict[str, Any] = {"model": s.model, "messages": messages}
+    if stream:
+        body["stream"] = True
+    if s.temperature is not None:
+        body["temperature"] = s.temperature
+    if s.max_output_tokens is not None:
+        body["max_tokens"] = s.max_output_tokens
+    return body
+
+
+class OpenAIProvider:
+    """Streaming ``/chat/completions`` of any OpenAI-compatible endpoint."""
+
+    def __init__(self, settings: Settings, pool: ConnectionPool) -> None:
+        self.settings = settings
+        self.pool = pool
+
+    def _payload(self, prompt: str) -> bytes:
+        import json
+
+        return json.dumps(chat_body(self.settings, prompt, stream=True)).encode("utf-8")
+
+    async def stream(self, prompt: str) -> AsyncGenerator[str, None]:
+        s = self.settings
+        headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+        api_key = os.environ.get(s.api_key_env) if s.api_key_env else None
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        url = s.base_url.rstrip("/") + "/chat/completions"
+        response = await request(
+            self.pool, "POST", url, self._payload(prompt), headers, s.timeout
+        )
+        if response.status >= 400:
+            retry_after = response.headers.get("retry-after")
+            body = await response.text()
+            raise HTTPError(
+                response.status,
+                body,
+                float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+
+        # Server-sent events: "data: {json}" lines, terminated by "data: [DONE]"
+        buffer = b""
+        finished = False
+        async with contextlib.aclosing(response.chunks()) as chunks:
+            async for chunk in chunks:
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    line = line.strip()
+                    if finished or not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == b"[DONE]":
+                        finished = True
+                        continue
+                    delta = _delta(data)
+                    if delta:
+                        yield delta
+        if not finished:
+            raise asyncio.IncompleteReadError(buffer, None)
+
+
+def _delta(data: bytes) -> str | None:
+    """Return the text of one streamed chat completion event."""
+    import json
+
+    try:
+        event = json.loads(data)
+    except ValueError:
+        raise LLMError(f"malformed stream event: {data[:200]!r}") from None
+    if isinstance(event, dict) and "error" in event:
+        raise LLMError(f"provider error: {event['error']}")
+    try:
+        choices = event["choices"]
+        if choices == []:
+            return None  # Usage or prompt filter results, sent without a choice
+        content = choices[0].get("delta", {}).get("content")
+    except (KeyError, IndexError, TypeError, AttributeError):
+        raise LLMError(f"malformed stream event: {data[:200]!r}") from None
+    return content if isinstance(content, str) else None
+
+
+PROVIDERS: dict[str, Callable[[Settings, ConnectionPool], Provider]] = {
+    "openai": OpenAIProvider,
+}
+
+
+# --- Running prompts ----------------------------------------------------------
+
+
+@dataclass
+class RunResult:
+    """Statistics of one completed prompt."""
+
+    chars: int
+    #: Model calls made (0 when answered from the response cache)
+    attempts: int
+    seconds: float
+    first_token_seconds: float | None
+    #: Extra details reported by wrappers (e.g. a response cache)
+    notes: list[str] = field(default_factory=list)
+
+
+def _retryable(exc: BaseException) -> bool:
+    if isinstance(exc, HTTPError):
+        return exc.status in _RETRY_STATUS
+    return isinstance(exc, OSError | TimeoutError | asyncio.IncompleteReadError)
+
+
+def part_file(out: Path) -> Path:
+    """Return the file a response to *out* is streamed into before completion."""
+    return out.with_name(out.name + ".part")
+
+
+class Client:
+    """Runs prompts against one provider, reusing its connections.
+
+    Use as an async context manager so pooled connections are closed.
+
+    Args:
+        settings: The ``[llm]`` settings.
+        cache: Response cache to answer from and store into, or None.
+        refresh: Ignore stored responses (but still store new ones).
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        cache: ResponseCache | None = None,
+        *,
+        refresh: bool = False,
+    ) -> None:
+        self.settings = settings
+        self.cache = cache
+        self.refresh = refresh
+        self.pool = ConnectionPool(settings.connect_timeout)
+        self.provider = PROVIDERS[settings.provider](settings, self.pool)
+
+    async def __aenter__(self) -> Client:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.pool.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    async def complete_to_file(
+        self, prompt: str, out: Path, echo: Callable[[str], None] | None = None
+    ) -> RunResult:
+        """Stream the response to *prompt* into *out*.
+
+        The text is written to ``<out>.part`` as it arrives (follow it with
+        ``tail -f``) and renamed to *out* once complete, so tools watching
+        for *out* never see a partial response.  A failed attempt is retried
+        from scratch.  With a cache, a stored response to the same prompt and
+        settings is written instead of calling the model.
+
+        Args:
+            prompt: The merged prompt.
+            out: Destination file.
+            echo: Called with each piece of text as it arrives.
+
+        Raises:
+            LLMError: If the prompt cannot be completed, after retries.
+            OSError: If the output cannot be written.
+        """
+        import random
+
+        s = self.settings
+        part = part_file(out)
+        start = time.perf_counter()
+        key = None
+        if self.cache is not None:
+            from ai_sdlc.response_cache import cache_key
+
+            key = cache_key(prompt, s.sampling())
+            cached = None if self.refresh else self._lookup(key)
+            if cached is not None:
+                part.write_text(cached, encoding="utf-8")
+                os.replace(part, out)
+                if echo is not None:
+                    echo(cached)
+                seconds = time.perf_counter() - start
+                return RunResult(len(cached), 0, seconds, None, ["response cache hit"])
+
+        attempt = 0
+        while True:
+            attempt += 1
+            first_token: float | None = None
+            pieces_seen: list[str] = []
+            try:
+                stream = contextlib.aclosing(self.provider.stream(prompt))
+                with part.open("w", encoding="utf-8") as f:
+                    async with stream as pieces:
+                        async for piece in pieces:
+                            if first_token is None:
+                                first_token = time.perf_counter() - start
+                            f.write(piece)
+                            f.flush()
+                            pieces_seen.append(piece)
+                            if echo is not None:
+                                echo(piece)
+                os.replace(part, out)
+                text = "".join(pieces_seen)
+                notes = []
+                if self.cache is not None and key is not None:
+                    self._store(key, text)
+                    notes.append(
+                        f"response cache {'refreshed' if self.refresh else 'miss'}"
+                    )
+                seconds = time.perf_counter() - start
+                return RunResult(len(text), attempt, seconds, first_token, notes)
+            except Exception as e:
+                with contextlib.suppress(OSError):
+                    part.unlink()  # Also before a retry, which may be cancelled
+                if not _retryable(e) or attempt > s.retries:
+                    if isinstance(e, LLMError):
+                        raise
+                    reason = str(e) or type(e).__name__
+                    raise LLMError(f"{reason} (after {attempt} attempt(s))") from e
+                delay = min(s.backoff * 2 ** (attempt - 1), _MAX_BACKOFF)
+                delay += random.uniform(0, delay / 4)  # Spread out concurrent retries
+                if isinstance(e, HTTPError) and e.retry_after is not None:
+                    delay = max(delay, min(e.retry_after, _MAX_BACKOFF))
+                if echo is not None:
+                    echo(
+                        f"\n[retrying in {delay:.1f}s: {str(e) or type(e).__name__}]\n"
+                    )
+                await asyncio.sleep(delay)
+            except BaseException:  # Ctrl-C, or cancelled with the other branches
+                with contextlib.suppress(OSError):
+                    part.unlink()
+                raise
+
+    def _lookup(self, key: str) -> str | None:
+        import sqlite3
+
+        assert self.cache is not None
+        try:
+            return self.cache.get(key)
+        except sqlite3.Error:
+            return None  # E.g. locked by another process for too long: call the model
+
+    def _store(self, key: str, text: str) -> None:
+        # Best effort: a full disk or locked cache must not fail a completed step
+        import sqlite3
+
+        assert self.cache is not None
+        with contextlib.suppress(OSError, sqlite3.Error):
+            self.cache.put(key, text, self.settings.model)
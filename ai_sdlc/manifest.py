@@ -0,0 +1,231 @@
+"""Cached manifest of every workstream, for `aisdlc status --all`.
+
+``.aisdlc-cache/manifest.json`` records, for each workstream directory (or
+archive) under the active and done directories, its file names with their
+modification times.  A refresh stats each base directory and each
+workstream, and only lists the workstreams whose directory mtime changed –
+adding, removing or renaming a step or prompt file changes it, so a project
+with thousands of workstreams costs one ``stat`` per workstream instead of a
+directory listing plus a ``stat`` per file.
+
+Files edited in place keep their directory's mtime, so a step's age is the
+time its file was last written when the directory last changed.  Like the
+other caches, the manifest is derived data and safe to delete.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ai_sdlc.utils import (
+    _RACY_WINDOW_NS,
+    CACHE_DIR,
+    DEFAULT_ACTIVE_DIR,
+    DEFAULT_DONE_DIR,
+    atomic_write_text,
+    get_root,
+    step_of_file,
+)
+
+MANIFEST_FILE = "manifest.json"
+
+# Bump when the entry format changes so stale manifests are ignored
+_FORMAT = 1
+
+PROMPT_PREFIX = "_prompt-"
+
+
+@dataclass
+class Workstream:
+    """What the manifest knows about one workstream."""
+
+    slug: str
+    done: bool
+    #: Modification time (ns) of each step's output file, by step name
+    step_mtimes: dict[str, int]
+    #: Prompt files whose step output does not exist yet
+    pending_prompts: list[str]
+
+    def current_step(self, steps: list[str]) -> str | None:
+        """Return the last of *steps* whose output file exists."""
+        current = None
+        for step in steps:
+            if step in self.step_mtimes:
+                current = step
+        return current
+
+
+@dataclass
+class Snapshot:
+    """The result of `refresh`."""
+
+    workstreams: list[Workstream]
+    #: Workstreams whose directory had to be listed again
+    rescanned: int = 0
+
+
+def manifest_path(root: Path | None = None) -> Path:
+    """Return the manifest file of the project at *root* (default: current)."""
+    return (root or get_root()) / CACHE_DIR / MANIFEST_FILE
+
+
+def _load(path: Path) -> dict[str, Any]:
+    import json
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != _FORMAT:
+        return {}
+    return data
+
+
+def _signature(st: os.stat_result, racy_after: int) -> list[int] | None:
+    # A directory changed within the racy window may change again without its
+    # mtime changing: leave it unsigned so the next refresh lists it again
+    if st.st_mtime_ns > racy_after:
+        return None
+    return [st.st_mtime_ns, st.st_ino]
+
+
+def _list_dir(path: str) -> dict[str, int]:
+    files = {}
+    for entry in os.scandir(path):
+        if entry.is_file():
+            files[entry.name] = entry.stat().st_mtime_ns
+    return files
+
+
+def _list_archive(path: str, slug: str) -> dict[str, int]:
+    import zipfile
+
+    prefix = f"{slug}/"
+    files = {}
+    try:
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if info.filename.startswith(prefix) and not info.is_dir():
+                    mtime = time.mktime((*info.date_time, 0, 0, -1))
+                    files[info.filename[len(prefix) :]] = int(mtime * 1_000_000_000)
+    except (OSError, zipfile.BadZipFile):
+        pass
+    return files
+
+
+def _workstream(
+    slug: str, done: bool, files: dict[str, int], steps: list[str]
+) -> Workstream:
+    step_mtimes = {}
+    prompts = []
+    for name, mtime_ns in files.items():
+        step = step_of_file(name, slug, steps)
+        if step is not None:
+            step_mtimes[step] = mtime_ns
+        elif name.startswith(PROMPT_PREFIX) and name.endswith(".md"):
+            prompts.append(name)
+    pending = sorted(
+        name for name in prompts if name[len(PROMPT_PREFIX) : -3] not in step_mtimes
+    )
+    return Workstream(slug, done, step_mtimes, pending)
+
+
+def refresh(
+    conf: dict[str, Any], root: Path | None = None, *, include_done: bool = False
+) -> Snapshot:
+    """Bring the manifest up to date and return every workstream in it.
+
+    Args:
+        conf: Project configuration.
+        root: Project root (default: current).
+        include_done: Also cover the done directory, including zip archives.
+
+    Returns:
+        Snapshot: Workstreams sorted by slug, active ones first.
+    """
+    root = root or get_root()
+    steps = conf["steps"]
+    path = manifest_path(root)
+    old = _load(path)
+    old_bases: dict[str, Any] = old.get("bases", {})
+    old_entries: dict[str, Any] = old.get("entries", {})
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+
+    bases: dict[str, Any] = {}
+    entries: dict[str, Any] = {}
+    snapshot = Snapshot([])
+    dirs = [(conf.get("active_dir", DEFAULT_ACTIVE_DIR), False)]
+    if include_done:
+        dirs.append((conf.get("done_dir", DEFAULT_DONE_DIR), True))
+    covered = {rel for rel, _ in dirs}
+    for rel, done in dirs:
+        base = root / rel
+        try:
+            st = base.stat()
+        except OSError:
+            continue
+        sig = _signature(st, racy_after)
+        cached = old_bases.get(rel)
+        if sig is not None and cached is not None and cached.get("sig") == sig:
+            names = cached["names"]
+        else:
+            names = sorted(
+                e.name
+                for e in os.scandir(base)
+                if not e.name.startswith(".")
+                and (e.is_dir() or (done and e.is_file() and e.name.endswith(".zip")))
+            )
+        bases[rel] = {"sig": sig, "names": names}
+
+        for name in names:
+            key = f"{rel}/{name}"
+            entry_path = str(base / name)
+            archived = done and name.endswith(".zip")
+            slug = name[:-4] if archived else name
+            try:
+                st = os.stat(entry_path)
+            except OSError:
+                continue  # Removed since the base directory was listed
+            sig = _signature(st, racy_after)
+            cached = old_entries.get(key)
+            if sig is not None and cached is not None and cached.get("sig") == sig:
+                files = cached["files"]
+            else:
+                snapshot.rescanned += 1
+                try:
+                    files = (
+                        _list_archive(entry_path, slug)
+                        if archived
+                        else _list_dir(entry_path)
+                    )
+                except OSError:
+                    continue
+            entries[key] = {"sig": sig, "files": files}
+            snapshot.workstreams.append(_workstream(slug, done, files, steps))
+
+    # Keep what an earlier refresh recorded for the directories not covered now
+    for rel, cached in old_bases.items():
+        if rel not in covered:
+            bases[rel] = cached
+            entries.update(
+                {k: v for k, v in old_entries.items() if k.startswith(f"{rel}/")}
+            )
+
+    if bases != old_bases or entries != old_entries:
+        _save(path, {"format": _FORMAT, "bases": bases, "entries": entries})
+    return snapshot
+
+
+def _save(path: Path, data: dict[str, Any]) -> None:
+    # Best effort: a read-only checkout must not break `status`
+    import json
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(path, json.dumps(data, separators=(",", ":")), durable=False)
+    except OSError:
+        pass
@@ -0,0 +1,271 @@
+"""Local mock of an OpenAI-compatible chat completions endpoint.
+
+Lets `aisdlc run` be exercised offline – in tests, demos or CI::
+
+    python -m ai_sdlc.mock_llm --port 8765
+
+and in `.aisdlc`::
+
+    [llm]
+    base_url = "http://127.0.0.1:8765/v1"
+
+``POST /v1/chat/completions`` answers with a deterministic markdown document
+derived from the prompt, streamed word by word as server-sent events when
+``"stream": true`` is requested.  Connections are kept alive, and the server
+can be told to fail its first requests or to pause between words in order
+to exercise retries and timeouts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import sys
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+DEFAULT_PORT = 8765
+
+
+def reply_for(prompt: str, model: str) -> str:
+    """Return the mock's deterministic answer to *prompt*."""
+    lines = [line.strip() for line in prompt.splitlines() if line.strip()]
+    heading = next(
+        (line.lstrip("# ") for line in lines if line.startswith("#")), "Response"
+    )
+    return (
+        f"# {heading}\n\n"
+        f"Mock response from `{model}` to a prompt of {len(prompt.split())} words.\n\n"
+        + "".join(f"- {line}\n" for line in lines[:3])
+    )
+
+
+class MockServer:
+    """An asyncio HTTP/1.1 server speaking the chat completions API.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on (0 picks a free one).
+        fail_first: Answer this many requests with ``503 Service Unavailable``.
+        delay: Seconds to pause before each streamed word.
+        empty_choices: Open each stream with a prompt filter event (as Azure
+            OpenAI does) and close it with a usage event (as OpenAI does with
+            ``include_usage``), both with an empty ``choices`` list.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        *,
+        fail_first: int = 0,
+        delay: float = 0.0,
+        empty_choices: bool = False,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.fail_first = fail_first
+        self.delay = delay
+        self.empty_choices = empty_choices
+        self.requests = 0
+        self.connections = 0
+        self.prompts: list[str] = []
+        self._server: asyncio.Server | None = None
+        self._handlers: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def start(self) -> None:
+        """Start listening; ``port`` is updated if it was 0."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop listening, drop open connections and wait for their handlers."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in self._handlers.values():
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        task = asyncio.current_task()
+        assert task is not None
+        self._handlers[task] = writer
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return  # Client closed the keep-alive connection
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                await self._respond(writer, request_line, body)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+            del self._handlers[task]
+
+    async def _respond(
+        self, writer: asyncio.StreamWriter, request_line: str, body: bytes
+    ) -> None:
+        self.requests += 1
+        method, path = request_line.split(" ")[:2]
+        if method != "POST" or path.split("?", 1)[0] != "/v1/chat/completions":
+            _send(writer, 404, {"error": {"message": f"no route for {method} {path}"}})
+            return
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            _send(
+                writer,
+                503,
+                {"error": {"message": "mock overloaded"}},
+                {"Retry-After": "0"},
+            )
+            return
+        try:
+            payload = json.loads(body)
+            prompt = "\n".join(str(m["content"]) for m in payload["messages"])
+        except (ValueError, KeyError, TypeError):
+            _send(writer, 400, {"error": {"message": "malformed request"}})
+            return
+        self.prompts.append(prompt)
+        model = str(payload.get("model", "mock"))
+        text = reply_for(prompt, model)
+        if not payload.get("stream"):
+            message = {"role": "assistant", "content": text}
+            _send(
+                writer,
+                200,
+                {"model": model, "choices": [{"index": 0, "message": message}]},
+            )
+            return
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\nConnection: keep-alive\r\n\r\n"
+        )
+        if self.empty_choices:
+            opening = {"choices": [], "prompt_filter_results": [{"prompt_index": 0}]}
+            _chunk(writer, f"data: {json.dumps(opening)}\n\n".encode())
+        for word in _words(text):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            event = {
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": word}}],
+            }
+            _chunk(writer, f"data: {json.dumps(event)}\n\n".encode())
+            await writer.drain()
+        if self.empty_choices:
+            usage = {"prompt_tokens": len(prompt.split()), "completion_tokens": 0}
+            closing = {"model": model, "choices": [], "usage": usage}
+            _chunk(writer, f"data: {json.dumps(closing)}\n\n".encode())
+        _chunk(writer, b"data: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+
+    @contextlib.contextmanager
+    def running(self) -> Iterator[MockServer]:
+        """Run the server on a background thread for the duration of the block."""
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def serve() -> None:
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=serve, name="aisdlc-mock-llm", daemon=True)
+        thread.start()
+        started.wait()
+        try:
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+
+def _words(text: str) -> Iterator[str]:
+    start = 0
+    for i, ch in enumerate(text):
+        if ch in " \n" and i + 1 < len(text) and text[i + 1] not in " \n":
+            yield text[start : i + 1]
+            start = i + 1
+    if start < len(text):
+        yield text[start:]
+
+
+def _chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+
+def _send(
+    writer: asyncio.StreamWriter,
+    status: int,
+    payload: dict[str, Any],
+    headers: dict[str, str] | None = None,
+) -> None:
+    from http import HTTPStatus
+
+    body = json.dumps(payload).encode()
+    extra = "".join(f"{k}: {v}\r\n" for k, v in (headers or {}).items())
+    writer.write(
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n{extra}\r\n".encode()
+        + body
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the mock server until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_sdlc.mock_llm", description="Local mock LLM endpoint."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--delay", type=float, default=0.0, help="seconds between streamed words"
+    )
+    parser.add_argument(
+        "--fail-first", type=int, default=0, help="answer N requests with 503"
+    )
+    args = parser.parse_args(argv)
+
+    async def serve() -> None:
+        server = MockServer(
+            args.host, args.port, fail_first=args.fail_first, delay=args.delay
+        )
+        await server.start()
+        print(f"🧪  Mock LLM endpoint on {server.base_url} (Ctrl-C to stop)")
+        sys.stdout.flush()
+        await asyncio.Event().wait()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Hashes of the prompt templates a project received from the package.
+
+``<prompt_dir>/.aisdlc-prompts.json`` maps each packaged prompt file name to
+the SHA-256 of the content last installed by `aisdlc init` or
+`aisdlc upgrade-prompts`.  A local file that still has that hash is
+unmodified and may be replaced by a newer packaged version; any other
+content is a local customisation and is left alone.  Unlike the caches the
+file belongs in version control next to the prompts it describes.
+
+Projects initialised before the baseline existed are matched against
+`RELEASED`, the digests of every template version the package has shipped.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from pathlib import Path
+
+from ai_sdlc import __version__
+from ai_sdlc.blobs import file_digest
+from ai_sdlc.utils import atomic_write_text
+
+BASELINE_FILE = ".aisdlc-prompts.json"
+
+#: Digest of every released version of each packaged prompt, oldest first.
+#: Projects initialised before baselines were recorded have no
+#: `BASELINE_FILE`; a local file matching one of these is still unmodified.
+#: Append the new digest here whenever a release changes a template.
+RELEASED: dict[str, tuple[str, ...]] = {
+    "0.idea.instructions.md": (
+        "b852ef47d856c1bf2f5ef31199931ad2422d4e04535c206ea13fee62457975cb",
+    ),
+    "1.prd.instructions.md": (
+        "f9102997a8c6335e4fe7db499135f6350309dce10e338aeba75f7acedd958261",
+    ),
+    "2.prd-plus.instructions.md": (
+        "69b307cbc723cbe1c4bb73277928a76425329b1945c2f555c8d2fc84328116ed",
+    ),
+    "3.system-template.instructions.md": (
+        "7d451dfe0cead8d13b226b46bc5010b2973b26b4fab57b1152130a0d362011e4",
+    ),
+    "4.systems-patterns.instructions.md": (
+        "01e94fa38ec3477437f24c0f96f2857e5060dd19dbdbfcc1f0e17696de3f6c75",
+    ),
+    "5.tasks.instructions.md": (
+        "6c6fc479680d6f7cd73126cc4ec63bf82da5b948b8c85bae96ff90873dbfd9db",
+    ),
+    "6.tasks-plus.instructions.md": (
+        "1025321dd42a798d85ad7d0ecb618ac869b9a7a9506637131ecd0f0e4160089b",
+    ),
+    "7.tests.instructions.md": (
+        "58b429f0b07faeae6143447aeac4fb887cb3341af6a2726d07864d6e70d8da9f",
+    ),
+    "8.deployment.instructions.md": (
+        "849472bc22d74994d519b8b6fedbf8d39f3d10b0a34103a2631230746d9b4c87",
+    ),
+}
+
+
+def text_digest(text: str) -> str:
+    """Return the SHA-256 hex digest of *text* as written to disk (UTF-8)."""
+    import hashlib
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def local_digest(path: Path) -> str | None:
+    """Return the digest of *path*, or None if it does not exist.
+
+    Raises:
+        OSError: If the file exists but cannot be read.
+    """
+    try:
+        return file_digest(path)
+    except FileNotFoundError:
+        return None
+
+
+def released(name: str, digest: str) -> bool:
+    """Return True if *digest* is a released version of the packaged prompt *name*."""
+    return digest in RELEASED.get(name, ())
+
+
+def load(prompt_dir: Path) -> dict[str, str]:
+    """Return the recorded baseline of *prompt_dir* ({} if there is none)."""
+    try:
+        data = json.loads((prompt_dir / BASELINE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    files = data.get("files") if isinstance(data, dict) else None
+    if not isinstance(files, dict):
+        return {}
+    return {k: v for k, v in files.items() if isinstance(k, str) and isinstance(v, str)}
+
+
+def save(prompt_dir: Path, hashes: dict[str, str]) -> None:
+    """Replace the baseline of *prompt_dir* with *hashes*.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    data = {"package_version": __version__, "files": dict(sorted(hashes.items()))}
+    atomic_write_text(prompt_dir / BASELINE_FILE, json.dumps(data, indent=2) + "\n")
+
+
+def record(prompt_dir: Path, names: list[str]) -> None:
+    """Add the current content of the prompt files *names* to the baseline.
+
+    Best effort: files that cannot be read are skipped, and a baseline that
+    cannot be written only means later upgrades treat them as customised.
+    """
+    hashes = {}
+    for name in names:
+        with contextlib.suppress(OSError):
+            digest = local_digest(prompt_dir / name)
+            if digest is not None:
+                hashes[name] = digest
+    if hashes:
+        with contextlib.suppress(OSError):
+            save(prompt_dir, {**load(prompt_dir), **hashes})
@@ -0,0 +1,163 @@
+"""On-disk cache of LLM responses for `aisdlc run`.
+
+Responses are stored in ``.aisdlc-cache/responses.db`` keyed by the SHA-256
+of the final merged prompt together with every setting that influences the
+answer (provider, endpoint, model, system prompt and sampling parameters),
+so re-running an unchanged step returns the stored answer without a model
+call.  Editing a template, an earlier step or a setting changes the key.
+
+Entries older than ``cache_max_age_days`` are ignored and removed, and once
+the cache exceeds ``cache_max_mb`` the least recently used entries are
+evicted.  Both limits, and ``cache = false`` to disable it, live in the
+``[llm]`` table of `.aisdlc`.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ai_sdlc.utils import CACHE_DIR, get_root
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from ai_sdlc.llm import Settings
+
+CACHE_FILE = "responses.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key     TEXT PRIMARY KEY,
+    body    TEXT NOT NULL,
+    size    INTEGER NOT NULL,
+    model   TEXT NOT NULL,
+    created REAL NOT NULL,
+    used    REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_used ON responses (used);
+"""
+
+# Counters for this process, reported with AISDLC_CACHE_STATS
+_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+
+def response_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters of the response cache for this process."""
+    return dict(_stats)
+
+
+def cache_path(root: Path | None = None) -> Path:
+    """Return the response cache of the project at *root* (default: current)."""
+    return (root or get_root()) / CACHE_DIR / CACHE_FILE
+
+
+def cache_key(prompt: str, sampling: dict[str, Any]) -> str:
+    """Return the cache key of *prompt* sent with the *sampling* settings."""
+    import hashlib
+    import json
+
+    params = json.dumps(sampling, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{params}\0{prompt}".encode()).hexdigest()
+
+
+class ResponseCache:
+    """Stored responses with an age limit and LRU eviction beyond a size limit."""
+
+    def __init__(self, path: Path, *, max_bytes: int, max_age: float) -> None:
+        import sqlite3
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            path, isolation_level=None, timeout=10
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> ResponseCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def get(self, key: str) -> str | None:
+        """Return the stored response for *key*, or None if absent or expired."""
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT body, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or now - row[1] > self.max_age:
+            _stats["misses"] += 1
+            return None
+        self._conn.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+        _stats["hits"] += 1
+        return str(row[0])
+
+    def put(self, key: str, body: str, model: str) -> None:
+        """Store *body* as the response for *key* and enforce the limits."""
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, len(body.encode("utf-8")), model, now, now),
+            )
+            _stats["stores"] += 1
+            self._evict(now)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _evict(self, now: float) -> None:
+        cur = self._conn.execute(
+            "DELETE FROM responses WHERE created < ?", (now - self.max_age,)
+        )
+        _stats["evictions"] += cur.rowcount
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY used"
+        ):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        _stats["evictions"] += len(doomed)
+
+    def stats(self) -> tuple[int, int]:
+        """Return the number of stored responses and their total size in bytes."""
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return int(count), int(size)
+
+
+def open_cache(settings: Settings, root: Path | None = None) -> ResponseCache | None:
+    """Return the project's response cache, or None if ``cache = false``.
+
+    Raises:
+        OSError: If the cache directory cannot be created.
+        sqlite3.Error: If the database cannot be opened.
+    """
+    if not settings.cache:
+        return None
+    return ResponseCache(
+        cache_path(root),
+        max_bytes=int(settings.cache_max_mb * 1024 * 1024),
+        max_age=settings.cache_max_age_days * 86400,
+    )
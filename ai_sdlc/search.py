@@ -0,0 +1,344 @@
+"""Full-text search over the step files of active and archived workstreams.
+
+The index is an inverted index in SQLite (``.aisdlc-cache/search.db``):
+``docs`` holds one row per step file with its stat signature and length,
+``postings`` one row per (term, document) with the term frequency.  Queries
+are ranked with Okapi BM25 computed in SQL, so only matching postings are
+read.
+
+Documents are keyed by their path relative to the project root; members of
+zip archives (see `ai_sdlc.archive`) use ``done/<slug>.zip:<file>``.  A
+rebuild only re-reads files whose ``(mtime_ns, size)`` changed, and `aisdlc
+next`/`aisdlc done` refresh just the files they touch once an index exists.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ai_sdlc.utils import (
+    _RACY_WINDOW_NS,
+    CACHE_DIR,
+    DEFAULT_ACTIVE_DIR,
+    DEFAULT_DONE_DIR,
+    get_root,
+    step_of_file,
+)
+
+if TYPE_CHECKING:
+    import sqlite3
+
+INDEX_FILE = "search.db"
+
+# BM25 parameters (the usual defaults)
+_K1 = 1.2
+_B = 0.75
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id       INTEGER PRIMARY KEY,
+    path     TEXT NOT NULL UNIQUE,
+    slug     TEXT NOT NULL,
+    step     TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    length   INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc  INTEGER NOT NULL,
+    tf   INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+"""
+
+_word_re: Any = None
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lower-case word terms of two or more characters."""
+    global _word_re
+    if _word_re is None:
+        import re
+
+        _word_re = re.compile(r"\w\w+")
+    words: list[str] = _word_re.findall(text.lower())
+    return words
+
+
+@dataclass
+class Doc:
+    """A step file that can be indexed."""
+
+    path: str  # Relative to the project root
+    slug: str
+    step: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass
+class Hit:
+    """One search result."""
+
+    path: str
+    slug: str
+    step: str
+    score: float
+
+
+def index_path(root: Path | None = None) -> Path:
+    """Return the index database of the project at *root* (default: current)."""
+    return (root or get_root()) / CACHE_DIR / INDEX_FILE
+
+
+def workstream_docs(root: Path, directory: Path, steps: list[str]) -> Iterator[Doc]:
+    """Yield the step files of the workstream directory or archive *directory*."""
+    if directory.suffix == ".zip":
+        yield from _archive_docs(root, directory, steps)
+        return
+    slug = directory.name
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        step = step_of_file(entry.name, slug, steps)
+        if step is None or not entry.is_file():
+            continue
+        st = entry.stat()
+        rel = Path(entry.path).relative_to(root).as_posix()
+        yield Doc(rel, slug, step, st.st_mtime_ns, st.st_size)
+
+
+def _archive_docs(root: Path, zpath: Path, steps: list[str]) -> Iterator[Doc]:
+    from ai_sdlc import archive
+
+    slug = zpath.stem
+    try:
+        st = zpath.stat()
+    except OSError:
+        return
+    rel = zpath.relative_to(root).as_posix()
+    for name in archive.member_names(zpath.parent, slug):
+        step = step_of_file(name, slug, steps)
+        if step is not None:
+            yield Doc(f"{rel}:{name}", slug, step, st.st_mtime_ns, st.st_size)
+
+
+def all_docs(conf: dict[str, Any], root: Path | None = None) -> Iterator[Doc]:
+    """Yield every step file in the active and done directories."""
+    root = root or get_root()
+    steps = conf["steps"]
+    for key, default in (
+        ("active_dir", DEFAULT_ACTIVE_DIR),
+        ("done_dir", DEFAULT_DONE_DIR),
+    ):
+        base = root / conf.get(key, default)
+        try:
+            entries = sorted(os.scandir(base), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir() or (entry.is_file() and entry.name.endswith(".zip")):
+                yield from workstream_docs(root, Path(entry.path), steps)
+
+
+def read_doc(root: Path, path: str) -> str:
+    """Return the text of indexed document *path*.
+
+    Raises:
+        OSError: If the file or archive member cannot be read.
+    """
+    if ".zip:" in path:
+        from ai_sdlc import archive
+
+        zrel, name = path.split(".zip:", 1)
+        zpath = root / f"{zrel}.zip"
+        data = archive.read_member(zpath.parent, zpath.stem, name)
+        if data is None:
+            raise FileNotFoundError(path)
+        return data.decode("utf-8", "replace")
+    return (root / path).read_text(encoding="utf-8", errors="replace")
+
+
+class SearchIndex:
+    """The on-disk inverted index of one project."""
+
+    def __init__(self, path: Path, root: Path) -> None:
+        import sqlite3
+
+        self.path = path
+        self.root = root
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # 64 MiB keeps bulk inserts in memory
+        self._conn.execute("PRAGMA cache_size=-65536")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> SearchIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0])
+
+    def update(
+        self, docs: list[Doc], *, prune_prefixes: list[str] | None = None
+    ) -> int:
+        """Index the *docs* whose stat signature changed.
+
+        Args:
+            docs: Current step files.
+            prune_prefixes: Forget indexed documents under these path prefixes
+                that are not in *docs* (e.g. a workstream that was archived).
+
+        Returns:
+            int: Number of documents (re)indexed or removed.
+        """
+        import time
+        from collections import Counter
+
+        conn = self._conn
+        racy_after = time.time_ns() - _RACY_WINDOW_NS
+        changed = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for doc in docs:
+                old = conn.execute(
+                    "SELECT mtime_ns, size, id FROM docs WHERE path = ?", (doc.path,)
+                ).fetchone()
+                if old is not None and (old[0], old[1]) == (doc.mtime_ns, doc.size):
+                    continue
+                try:
+                    terms = Counter(tokenize(read_doc(self.root, doc.path)))
+                except OSError:
+                    continue
+                if old is not None:
+                    self._delete(old[2])
+                # A file modified within the racy window may change again without
+                # its signature changing: record it so the next update re-reads it
+                mtime_ns = 0 if doc.mtime_ns > racy_after else doc.mtime_ns
+                cur = conn.execute(
+                    "INSERT INTO docs (path, slug, step, mtime_ns, size, length) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        doc.path,
+                        doc.slug,
+                        doc.step,
+                        mtime_ns,
+                        doc.size,
+                        sum(terms.values()),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO postings VALUES (?, ?, ?)",
+                    [(term, cur.lastrowid, tf) for term, tf in terms.items()],
+                )
+                changed += 1
+            current = {d.path for d in docs}
+            for prefix in prune_prefixes or []:
+                rows = conn.execute(
+                    "SELECT path, id FROM docs WHERE path >= ? AND path < ?",
+                    (prefix, prefix + "\U0010ffff"),
+                ).fetchall()
+                for path, doc_id in rows:
+                    if path not in current:
+                        self._delete(doc_id)
+                        changed += 1
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return changed
+
+    def _delete(self, doc_id: int) -> None:
+        self._conn.execute("DELETE FROM postings WHERE doc = ?", (doc_id,))
+        self._conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def query(
+        self,
+        text: str,
+        *,
+        slug: str | None = None,
+        step: str | None = None,
+        limit: int = 10,
+    ) -> list[Hit]:
+        """Return the documents best matching *text*, ranked by BM25."""
+        import math
+
+        terms = sorted(set(tokenize(text)))
+        if not terms:
+            return []
+        n_docs, avgdl = self._conn.execute(
+            "SELECT COUNT(*), AVG(length) FROM docs"
+        ).fetchone()
+        if not n_docs:
+            return []
+        weights: list[Any] = []
+        for term in terms:
+            df = self._conn.execute(
+                "SELECT COUNT(*) FROM postings WHERE term = ?", (term,)
+            ).fetchone()[0]
+            weights += [term, math.log((n_docs - df + 0.5) / (df + 0.5) + 1)]
+        values = ", ".join(["(?, ?)"] * len(terms))
+        rows = self._conn.execute(
+            f"WITH q(term, idf) AS (VALUES {values}) "
+            "SELECT d.path, d.slug, d.step, "
+            "SUM(q.idf * p.tf * (? + 1) / (p.tf + ? * (1 - ? + ? * d.length / ?))) AS score "
+            "FROM q JOIN postings p ON p.term = q.term JOIN docs d ON d.id = p.doc "
+            "WHERE (? IS NULL OR d.slug = ?) AND (? IS NULL OR d.step = ?) "
+            "GROUP BY d.id ORDER BY score DESC, d.path LIMIT ?",
+            (*weights, _K1, _K1, _B, _B, avgdl or 1, slug, slug, step, step, limit),
+        ).fetchall()
+        return [Hit(r[0], r[1], r[2], float(r[3])) for r in rows]
+
+
+def refresh(
+    conf: dict[str, Any], directories: list[Path], gone: list[Path] | None = None
+) -> None:
+    """Re-index the step files of workstream *directories*, if an index exists.
+
+    Used by `next` and `done` so the index follows their changes without a
+    rebuild; projects that never ran `aisdlc search` pay nothing.  Errors
+    are ignored: the next rebuild picks up anything missed.
+
+    Args:
+        conf: Project configuration.
+        directories: Workstream directories (or archives) whose files changed.
+        gone: Workstream directories that no longer exist.
+    """
+    root = get_root()
+    path = index_path(root)
+    if not path.exists():
+        return
+    import sqlite3
+
+    steps = conf["steps"]
+    docs = [
+        d for directory in directories for d in workstream_docs(root, directory, steps)
+    ]
+    prefixes = [
+        p.relative_to(root).as_posix() + (":" if p.suffix == ".zip" else "/")
+        for p in [*directories, *(gone or [])]
+    ]
+    try:
+        with SearchIndex(path, root) as index:
+            index.update(docs, prune_prefixes=prefixes)
+    except (OSError, sqlite3.Error):
+        pass
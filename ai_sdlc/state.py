@@ -0,0 +1,338 @@
+"""Pluggable workstream state backends.
+
+A workstream is a plain dict with the same keys the lock file has always used:
+``{"slug": ..., "current": ..., "created": ...}``.  The backend is chosen by
+``state_backend`` in `.aisdlc`:
+
+* ``"json"`` (default) – the single-workstream `.aisdlc.lock` file, via
+  `read_lock`/`write_lock`.
+* ``"sqlite"`` – an indexed SQLite database (WAL mode) holding any number of
+  workstreams plus their step history.  An existing JSON lock is imported the
+  first time the database is opened.
+"""
+
+from __future__ import annotations
+
+import builtins
+import sys
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, Self
+
+from ai_sdlc.utils import (
+    CONFIG_FILE,
+    STATE_DB_FILE,
+    get_root,
+    lock_timeout,
+    lock_transaction,
+    read_lock,
+    write_lock,
+)
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Config key selecting the backend and its accepted values
+BACKEND_KEY = "state_backend"
+DEFAULT_BACKEND = "json"
+
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workstreams (
+    slug    TEXT PRIMARY KEY,
+    current TEXT NOT NULL,
+    created TEXT NOT NULL,
+    updated TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS history (
+    id      INTEGER PRIMARY KEY,
+    slug    TEXT NOT NULL,
+    step    TEXT NOT NULL,
+    entered TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workstreams_updated ON workstreams (updated);
+CREATE INDEX IF NOT EXISTS history_slug ON history (slug, id);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def now() -> str:
+    """Return the current UTC time in the ISO format used for state timestamps."""
+    return datetime.now(UTC).isoformat()
+
+
+class StateBackend(Protocol):
+    """Storage for workstream state.
+
+    Backends are context managers: leaving the ``with`` block closes them.
+    """
+
+    #: True if the backend can track more than one workstream at a time
+    multi: bool
+
+    def get(self, slug: str | None = None) -> dict[str, Any]:
+        """Return workstream *slug*, or the selected one if *slug* is None ({} if none)."""
+        ...
+
+    def list(self) -> list[dict[str, Any]]:
+        """Return every active workstream, oldest first."""
+        ...
+
+    def put(self, ws: dict[str, Any]) -> None:
+        """Insert or update *ws* and make it the selected workstream."""
+        ...
+
+    def remove(self, slug: str) -> None:
+        """Forget workstream *slug* (after it has been archived)."""
+        ...
+
+    def history(self, slug: str) -> builtins.list[dict[str, Any]]:
+        """Return the ``{"step", "entered"}`` records of *slug*, oldest first."""
+        ...
+
+    def transaction(self) -> AbstractContextManager[None]:
+        """Make the reads and writes in the block atomic w.r.t. other processes.
+
+        Raises:
+            TimeoutError: If the state lock cannot be acquired in time.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the resources held by the backend."""
+        ...
+
+    def __enter__(self) -> Self: ...
+
+    def __exit__(self, *exc: object) -> None: ...
+
+
+class JsonLockBackend:
+    """The classic single-workstream `.aisdlc.lock` file."""
+
+    multi = False
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self.timeout = timeout
+
+    def get(self, slug: str | None = None) -> dict[str, Any]:
+        lock = read_lock()
+        if slug is not None and lock.get("slug") != slug:
+            return {}
+        return lock
+
+    def list(self) -> list[dict[str, Any]]:
+        lock = read_lock()
+        return [lock] if lock else []
+
+    def put(self, ws: dict[str, Any]) -> None:
+        write_lock(ws)
+
+    def remove(self, slug: str) -> None:
+        if read_lock().get("slug") == slug:
+            write_lock({})
+
+    def history(self, slug: str) -> builtins.list[dict[str, Any]]:
+        return []
+
+    def transaction(self) -> AbstractContextManager[None]:
+        return lock_transaction(self.timeout)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class SqliteBackend:
+    """Many workstreams in an indexed SQLite database running in WAL mode."""
+
+    multi = True
+
+    def __init__(self, path: Path, timeout: float | None = None) -> None:
+        import sqlite3
+
+        self.path = path
+        self.timeout = lock_timeout() if timeout is None else timeout
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            path, timeout=self.timeout, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        if self._meta("schema_version") is not None:
+            return
+        with self._transaction() as conn:
+            if self._meta("schema_version") is not None:
+                return  # Another process migrated while we waited for the write lock
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                (str(_SCHEMA_VERSION),),
+            )
+            # Import the workstream of an existing JSON lock file, if any
+            lock = read_lock()
+            if lock.get("slug") and lock.get("current"):
+                created = lock.get("created") or now()
+                conn.execute(
+                    "INSERT OR IGNORE INTO workstreams VALUES (?, ?, ?, ?)",
+                    (lock["slug"], lock["current"], created, now()),
+                )
+                conn.execute(
+                    "INSERT INTO history (slug, step, entered) VALUES (?, ?, ?)",
+                    (lock["slug"], lock["current"], created),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('selected', ?)",
+                    (lock["slug"],),
+                )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a write transaction (taken up front, so writers queue).
+
+        Nested use joins the enclosing transaction.
+        """
+        import sqlite3
+
+        if self._conn.in_transaction:
+            yield self._conn
+            return
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:  # "database is locked" after busy timeout
+            raise TimeoutError(
+                f"Timed out after {self.timeout:g}s waiting for '{STATE_DB_FILE}': {e}"
+            ) from e
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        with self._transaction():
+            yield
+
+    def _meta(self, key: str) -> str | None:
+        import sqlite3
+
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.OperationalError:  # Tables not created yet
+            return None
+        return None if row is None else str(row[0])
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> dict[str, Any]:
+        return {
+            "slug": row["slug"],
+            "current": row["current"],
+            "created": row["created"],
+        }
+
+    def get(self, slug: str | None = None) -> dict[str, Any]:
+        if slug is None:
+            slug = self._meta("selected")
+        if slug is None:
+            # Selected workstream was archived: fall back to the most recently touched one
+            row = self._conn.execute(
+                "SELECT slug, current, created FROM workstreams ORDER BY updated DESC LIMIT 1"
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                "SELECT slug, current, created FROM workstreams WHERE slug = ?", (slug,)
+            ).fetchone()
+        return {} if row is None else self._row(row)
+
+    def list(self) -> list[dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT slug, current, created FROM workstreams ORDER BY created, slug"
+        ).fetchall()
+        return [self._row(r) for r in rows]
+
+    def put(self, ws: dict[str, Any]) -> None:
+        stamp = now()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT current FROM workstreams WHERE slug = ?", (ws["slug"],)
+            ).fetchone()
+            conn.execute(
+                "INSERT INTO workstreams VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (slug) DO UPDATE SET current = excluded.current, updated = excluded.updated",
+                (ws["slug"], ws["current"], ws.get("created") or stamp, stamp),
+            )
+            if row is None or row["current"] != ws["current"]:
+                conn.execute(
+                    "INSERT INTO history (slug, step, entered) VALUES (?, ?, ?)",
+                    (ws["slug"], ws["current"], stamp),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('selected', ?)", (ws["slug"],)
+            )
+
+    def remove(self, slug: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM workstreams WHERE slug = ?", (slug,))
+            if self._meta("selected") == slug:
+                conn.execute("DELETE FROM meta WHERE key = 'selected'")
+
+    def history(self, slug: str) -> builtins.list[dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT step, entered FROM history WHERE slug = ? ORDER BY id", (slug,)
+        ).fetchall()
+        return [{"step": r["step"], "entered": r["entered"]} for r in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def get_backend(conf: dict[str, Any]) -> StateBackend:
+    """Return the state backend configured in *conf*.
+
+    Use it as ``with get_backend(conf) as backend:`` so that it is closed.
+
+    Raises:
+        SystemExit: If ``state_backend`` is unknown or the database cannot be opened.
+    """
+    name = conf.get(BACKEND_KEY, DEFAULT_BACKEND)
+    timeout = lock_timeout(conf)
+    if name == "json":
+        return JsonLockBackend(timeout)
+    if name == "sqlite":
+        import sqlite3
+
+        try:
+            return SqliteBackend(get_root() / STATE_DB_FILE, timeout)
+        except sqlite3.Error as e:
+            print(f"❌ Error: Could not open state database '{STATE_DB_FILE}': {e}")
+            sys.exit(1)
+    print(
+        f"❌ Error: Unknown {BACKEND_KEY} '{name}' in {CONFIG_FILE} (expected 'json' or 'sqlite')."
+    )
+    sys.exit(1)
@@ -0,0 +1,98 @@
+"""User-level, versioned copy of the packaged prompt templates for `aisdlc init --link`.
+
+`ensure` writes the templates once into
+``$XDG_CACHE_HOME/ai-sdlc/templates/<version>-<digest>/`` (``AISDLC_TEMPLATE_CACHE``
+overrides the base directory).  The digest covers the template contents, so
+a release that changes a prompt gets a new directory while projects linked
+to the old one keep theirs.  The directory is built under a temporary name
+and renamed into place, so concurrent initialisations never see a partial
+copy.
+
+`install` then populates a project with a hardlink or a symlink to the
+cached file instead of a full copy.  Cached files are read-only: editing a
+linked prompt in place would otherwise change it in every project.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from ai_sdlc import __version__
+from ai_sdlc.utils import cannot_hardlink
+
+# Environment variable overriding the base directory of the cache
+CACHE_ENV = "AISDLC_TEMPLATE_CACHE"
+LINK_MODES = ("hardlink", "symlink")
+
+
+def cache_dir() -> Path:
+    """Return the base directory holding every cached template version."""
+    override = os.environ.get(CACHE_ENV)
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ai-sdlc" / "templates"
+
+
+def version_dir(prompts: dict[str, str]) -> Path:
+    """Return the cache directory for exactly these *prompts* (file name -> text)."""
+    digest = hashlib.sha256()
+    for name, text in sorted(prompts.items()):
+        digest.update(name.encode("utf-8") + b"\0" + text.encode("utf-8") + b"\0")
+    return cache_dir() / f"{__version__}-{digest.hexdigest()[:12]}"
+
+
+def ensure(prompts: dict[str, str]) -> Path:
+    """Return the cache directory of *prompts*, writing it first if needed.
+
+    Raises:
+        OSError: If the cache cannot be created.
+    """
+    dest = version_dir(prompts)
+    if dest.is_dir():
+        return dest  # Only ever created complete, by the rename below
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=dest.parent, prefix=".tmp-"))
+    try:
+        for name, text in prompts.items():
+            (tmp / name).write_text(text, encoding="utf-8")
+            os.chmod(tmp / name, 0o444)
+        os.chmod(tmp, 0o755)
+        try:
+            os.rename(tmp, dest)
+        except OSError:
+            if not dest.is_dir():
+                raise
+            # Another process finished the same version first
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return dest
+
+
+def install(source: Path, target: Path, mode: str) -> str:
+    """Create *target* as a link to the cached *source*.
+
+    A hardlink falls back to a plain copy where the file system refuses it
+    (for example when the project is on another device than the cache).
+
+    Returns:
+        str: How *target* was created: ``"hardlink"``, ``"symlink"`` or ``"copy"``.
+
+    Raises:
+        OSError: If *target* cannot be created.
+    """
+    if mode == "symlink":
+        target.symlink_to(source)
+        return "symlink"
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError as e:
+        if not cannot_hardlink(e):
+            raise
+    shutil.copyfile(source, target)
+    return "copy"
@@ -0,0 +1,361 @@
+"""Compiled prompt templates used by `aisdlc next`.
+
+A template is parsed once into a list of segments: literal byte ranges of the
+template file and named slots.  Rendering walks that list in a single pass,
+copying literal ranges and step files straight into the output file.
+
+Recognised slots:
+
+* ``<prev_step></prev_step>`` – replaced by the previous step's output.
+* A ``<prev_step>`` … ``</prev_step>`` block whose tags sit on lines of their
+  own – the block's body is replaced by the previous step's output and the
+  tags are kept as delimiters.
+* ``{{ prev_step }}``, ``{{ slug }}``, ``{{ title }}`` (the idea's ``# heading``)
+  and ``{{ <step> }}`` for any earlier step, e.g. ``{{ 1.prd }}``.  Other
+  ``{{ … }}`` names are left untouched.
+* ``{% include "fragment.md" %}`` – another template, relative to the prompt
+  directory.
+
+Compiled segment lists are memoised in-process (validated against ``fstat``)
+and stored on disk under ``.aisdlc-cache/templates/`` keyed by the SHA-256 of
+the template content.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from ai_sdlc import timing
+from ai_sdlc.utils import _RACY_WINDOW_NS, atomic_write_text, copy_range
+
+# Bump when the segment format changes so stale cache entries are ignored
+_FORMAT = 1
+
+# A segment is ("text", start, end) or (kind, name, start, end) where kind is
+# "slot", "block" or "include" and start/end delimit the original token.
+Segment = tuple[Any, ...]
+
+_TOKEN_PATTERN = (
+    rb"(?P<legacy><prev_step></prev_step>)"
+    rb"|^[ \t]*<prev_step>[ \t]*\r?\n(?P<block>.*?)^[ \t]*</prev_step>[ \t]*$"
+    rb"|\{\{[ \t]*(?P<slot>[\w.-]+)[ \t]*\}\}"
+    rb'|\{%[ \t]*include[ \t]+"(?P<include>[^"\n]+)"[ \t]*%\}'
+)
+_token_re: Any = None
+
+
+class TemplateError(Exception):
+    """A template cannot be rendered (bad include, unavailable step, ...)."""
+
+
+def compile_template(data: bytes) -> list[Segment]:
+    """Parse template *data* into literal ranges and slots.
+
+    Args:
+        data: Raw template bytes.
+
+    Returns:
+        list[Segment]: Segments in output order.
+    """
+    global _token_re
+    if _token_re is None:
+        import re
+
+        _token_re = re.compile(_TOKEN_PATTERN, re.MULTILINE | re.DOTALL)
+
+    segments: list[Segment] = []
+    pos = 0
+    for m in _token_re.finditer(data):
+        if m.group("block") is not None:
+            start, end = m.span("block")  # Keep the surrounding tag lines
+            token: Segment = ("block", "prev_step", start, end)
+        elif m.group("legacy") is not None:
+            start, end = m.span()
+            token = ("slot", "prev_step", start, end)
+        elif m.group("slot") is not None:
+            start, end = m.span()
+            token = ("slot", m.group("slot").decode("utf-8"), start, end)
+        else:
+            start, end = m.span()
+            token = ("include", m.group("include").decode("utf-8"), start, end)
+        if start > pos:
+            segments.append(("text", pos, start))
+        segments.append(token)
+        pos = end
+    if pos < len(data):
+        segments.append(("text", pos, len(data)))
+    return segments
+
+
+class TemplateCache:
+    """Compiled templates, memoised in-process and on disk by content hash."""
+
+    def __init__(self) -> None:
+        self._memo: dict[Path, tuple[tuple[int, int, int], list[Segment]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"memo_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def compiled(self, fd: int, path: Path, cache_dir: Path | None) -> list[Segment]:
+        """Return the segments of the template open as *fd*.
+
+        Raises:
+            OSError: If the template cannot be read.
+        """
+        st = os.fstat(fd)
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        memo = self._memo.get(path)
+        if memo is not None and memo[0] == sig:
+            self._count("memo_hits")
+            return memo[1]
+
+        import hashlib
+
+        data = _read_all(fd, st.st_size)
+        digest = hashlib.sha256(b"%d\0" % _FORMAT + data).hexdigest()
+        entry = cache_dir / "templates" / f"{digest}.json" if cache_dir else None
+        segments = self._read_entry(entry) if entry else None
+        if segments is not None:
+            self._count("disk_hits")
+        else:
+            self._count("misses")
+            segments = compile_template(data)
+            if entry:
+                self._write_entry(entry, segments)
+
+        if time.time_ns() - sig[0] > _RACY_WINDOW_NS:
+            self._memo[path] = (sig, segments)
+        return segments
+
+    @staticmethod
+    def _read_entry(entry: Path) -> list[Segment] | None:
+        import json
+
+        try:
+            data = json.loads(entry.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("format") != _FORMAT:
+            return None
+        return [tuple(s) for s in data.get("segments", [])]
+
+    @staticmethod
+    def _write_entry(entry: Path, segments: list[Segment]) -> None:
+        # Best effort: a read-only checkout must not break `next`
+        import json
+
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(
+                entry,
+                json.dumps({"format": _FORMAT, "segments": segments}),
+                durable=False,
+            )
+        except OSError:
+            pass
+
+
+_template_cache = TemplateCache()
+
+
+def template_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters of the compiled-template cache for this process."""
+    return dict(_template_cache.stats)
+
+
+def _read_all(fd: int, size: int) -> bytes:
+    chunks = []
+    offset = 0
+    while offset < size:
+        chunk = os.pread(fd, size - offset, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        offset += len(chunk)
+    return b"".join(chunks)
+
+
+class Slots:
+    """Values available to a template while rendering one step.
+
+    Args:
+        slug: Workstream slug.
+        steps: Every configured step, in order.
+        files: Output file of each step that is already complete, by step name.
+        prev_step: The step whose output ``prev_step`` refers to.
+        content: Text to use instead of a step's file (e.g. trimmed to a
+            token budget), by step name.
+    """
+
+    def __init__(
+        self,
+        slug: str,
+        steps: list[str],
+        files: dict[str, Path],
+        prev_step: str,
+        content: dict[str, str] | None = None,
+    ) -> None:
+        self.slug = slug
+        self.steps = steps
+        self.files = files
+        self.prev_step = prev_step
+        self.content = content or {}
+
+    @cached_property
+    def title(self) -> str:
+        """The first ``# heading`` of the first step's file, or the slug."""
+        first = self.files.get(self.steps[0]) if self.steps else None
+        if first is not None:
+            with contextlib.suppress(OSError), first.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("# "):
+                        return line[2:].strip()
+        return self.slug
+
+
+def render(
+    template: Path,
+    out: Path,
+    slots: Slots,
+    cache_dir: Path | None = None,
+    *,
+    preamble: str = "",
+    trailer: str = "",
+) -> None:
+    """Render *template* into *out* in a single pass.
+
+    Literal ranges and step files are copied file-to-file, so memory use does
+    not depend on their size.  The result is written to a temporary file and
+    renamed into place.
+
+    Args:
+        template: Template file; includes are resolved relative to its directory.
+        out: Output file.
+        slots: Values for the template's slots.
+        cache_dir: Directory for the on-disk compiled-template cache, or None.
+        preamble: Text written before the template.
+        trailer: Text written after the template.
+
+    Raises:
+        TemplateError: If a slot or include cannot be resolved.
+        OSError: If a file cannot be read or written.
+    """
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(dir=out.parent, prefix=f"{out.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmp, 0o644)
+        with timing.phase("render", template=template.name):
+            _write(fd, preamble.encode("utf-8"))
+            _render_into(fd, template, template.parent.resolve(), slots, cache_dir, ())
+            _write(fd, trailer.encode("utf-8"))
+        with timing.phase("output write", file=out.name) as span:
+            if timing.enabled():
+                span["bytes"] = os.fstat(fd).st_size
+            os.close(fd)
+            fd = -1
+            os.replace(tmp, out)
+    except BaseException:
+        if fd != -1:
+            os.close(fd)
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _render_into(
+    out_fd: int,
+    template: Path,
+    prompt_dir: Path,
+    slots: Slots,
+    cache_dir: Path | None,
+    stack: tuple[Path, ...],
+) -> None:
+    src_fd = os.open(template, os.O_RDONLY)
+    try:
+        with timing.phase("template read", template=template.name) as span:
+            segments = _template_cache.compiled(src_fd, template, cache_dir)
+            if timing.enabled():
+                span["bytes"] = os.fstat(src_fd).st_size
+        for seg in segments:
+            kind = seg[0]
+            if kind == "text":
+                copy_range(src_fd, out_fd, seg[1], seg[2] - seg[1])
+            elif kind == "include":
+                included = (prompt_dir / seg[1]).resolve()
+                here = template.resolve()
+                if not included.is_relative_to(prompt_dir):
+                    raise TemplateError(
+                        f"include '{seg[1]}' in {template.name} leaves {prompt_dir}"
+                    )
+                if included in stack or included == here:
+                    raise TemplateError(
+                        f"include '{seg[1]}' in {template.name} is recursive"
+                    )
+                if not included.is_file():
+                    raise TemplateError(
+                        f"included fragment '{seg[1]}' not found in {prompt_dir}"
+                    )
+                _render_into(
+                    out_fd, included, prompt_dir, slots, cache_dir, (*stack, here)
+                )
+            elif not _write_slot(out_fd, seg, slots):
+                copy_range(src_fd, out_fd, seg[2], seg[3] - seg[2])  # Not one of ours
+    finally:
+        os.close(src_fd)
+
+
+def _write_slot(out_fd: int, seg: Segment, slots: Slots) -> bool:
+    """Write the value of slot *seg*; return False if the name is not a slot."""
+    kind, name = seg[0], seg[1]
+    if name == "slug":
+        _write(out_fd, slots.slug.encode("utf-8"))
+        return True
+    if name == "title":
+        _write(out_fd, slots.title.encode("utf-8"))
+        return True
+    if name == "prev_step":
+        name = slots.prev_step
+    elif name not in slots.steps:
+        return False
+    if name in slots.content:
+        text = slots.content[name]
+        if kind == "block" and text and not text.endswith("\n"):
+            text += "\n"
+        data = text.encode("utf-8")
+        with timing.phase("merge", step=name, bytes=len(data)):
+            _write(out_fd, data)
+        return True
+    path = slots.files.get(name)
+    if path is None:
+        raise TemplateError(
+            f"step '{name}' is not complete yet and cannot be used here"
+        )
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        raise TemplateError(f"output of step '{name}' is missing: {path}") from None
+    try:
+        size = os.fstat(fd).st_size
+        with timing.phase("merge", step=name, bytes=size):
+            copy_range(fd, out_fd, 0, size)
+            if kind == "block" and size and os.pread(fd, 1, size - 1) != b"\n":
+                _write(out_fd, b"\n")  # The closing tag must stay on its own line
+    finally:
+        os.close(fd)
+    return True
+
+
+def _write(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
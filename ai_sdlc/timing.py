@@ -0,0 +1,146 @@
+"""Lightweight phase timer behind `aisdlc --startup-report`, `--trace` and `--profile`.
+
+Kept free of non-trivial imports so it can be loaded before anything else.
+Recording is off by default and `phase()` is then a near no-op.
+
+Once enabled, every `phase()` block is recorded as a span with its start,
+duration, thread and any details the block attaches (such as a byte count)::
+
+    with timing.phase("lock write", bytes=len(payload)):
+        ...
+    with timing.phase("template read") as span:
+        span["bytes"] = size
+
+The spans can be printed as a summary (`report`) or saved in the Chrome
+trace-event format (`write_trace`), which chrome://tracing, Perfetto and
+speedscope open.
+"""
+
+from __future__ import annotations
+
+import _thread
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Environment variable naming a trace file to write, like `aisdlc --trace=FILE`
+TRACE_ENV = "AISDLC_TRACE"
+DEFAULT_TRACE_FILE = "aisdlc-trace.json"
+DEFAULT_PROFILE_FILE = "aisdlc.pstats"
+
+_enabled = False
+_started_ns = 0
+# (name, start_ns, duration_ns, thread id, details)
+_phases: list[tuple[str, int, int, int, dict[str, Any]]] = []
+# Handed to callers while recording is off; whatever they attach is dropped
+_DISCARD: dict[str, Any] = {}
+
+
+def enable() -> None:
+    """Start recording phases; the report's total is measured from this call."""
+    global _enabled, _started_ns
+    if _enabled:
+        return
+    _enabled = True
+    _started_ns = time.perf_counter_ns()
+    _phases.clear()
+
+
+def enabled() -> bool:
+    """Return True if phases are being recorded."""
+    return _enabled
+
+
+@contextmanager
+def phase(name: str, **details: Any) -> Iterator[dict[str, Any]]:
+    """Time the enclosed block as *name* when recording is enabled.
+
+    Yields:
+        dict[str, Any]: The span's details, to which the block may add entries.
+    """
+    if not _enabled:
+        yield _DISCARD
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield details
+    except BaseException as e:
+        details.setdefault("error", type(e).__name__)
+        raise
+    finally:
+        duration = time.perf_counter_ns() - start
+        _phases.append((name, start, duration, _thread.get_ident(), details))
+
+
+def report() -> None:
+    """Print the recorded phases and the total elapsed time to stderr."""
+    total_ns = time.perf_counter_ns() - _started_ns
+    print("\nStartup report\n--------------", file=sys.stderr)
+    for name, _, ns, _, details in sorted(_phases, key=lambda p: p[1]):
+        size = f"  {details['bytes']:,} bytes" if "bytes" in details else ""
+        print(f"  {name:32} {ns / 1e6:8.2f} ms{size}", file=sys.stderr)
+    print(f"  {'total':32} {total_ns / 1e6:8.2f} ms", file=sys.stderr)
+    print(f"  {'modules loaded':32} {len(sys.modules):8d}", file=sys.stderr)
+
+
+def write_trace(path: str, argv: list[str] | None = None) -> None:
+    """Save the recorded phases to *path* as Chrome trace-event JSON.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    import json
+
+    pid = os.getpid()
+    main = _thread.get_ident()
+    events: list[dict[str, Any]] = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": main,
+            "args": {"name": "aisdlc"},
+        }
+    ]
+    for name, start, duration, tid, details in sorted(_phases, key=lambda p: p[1]):
+        args = {
+            k: v if isinstance(v, int | float | bool) else str(v)
+            for k, v in details.items()
+        }
+        events.append(
+            {
+                "name": name,
+                "cat": "aisdlc",
+                "ph": "X",
+                "ts": (start - _started_ns) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+        )
+    trace = {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {"argv": argv or []},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace, f)
+
+
+def profile(fn: Callable[[], None], path: str) -> None:
+    """Run *fn* under cProfile, dump the stats to *path* and summarise them on stderr."""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(fn)
+    finally:
+        profiler.dump_stats(path)
+        print(f"\nProfile written to {path} (python -m pstats {path})", file=sys.stderr)
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(15)
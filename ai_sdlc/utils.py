@@ -1,23 +1,51 @@
-"""Shared helpers for AI-SDLC CLI commands."""
+"""Shared helpers for AI-SDLC CLI commands.
+
+Importing this module is deliberately cheap: the project root is discovered on
+first use (see `get_root`) and parsers such as `tomllib`, `json` and `re` are
+imported inside the functions that need them.
+"""
 
 from __future__ import annotations
 
-import json
-import re
+import contextlib
+import os
 import sys
-import unicodedata
+import threading
+import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
+from ai_sdlc import timing
+
 # Configuration file names
 CONFIG_FILE = ".aisdlc"
 LOCK_FILE = ".aisdlc.lock"
+STATE_DB_FILE = ".aisdlc.db"
+
+# Advisory lock serialising read-modify-write of workflow state.  A separate
+# file is needed because writes replace the lock file (and its inode) atomically.
+LOCK_GUARD_FILE = ".aisdlc.lock.flock"
+
+# How long (seconds) to wait for another aisdlc process to release the state
+# lock; overridable with `lock_timeout` in .aisdlc or the environment variable.
+DEFAULT_LOCK_TIMEOUT = 10.0
+LOCK_TIMEOUT_ENV = "AISDLC_LOCK_TIMEOUT"
 
 # Default directories
 DEFAULT_ACTIVE_DIR = "doing"
 DEFAULT_DONE_DIR = "done"
 DEFAULT_PROMPT_DIR = "prompts"
 
+# Environment variable naming the project root; skips the parent-directory walk
+ROOT_ENV = "AISDLC_ROOT"
+
+# Project-local cache directory for derived data (safe to delete)
+CACHE_DIR = ".aisdlc-cache"
+
+# Environment variable that makes the CLI report cache counters on stderr
+CACHE_STATS_ENV = "AISDLC_CACHE_STATS"
+
 # Default fallback slug
 DEFAULT_SLUG = "idea"
 
@@ -25,9 +53,14 @@ DEFAULT_SLUG = "idea"
 def find_project_root() -> Path:
     """Find project root by searching for .aisdlc file in current and parent directories.
 
+    If ``AISDLC_ROOT`` is set, it is returned as-is without touching the filesystem.
+
     Returns:
         Path: The project root directory containing .aisdlc, or current directory if not found.
     """
+    override = os.environ.get(ROOT_ENV)
+    if override:
+        return Path(override).absolute()
     current_dir = Path.cwd()
     for parent in [current_dir] + list(current_dir.parents):
         if (parent / CONFIG_FILE).exists():
@@ -37,25 +70,217 @@ def find_project_root() -> Path:
     return current_dir
 
 
-ROOT = find_project_root()
+def get_root() -> Path:
+    """Return the project root, discovering it on first use.
+
+    The result is stored in the module-level ``ROOT`` so tests and the daemon
+    can override it (``utils.ROOT = path`` or `set_root`).
+    """
+    root: Path | None = globals().get("ROOT")
+    if root is None:
+        with timing.phase("root discovery"):
+            root = find_project_root()
+        set_root(root)
+    return root
+
+
+def set_root(root: Path | None) -> None:
+    """Pin the project root to *root*, or forget it (``None``) to rediscover lazily."""
+    if root is None:
+        globals().pop("ROOT", None)
+    else:
+        globals()["ROOT"] = root
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps `utils.ROOT` working as an attribute while discovery stays lazy
+    if name == "ROOT":
+        return get_root()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# --- In-memory file cache (used by `aisdlc serve`) ---------------------------
+# Files modified within this window are never cached: on filesystems with coarse
+# timestamps a second write in the same tick would otherwise keep the same stat
+# signature (the "racy clean" problem git solves the same way).
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+class FileCache:
+    """Parsed file contents, revalidated against ``os.stat`` on every lookup.
+
+    A cached entry is reused only while the file's ``(mtime_ns, size, inode)``
+    signature is unchanged, so edits made by other processes are picked up on
+    the next access without any explicit invalidation.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+
+    def get(self, path: Path, parse: Callable[[str], Any]) -> Any:
+        """Return ``parse(path.read_text())``, reusing the cached result when valid.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+        """
+        st = path.stat()
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == sig:
+            return entry[1]
+        value = parse(path.read_text(encoding="utf-8"))
+        if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            self._entries[path] = (sig, value)
+        else:
+            self._entries.pop(path, None)
+        return value
+
+    def invalidate(self, path: Path) -> None:
+        """Drop the cached entry for *path*, if any."""
+        self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+
+_file_cache: FileCache | None = None
+
+
+def enable_file_cache() -> FileCache:
+    """Keep parsed lock contents in memory between commands."""
+    global _file_cache
+    if _file_cache is None:
+        _file_cache = FileCache()
+    return _file_cache
+
 
 # --- TOML loader (Python ≥3.11 stdlib) --------------------------------------
-try:
-    import tomllib as _toml  # Python 3.11+
-except ModuleNotFoundError:  # pragma: no cover – fallback for < 3.11
-    import tomli as _toml  # type: ignore[import-not-found,no-redef]  # noqa: D401  # `uv pip install tomli`
+def _toml() -> Any:
+    """Import the TOML parser on first use."""
+    try:
+        import tomllib  # Python 3.11+
+    except ModuleNotFoundError:  # pragma: no cover – fallback for < 3.11
+        import tomli as tomllib  # type: ignore[import-not-found,no-redef]  # noqa: D401  # `uv pip install tomli`
+    return tomllib
+
+
+def parse_toml(text: str) -> dict[str, Any]:
+    """Parse *text* as TOML.
+
+    Raises:
+        ValueError: If *text* is not valid TOML.
+    """
+    parsed: dict[str, Any] = _toml().loads(text)
+    return parsed
+
+
+class ConfigCache:
+    """Two-level cache of parsed `.aisdlc` files.
+
+    * An in-process memo keyed on the file's stat signature answers repeated
+      `load_config()` calls within one command (or one daemon lifetime).
+    * An on-disk JSON sidecar under ``CACHE_DIR`` holds the parsed config keyed
+      on path, ``mtime_ns``, size and SHA-256 of the content, so a fresh process
+      can skip the TOML parse.  Any mismatch falls back to a real parse.
+    """
+
+    SIDECAR = "config.json"
+
+    def __init__(self) -> None:
+        self._memo: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+        self.stats = {"memo_hits": 0, "sidecar_hits": 0, "misses": 0}
+
+    def load(self, cfg_path: Path) -> dict[str, Any]:
+        """Return the parsed config at *cfg_path* (callers must not mutate it).
+
+        Raises:
+            OSError: If the config file cannot be read.
+            TOMLDecodeError: If the config file is not valid TOML.
+        """
+        st = cfg_path.stat()
+        sig = (st.st_mtime_ns, st.st_size)
+        memo = self._memo.get(cfg_path)
+        if memo is not None and memo[0] == sig:
+            self.stats["memo_hits"] += 1
+            return memo[1]
+
+        import hashlib
+
+        raw = cfg_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        key = {
+            "path": str(cfg_path),
+            "mtime_ns": sig[0],
+            "size": sig[1],
+            "sha256": digest,
+        }
+        sidecar = cfg_path.parent / CACHE_DIR / self.SIDECAR
+        conf = self._read_sidecar(sidecar, key)
+        if conf is not None:
+            self.stats["sidecar_hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            with timing.phase("config parse", bytes=len(raw)):
+                conf = _toml().loads(raw.decode("utf-8"))
+            self._write_sidecar(sidecar, key, conf)
+
+        if time.time_ns() - sig[0] > _RACY_WINDOW_NS:
+            self._memo[cfg_path] = (sig, conf)
+        return conf
+
+    @staticmethod
+    def _read_sidecar(sidecar: Path, key: dict[str, Any]) -> dict[str, Any] | None:
+        import json
+
+        try:
+            data = json.loads(sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != key:
+            return None
+        conf = data.get("config")
+        return conf if isinstance(conf, dict) else None
+
+    @staticmethod
+    def _write_sidecar(
+        sidecar: Path, key: dict[str, Any], conf: dict[str, Any]
+    ) -> None:
+        # Best effort: configs with TOML dates are not JSON-serialisable, and a
+        # read-only checkout must not break commands.
+        import json
+
+        try:
+            payload = json.dumps({"key": key, "config": conf})
+            sidecar.parent.mkdir(exist_ok=True)
+            atomic_write_text(sidecar, payload, durable=False)
+        except (OSError, TypeError, ValueError):
+            pass
+
+
+_config_cache = ConfigCache()
+
+
+def config_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters of the `load_config` cache for this process."""
+    return dict(_config_cache.stats)
 
 
 def load_config() -> dict[str, Any]:
     """Load and parse the .aisdlc configuration file.
 
+    Parsed results are cached in memory and in an on-disk sidecar (see
+    `ConfigCache`); callers always receive their own copy.
+
     Returns:
         dict[str, Any]: Parsed TOML configuration as a dictionary.
 
     Raises:
         SystemExit: If the config file is missing or corrupted.
     """
-    cfg_path = ROOT / CONFIG_FILE
+    import copy
+
+    cfg_path = get_root() / CONFIG_FILE
     if not cfg_path.exists():
         print(
             f"Error: {CONFIG_FILE} not found. Ensure you are in an ai-sdlc project directory."
@@ -63,8 +288,9 @@ def load_config() -> dict[str, Any]:
         print("Run `aisdlc init` to initialize a new project.")
         sys.exit(1)
     try:
-        return _toml.loads(cfg_path.read_text(encoding="utf-8"))
-    except _toml.TOMLDecodeError as e:
+        with timing.phase("config load"):
+            return copy.deepcopy(_config_cache.load(cfg_path))
+    except _toml().TOMLDecodeError as e:
         print(f"❌ Error: '{CONFIG_FILE}' configuration file is corrupted: {e}")
         print(f"Please fix the {CONFIG_FILE} file or run 'aisdlc init' in a new directory.")
         sys.exit(1)
@@ -83,11 +309,252 @@ def slugify(text: str) -> str:
         str: A kebab-case slug (e.g., "Hello World!" -> "hello-world").
              Returns DEFAULT_SLUG if the result would be empty.
     """
+    import re
+    import unicodedata
+
     slug = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
     slug = re.sub(r"[^a-zA-Z0-9]+", "-", slug).strip("-").lower()
     return slug or DEFAULT_SLUG
 
 
+def format_size(size: float) -> str:
+    """Return *size* bytes in binary units, e.g. ``"512 B"`` or ``"1.5 MiB"``."""
+    if size < 1024:
+        return f"{int(size)} B"
+    for unit in ("KiB", "MiB", "GiB"):
+        size /= 1024
+        if size < 1024 or unit == "GiB":
+            break
+    return f"{size:.1f} {unit}".replace(".0 ", " ")
+
+
+def resolve_step(steps: list[str], wanted: str) -> str | None:
+    """Return the step named *wanted*, or the only step it is a prefix of."""
+    if wanted in steps:
+        return wanted
+    matches = [s for s in steps if s.startswith(wanted)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def step_of_file(filename: str, slug: str, steps: list[str]) -> str | None:
+    """Return the step whose output file ``<step>-<slug>.md`` is *filename*, if any."""
+    suffix = f"-{slug}.md"
+    if not filename.endswith(suffix):
+        return None
+    step = filename[: -len(suffix)]
+    return step if step in steps else None
+
+
+def pop_option(args: list[str], name: str) -> str | None:
+    """Remove ``name VALUE`` (or ``name=VALUE``) from *args* and return VALUE.
+
+    Raises:
+        ValueError: If the option is given without a value.
+    """
+    for i, arg in enumerate(args):
+        if arg == name:
+            if i + 1 >= len(args):
+                raise ValueError(f"{name} requires a value")
+            value = args[i + 1]
+            del args[i : i + 2]
+            return value
+        if arg.startswith(name + "="):
+            del args[i]
+            return arg.split("=", 1)[1]
+    return None
+
+
+def pop_flag(args: list[str], name: str) -> bool:
+    """Remove the boolean flag *name* from *args*, returning whether it was present."""
+    if name in args:
+        args.remove(name)
+        return True
+    return False
+
+
+def atomic_write_text(path: Path, text: str, *, durable: bool = True) -> None:
+    """Replace *path* with *text* so readers never observe a partial file.
+
+    The content goes to a temporary file in the same directory which is then
+    renamed over *path*.  With *durable*, the data and the rename are fsync'ed
+    so the new content also survives a crash or power loss.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    import tempfile
+
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        os.chmod(tmp, mode)  # mkstemp creates 0600; keep the file's usual permissions
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    if durable and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+# Chunk size for streaming copies when no zero-copy syscall is available
+COPY_CHUNK = 1 << 20
+
+# errno values meaning "this zero-copy syscall does not work for these files"
+_NO_ZERO_COPY = {
+    "ENOSYS",
+    "EXDEV",
+    "EINVAL",
+    "EOPNOTSUPP",
+    "ENOTSUP",
+    "EBADF",
+    "ENOTSOCK",
+}
+
+
+# errno values meaning "this filesystem cannot hardlink these files"
+_NO_HARDLINK = {"EXDEV", "EPERM", "EMLINK", "ENOTSUP", "EOPNOTSUPP"}
+
+
+def cannot_hardlink(error: OSError) -> bool:
+    """Return whether *error* from ``os.link`` means links are unsupported there.
+
+    Callers fall back to a regular copy instead of failing.
+    """
+    import errno
+
+    return any(error.errno == getattr(errno, name, None) for name in _NO_HARDLINK)
+
+
+def copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """Append *count* bytes of *src_fd* starting at *offset* to *dst_fd*.
+
+    Uses ``copy_file_range`` or ``sendfile`` so the data never passes through
+    Python, falling back to bounded ``pread``/``write`` chunks.  Memory use is
+    constant regardless of *count*.
+
+    Raises:
+        OSError: If reading or writing fails.
+    """
+    import errno
+
+    no_zero_copy = {
+        getattr(errno, name) for name in _NO_ZERO_COPY if hasattr(errno, name)
+    }
+    for syscall in ("copy_file_range", "sendfile"):
+        if count <= 0:
+            return
+        if not hasattr(os, syscall):
+            continue
+        try:
+            while count > 0:
+                if syscall == "copy_file_range":
+                    n = os.copy_file_range(src_fd, dst_fd, min(count, 1 << 30), offset)
+                else:
+                    n = os.sendfile(dst_fd, src_fd, offset, min(count, 1 << 30))
+                if n == 0:
+                    raise OSError(f"unexpected end of file at offset {offset}")
+                offset += n
+                count -= n
+            return
+        except OSError as e:
+            if e.errno not in no_zero_copy:
+                raise
+    while count > 0:
+        chunk = os.pread(src_fd, min(count, COPY_CHUNK), offset)
+        if not chunk:
+            raise OSError(f"unexpected end of file at offset {offset}")
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+        offset += len(chunk)
+        count -= len(chunk)
+
+
+def lock_timeout(conf: dict[str, Any] | None = None) -> float:
+    """Return the state-lock wait timeout in seconds (env > config > default)."""
+    raw = os.environ.get(LOCK_TIMEOUT_ENV)
+    if raw is None and conf is not None:
+        raw = conf.get("lock_timeout")
+    try:
+        return float(raw) if raw is not None else DEFAULT_LOCK_TIMEOUT
+    except ValueError:
+        return DEFAULT_LOCK_TIMEOUT
+
+
+_lock_owner = threading.local()
+
+
+@contextlib.contextmanager
+def lock_transaction(timeout: float | None = None) -> Iterator[None]:
+    """Hold the project's advisory state lock for the duration of the block.
+
+    Wrap every read-modify-write of the lock file in this so concurrent
+    `aisdlc` processes cannot lose each other's updates.  Nested use on the
+    same thread joins the outer lock.  On platforms without ``fcntl`` the
+    block runs unlocked.
+
+    Args:
+        timeout: Seconds to wait for the lock (default: `lock_timeout()`).
+
+    Raises:
+        TimeoutError: If another process holds the lock for longer than *timeout*.
+    """
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover – Windows
+        yield
+        return
+
+    if getattr(_lock_owner, "depth", 0):
+        _lock_owner.depth += 1
+        try:
+            yield
+        finally:
+            _lock_owner.depth -= 1
+        return
+
+    timeout = lock_timeout() if timeout is None else timeout
+    guard = get_root() / LOCK_GUARD_FILE
+    fd = os.open(guard, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        delay = 0.005
+        with timing.phase("lock acquire"):
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(
+                            f"Timed out after {timeout:g}s waiting for '{LOCK_FILE}' "
+                            f"(another aisdlc command is running; see {LOCK_TIMEOUT_ENV})"
+                        ) from None
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.1)
+        _lock_owner.depth = 1
+        try:
+            yield
+        finally:
+            _lock_owner.depth = 0
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
 def read_lock() -> dict[str, Any]:
     """Read and parse the .aisdlc.lock file.
 
@@ -95,11 +562,19 @@ def read_lock() -> dict[str, Any]:
         dict[str, Any]: Lock file contents as a dictionary.
                        Returns empty dict if file doesn't exist or is corrupted.
     """
-    path = ROOT / LOCK_FILE
+    import copy
+    import json
+
+    path = get_root() / LOCK_FILE
     if not path.exists():
         return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))  # type: ignore[no-any-return]
+        if _file_cache is not None:
+            return copy.deepcopy(_file_cache.get(path, json.loads))
+        with timing.phase("lock read") as span:
+            text = path.read_text(encoding="utf-8")
+            span["bytes"] = len(text)
+        return json.loads(text)  # type: ignore[no-any-return]
     except json.JSONDecodeError:
         print(
             f"⚠️  Warning: '{LOCK_FILE}' file is corrupted or not valid JSON. Treating as empty."
@@ -113,15 +588,25 @@ def read_lock() -> dict[str, Any]:
 def write_lock(data: dict[str, Any]) -> None:
     """Write lock data to .aisdlc.lock file.
 
+    The file is replaced atomically (temp file, fsync, rename), so a crash
+    mid-write leaves the previous state intact.  Callers doing read-modify-write
+    should hold `lock_transaction()`.
+
     Args:
         data: Dictionary to write as JSON to the lock file.
 
     Raises:
         OSError: If the file cannot be written.
     """
-    lock_path = ROOT / LOCK_FILE
+    import json
+
+    lock_path = get_root() / LOCK_FILE
+    if _file_cache is not None:
+        _file_cache.invalidate(lock_path)
+    payload = json.dumps(data, indent=2)
     try:
-        lock_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        with timing.phase("lock write", bytes=len(payload)):
+            atomic_write_text(lock_path, payload)
     except OSError as e:
         print(f"❌ Error: Could not write to '{LOCK_FILE}' file: {e}")
         raise
@@ -0,0 +1,255 @@
+"""Change notification for `aisdlc watch`.
+
+`open_watcher` watches the active directory and every workstream directory
+in it, and reports which workstream directories changed:
+
+* `InotifyWatcher` uses Linux inotify through `ctypes` (no dependency),
+  so an idle watch costs nothing until a file is written.
+* `PollingWatcher` is the fallback elsewhere, and for network filesystems
+  whose remote changes inotify does not see.  Each poll stats the active
+  directory and each workstream directory, listing none of them.
+
+`Debouncer` decides when a changed file is complete: its ``(mtime, size)``
+must stay the same for a settle period, so editors that save in several
+writes (or write a temporary file and rename it) do not trigger early.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import struct
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Protocol
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_BASE_MASK = _IN_CREATE | _IN_MOVED_TO | _IN_DELETE | _IN_MOVED_FROM | _IN_ONLYDIR
+_WORKDIR_MASK = _BASE_MASK | _IN_MODIFY | _IN_CLOSE_WRITE
+_EVENT = struct.Struct("iIII")
+
+DEFAULT_SETTLE = 2.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class Watcher(Protocol):
+    """Reports the workstream directories in which files changed."""
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block until something changes or *timeout* seconds pass.
+
+        Returns:
+            set[Path]: Workstream directories that changed (possibly empty).
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the watcher's resources."""
+        ...
+
+
+def workdirs(base: Path) -> list[Path]:
+    """Return the workstream directories in *base*."""
+    try:
+        return sorted(
+            Path(e.path)
+            for e in os.scandir(base)
+            if e.is_dir() and not e.name.startswith(".")
+        )
+    except OSError:
+        return []
+
+
+class InotifyWatcher:
+    """Watch *base* and its workstream directories with Linux inotify.
+
+    Raises:
+        OSError: If inotify is not available or *base* cannot be watched.
+    """
+
+    def __init__(self, base: Path) -> None:
+        import ctypes
+        import ctypes.util
+
+        self.base = base
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        try:
+            self._add = libc.inotify_add_watch
+            init = libc.inotify_init1
+        except AttributeError:
+            raise OSError("inotify is not available on this platform") from None
+        self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._base_wd = self._watch(base, _BASE_MASK)
+            for workdir in workdirs(base):
+                self._watch(workdir, _WORKDIR_MASK)
+        except BaseException:
+            self.close()
+            raise
+
+    def _watch(self, path: Path, mask: int) -> int:
+        import ctypes
+
+        wd = int(self._add(self.fd, os.fsencode(path), mask))
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch: {os.strerror(err)}", str(path))
+        self._dirs[wd] = path
+        return wd
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed: set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            raw = data[offset + _EVENT.size : offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            name = os.fsdecode(raw.rstrip(b"\0"))
+            if mask & _IN_Q_OVERFLOW:
+                return set(workdirs(self.base))  # Events were lost: check everything
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)  # Directory removed or renamed away
+                continue
+            if wd == self._base_wd:
+                if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    workdir = self.base / name
+                    try:
+                        self._watch(workdir, _WORKDIR_MASK)
+                    except OSError:
+                        continue  # Already gone again
+                    changed.add(workdir)
+            elif wd in self._dirs and name:
+                changed.add(self._dirs[wd])
+        return changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """Poll *base* and its workstream directories for mtime changes."""
+
+    def __init__(self, base: Path, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.base = base
+        self.interval = interval
+        self._base_mtime = self._mtime(base)
+        self._mtimes = {d: self._mtime(d) for d in workdirs(base)}
+
+    @staticmethod
+    def _mtime(path: Path) -> int | None:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        base_mtime = self._mtime(self.base)
+        if base_mtime != self._base_mtime:
+            self._base_mtime = base_mtime
+            current = workdirs(self.base)
+            self._mtimes = {d: self._mtimes.get(d) for d in current}
+        changed = set()
+        for workdir, old in self._mtimes.items():
+            mtime = self._mtime(workdir)
+            if mtime != old:
+                self._mtimes[workdir] = mtime
+                changed.add(workdir)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(
+    base: Path, *, poll: bool = False, interval: float = DEFAULT_POLL_INTERVAL
+) -> Watcher:
+    """Return an inotify watcher for *base*, or a polling one if unavailable or *poll*."""
+    if not poll:
+        try:
+            return InotifyWatcher(base)
+        except OSError:
+            pass
+    return PollingWatcher(base, interval)
+
+
+class Debouncer:
+    """Track changed files until they have been stable for *settle* seconds."""
+
+    def __init__(
+        self,
+        settle: float = DEFAULT_SETTLE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settle = settle
+        self._clock = clock
+        self._pending: dict[Path, tuple[tuple[int, int], float]] = {}
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def touch(self, path: Path) -> None:
+        """Note that *path* may have changed; restart its settle period if it did."""
+        sig = self._signature(path)
+        if sig is None:
+            self._pending.pop(path, None)
+            return
+        old = self._pending.get(path)
+        if old is None or old[0] != sig:
+            self._pending[path] = (sig, self._clock() + self.settle)
+
+    def due(self) -> list[Path]:
+        """Return (and forget) the files that are non-empty and unchanged for the settle period."""
+        now = self._clock()
+        ready = []
+        for path, (sig, deadline) in list(self._pending.items()):
+            if deadline > now:
+                continue
+            current = self._signature(path)
+            if current != sig:
+                self.touch(path)  # Still being written: wait again
+            elif sig[1] == 0:
+                # Created but not written yet; in-place writes do not change the
+                # directory's mtime, so keep checking rather than forgetting it
+                self._pending[path] = (sig, now + self.settle)
+            else:
+                del self._pending[path]
+                ready.append(path)
+        return sorted(ready)
+
+    def timeout(self) -> float | None:
+        """Return the seconds until the next file may be due, or None if none is pending."""
+        if not self._pending:
+            return None
+        return max(min(d for _, d in self._pending.values()) - self._clock(), 0.0)
@@ -0,0 +1,13 @@
+"""Performance benchmarks for ai-sdlc.
+
+Run from the repository root::
+
+    python -m benchmarks                       # full suite -> benchmark-results.json
+    python -m benchmarks --quick               # smaller data, fewer repeats
+    python -m benchmarks --compare baseline.json --threshold 0.25
+
+Every benchmark works on synthetic projects generated by `benchmarks.datagen`
+in a temporary directory, so runs never touch a real project.  See
+`benchmarks.suite` for the measured operations and `benchmarks.compare` for
+the regression check.
+"""
@@ -0,0 +1,108 @@
+"""Command line of the benchmark suite: ``python -m benchmarks --help``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks import compare, suite
+
+DEFAULT_OUTPUT = "benchmark-results.json"
+
+
+def _override(value: str) -> tuple[str, float]:
+    name, sep, limit = value.partition("=")
+    try:
+        if not sep or not name:
+            raise ValueError
+        return name, float(limit)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected METRIC=FRACTION, got '{value}'"
+        ) from None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite, write the results and optionally compare them with a baseline.
+
+    Returns:
+        int: 0, or 1 if a metric regressed past its threshold.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="ai-sdlc performance benchmarks."
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help=f"benchmarks to run (default: all; {', '.join(suite.BENCHMARKS)})",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="smaller data and fewer repeats"
+    )
+    parser.add_argument("--repeat", type=int, help="timed runs per metric")
+    parser.add_argument(
+        "--output", default=DEFAULT_OUTPUT, help="results file to write"
+    )
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="results file to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=compare.DEFAULT_THRESHOLD,
+        help="allowed slowdown of a median as a fraction (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--metric-threshold",
+        type=_override,
+        action="append",
+        default=[],
+        metavar="METRIC=FRACTION",
+        help="allowed slowdown of one metric (repeatable)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=compare.DEFAULT_MIN_DELTA,
+        help="ignore differences below this many seconds (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = compare.load(Path(args.compare))
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read baseline: {e}")
+    try:
+        metrics = suite.run(args.names, quick=args.quick, repeat=args.repeat)
+    except ValueError as e:
+        parser.error(str(e))
+
+    compare.print_table(metrics)
+    current = compare.results(metrics, quick=args.quick)
+    Path(args.output).write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults written to {args.output}")
+    if baseline is None:
+        return 0
+
+    changes = compare.compare(
+        baseline,
+        current,
+        threshold=args.threshold,
+        overrides=dict(args.metric_threshold),
+        min_delta=args.min_delta,
+    )
+    print(f"\nCompared with {args.compare}")
+    compare.print_changes(changes)
+    regressions = [c.name for c in changes if c.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Result files and the regression check against a stored baseline."""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.suite import Metric
+
+FORMAT = 1
+
+#: Default allowed slowdown of a metric's median, as a fraction of the baseline
+DEFAULT_THRESHOLD = 0.25
+
+#: Differences below this many seconds are noise, whatever the ratio
+DEFAULT_MIN_DELTA = 0.001
+
+
+def results(metrics: list[Metric], *, quick: bool) -> dict[str, Any]:
+    """Return the JSON document describing a run."""
+    return {
+        "format": FORMAT,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "metrics": {m.name: m.to_json() for m in metrics},
+    }
+
+
+def load(path: Path) -> dict[str, Any]:
+    """Read a results file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If it is not a results file of a known format.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("format") != FORMAT:
+        raise ValueError(f"{path} is not a format {FORMAT} benchmark results file")
+    return data
+
+
+@dataclass
+class Change:
+    """One metric present in both the baseline and the current run."""
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    overrides: dict[str, float] | None = None,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[Change]:
+    """Compare the medians of every metric the two runs have in common.
+
+    A metric regresses when its median grew by more than its threshold
+    (*overrides* by metric name, else *threshold*) and by more than
+    *min_delta* seconds.
+    """
+    overrides = overrides or {}
+    changes = []
+    for name, before in sorted(baseline["metrics"].items()):
+        after = current["metrics"].get(name)
+        if after is None:
+            continue
+        limit = overrides.get(name, threshold)
+        old, new = float(before["median"]), float(after["median"])
+        regressed = new > old * (1 + limit) and new - old > min_delta
+        changes.append(Change(name, old, new, limit, regressed))
+    return changes
+
+
+def print_table(metrics: list[Metric]) -> None:
+    """Print the medians of a run."""
+    print(f"{'Metric':34} {'median':>10} {'min':>10} {'runs':>5}")
+    for m in metrics:
+        data = m.to_json()
+        print(
+            f"{m.name:34} {_ms(data['median']):>10} {_ms(data['min']):>10} {data['runs']:>5}"
+        )
+
+
+def print_changes(changes: list[Change], out: Any = sys.stdout) -> None:
+    """Print the comparison against the baseline."""
+    print(f"{'Metric':34} {'baseline':>10} {'current':>10} {'change':>8}", file=out)
+    for c in changes:
+        flag = f"  REGRESSION (> +{c.threshold:.0%})" if c.regressed else ""
+        print(
+            f"{c.name:34} {_ms(c.baseline):>10} {_ms(c.current):>10} "
+            f"{c.ratio - 1:>+8.1%}{flag}",
+            file=out,
+        )
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f}ms"
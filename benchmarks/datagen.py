@@ -0,0 +1,113 @@
+"""Synthetic data for the benchmarks: projects, workstreams and step files."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import shutil
+import time
+from pathlib import Path
+
+from ai_sdlc.utils import CONFIG_FILE, LOCK_FILE
+
+SCAFFOLD = Path(__file__).resolve().parent.parent / "ai_sdlc" / "scaffold_template"
+
+# fmt: off
+_WORDS = (
+    "service", "api", "user", "request", "latency", "cache", "index", "token",
+    "workflow", "schema", "deploy", "queue", "retry", "timeout", "budget", "metric",
+    "trace", "storage", "replica", "shard", "backlog", "feature", "review", "design",
+    "risk", "owner", "milestone", "endpoint", "payload", "contract", "migration",
+)
+# fmt: on
+
+
+def make_project(root: Path, *, state_backend: str = "json") -> list[str]:
+    """Create a project at *root* from the scaffold template and return its steps."""
+    root.mkdir(parents=True, exist_ok=True)
+    config = (SCAFFOLD / CONFIG_FILE).read_text(encoding="utf-8")
+    config = config.replace(
+        'state_backend = "json"', f'state_backend = "{state_backend}"'
+    )
+    (root / CONFIG_FILE).write_text(config, encoding="utf-8")
+    shutil.copytree(SCAFFOLD / "prompts", root / "prompts", dirs_exist_ok=True)
+    for name in ("doing", "done"):
+        (root / name).mkdir(exist_ok=True)
+
+    import tomllib
+
+    return list(tomllib.loads(config)["steps"])
+
+
+def age(root: Path, seconds: float = 10.0) -> None:
+    """Backdate every file and directory under *root* by *seconds*.
+
+    Caches keyed on mtimes ignore files modified within the last second (see
+    ``ai_sdlc.utils._RACY_WINDOW_NS``); freshly generated data would otherwise
+    never be served from them.
+    """
+    past = time.time() - seconds
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (past, past))
+
+
+def markdown(size: int, seed: int = 0) -> str:
+    """Return a deterministic markdown document of about *size* bytes."""
+    rng = random.Random(seed)
+    parts: list[str] = []
+    total = 0
+    section = 0
+    while total < size:
+        if section % 8 == 0:
+            line = f"\n## Section {section // 8 + 1}\n\n"
+        else:
+            words = rng.choices(_WORDS, k=rng.randint(8, 24))
+            line = "- " + " ".join(words).capitalize() + ".\n"
+        parts.append(line)
+        total += len(line)
+        section += 1
+    return "".join(parts)[:size]
+
+
+def make_workstream(
+    root: Path, slug: str, steps: list[str], current: str, *, size: int = 2048
+) -> Path:
+    """Write the step files of *slug* up to and including *current*.
+
+    The file of *current* is *size* bytes; earlier steps get 2 KB each.
+
+    Returns:
+        Path: The workstream directory.
+    """
+    workdir = root / "doing" / slug
+    workdir.mkdir(parents=True, exist_ok=True)
+    upto = steps.index(current)
+    for i, step in enumerate(steps[: upto + 1]):
+        length = size if i == upto else 2048
+        (workdir / f"{step}-{slug}.md").write_text(
+            markdown(length, seed=i), encoding="utf-8"
+        )
+    return workdir
+
+
+def select(root: Path, slug: str, current: str) -> None:
+    """Make *slug* at *current* the workstream tracked in the JSON lock file."""
+    lock = {"slug": slug, "current": current, "created": "2024-01-01T00:00:00+00:00"}
+    (root / LOCK_FILE).write_text(json.dumps(lock, indent=2), encoding="utf-8")
+
+
+def make_many(root: Path, steps: list[str], count: int, *, seed: int = 0) -> list[str]:
+    """Create *count* small workstreams spread over all steps and return their slugs."""
+    rng = random.Random(seed)
+    slugs = []
+    doing = root / "doing"
+    body = markdown(256)
+    for n in range(count):
+        slug = f"feature-{n:05d}"
+        workdir = doing / slug
+        workdir.mkdir(parents=True, exist_ok=True)
+        for step in steps[: rng.randint(1, len(steps))]:
+            (workdir / f"{step}-{slug}.md").write_text(body, encoding="utf-8")
+        slugs.append(slug)
+    return slugs
@@ -0,0 +1,289 @@
+"""The benchmarks: each one builds its synthetic data, then times one operation.
+
+A benchmark is a function registered with `@benchmark` that receives a
+`Context` and records one or more metrics through `Context.measure` or
+`Context.record`.  Metric names are stable across runs (data sizes are part
+of the name) so results can be compared against a stored baseline.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import io
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from benchmarks import datagen
+
+KB = 1024
+MB = 1024 * KB
+
+_REPO = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class Metric:
+    """Timings of one measured operation, in seconds."""
+
+    name: str
+    samples: list[float]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "unit": "s",
+            "median": statistics.median(self.samples),
+            "min": min(self.samples),
+            "max": max(self.samples),
+            "runs": len(self.samples),
+        }
+
+
+@dataclass
+class Context:
+    """What a benchmark gets: a scratch directory, the mode and the collected metrics."""
+
+    workdir: Path
+    quick: bool
+    repeat: int
+    metrics: list[Metric] = field(default_factory=list)
+
+    def project(
+        self, name: str, *, state_backend: str = "json"
+    ) -> tuple[Path, list[str]]:
+        """Create a fresh synthetic project and make it the current root."""
+        from ai_sdlc import utils
+
+        root = self.workdir / name
+        steps = datagen.make_project(root, state_backend=state_backend)
+        datagen.age(root)
+        utils.set_root(root)
+        return root, steps
+
+    def measure(
+        self,
+        name: str,
+        fn: Callable[[], object],
+        *,
+        setup: Callable[[], object] | None = None,
+        repeat: int | None = None,
+        warmup: int = 1,
+    ) -> Metric:
+        """Time *fn* (after *setup*, which is not timed) and record the samples."""
+        samples = []
+        for i in range(warmup + (repeat or self.repeat)):
+            if setup is not None:
+                setup()
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with _quiet():
+                    start = time.perf_counter()
+                    fn()
+                    elapsed = time.perf_counter() - start
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            if i >= warmup:
+                samples.append(elapsed)
+        return self.record(name, samples)
+
+    def record(self, name: str, samples: list[float]) -> Metric:
+        """Record externally timed *samples* as metric *name*."""
+        metric = Metric(name, samples)
+        self.metrics.append(metric)
+        return metric
+
+
+@contextlib.contextmanager
+def _quiet() -> Iterator[None]:
+    """Swallow the commands' console output (and their SystemExit(0))."""
+    with (
+        contextlib.redirect_stdout(io.StringIO()),
+        contextlib.redirect_stderr(io.StringIO()),
+    ):
+        try:
+            yield
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise
+
+
+Benchmark = Callable[[Context], None]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(fn: Benchmark) -> Benchmark:
+    """Register *fn* under its name (without the ``bench_`` prefix)."""
+    BENCHMARKS[fn.__name__.removeprefix("bench_")] = fn
+    return fn
+
+
+@benchmark
+def bench_cli_startup(ctx: Context) -> None:
+    """Cold start of a fresh interpreter: bare Python, `import ai_sdlc.cli`, `aisdlc status`."""
+    root, steps = ctx.project("startup")
+    datagen.make_workstream(root, "startup", steps, steps[1])
+    datagen.select(root, "startup", steps[1])
+    env = {**os.environ, "AISDLC_NO_DAEMON": "1", "PYTHONDONTWRITEBYTECODE": "1"}
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(_REPO), env.get("PYTHONPATH")])
+    )
+    commands = {
+        "startup.python": [sys.executable, "-c", "pass"],
+        "startup.import_cli": [sys.executable, "-c", "import ai_sdlc.cli"],
+        "startup.status": [sys.executable, "-m", "ai_sdlc.cli", "status"],
+    }
+    for name, argv in commands.items():
+        samples = []
+        for i in range(1 + ctx.repeat):
+            start = time.perf_counter()
+            subprocess.run(argv, cwd=root, env=env, check=True, capture_output=True)
+            if i:  # The first run warms the OS page cache
+                samples.append(time.perf_counter() - start)
+        ctx.record(name, samples)
+
+
+@benchmark
+def bench_load_config(ctx: Context) -> None:
+    """`load_config` from scratch, from the on-disk sidecar and from the in-process memo."""
+    from ai_sdlc import utils
+
+    root, _ = ctx.project("config")
+    sidecar = root / utils.CACHE_DIR / utils.ConfigCache.SIDECAR
+
+    def fresh() -> None:
+        utils._config_cache = utils.ConfigCache()
+
+    def cold() -> None:
+        fresh()
+        sidecar.unlink(missing_ok=True)
+
+    ctx.measure(
+        "load_config.parse", utils.load_config, setup=cold, repeat=ctx.repeat * 10
+    )
+    ctx.measure(
+        "load_config.sidecar", utils.load_config, setup=fresh, repeat=ctx.repeat * 10
+    )
+    ctx.measure("load_config.memo", utils.load_config, repeat=ctx.repeat * 10)
+
+
+@benchmark
+def bench_lock(ctx: Context) -> None:
+    """`read_lock` and the durable `write_lock` of the JSON state file."""
+    from ai_sdlc import utils
+
+    root, steps = ctx.project("lock")
+    datagen.select(root, "lock", steps[0])
+    data = utils.read_lock()
+    ctx.measure("lock.read", utils.read_lock, repeat=ctx.repeat * 10)
+    ctx.measure("lock.write", lambda: utils.write_lock(data), repeat=ctx.repeat * 10)
+
+
+@benchmark
+def bench_next(ctx: Context) -> None:
+    """`run_next` rendering a prompt from previous-step files of 1 KB up to 50 MB."""
+    sizes = [1 * KB, 1 * MB] if ctx.quick else [1 * KB, 1 * MB, 10 * MB, 50 * MB]
+    for size in sizes:
+        _next_prompt(ctx, size)
+
+
+def _next_prompt(ctx: Context, size: int) -> None:
+    from ai_sdlc.commands.next import run_next
+
+    slug = f"next-{_size_label(size).lower()}"
+    root, steps = ctx.project(slug)
+    workdir = datagen.make_workstream(root, slug, steps, steps[0], size=size)
+    prompt = workdir / f"_prompt-{steps[1]}.md"
+
+    def reset() -> None:
+        datagen.select(root, slug, steps[0])
+        prompt.unlink(missing_ok=True)
+
+    repeat = ctx.repeat if size < 10 * MB else max(1, ctx.repeat // 2)
+    ctx.measure(
+        f"next.prompt[{_size_label(size)}]", run_next, setup=reset, repeat=repeat
+    )
+
+
+@benchmark
+def bench_done(ctx: Context) -> None:
+    """`run_done` validating and archiving a finished workstream."""
+    from ai_sdlc.commands.done import run_done
+
+    root, steps = ctx.project("done")
+
+    def finished() -> None:
+        shutil.rmtree(root / "done", ignore_errors=True)
+        (root / "done").mkdir()
+        datagen.make_workstream(root, "done", steps, steps[-1])
+        datagen.select(root, "done", steps[-1])
+
+    ctx.measure("done.archive", run_done, setup=finished)
+
+
+@benchmark
+def bench_status(ctx: Context) -> None:
+    """`status --all` over many workstreams (cold and warm manifest) and sqlite `status`."""
+    from ai_sdlc import manifest, state, utils
+    from ai_sdlc.commands.status import run_status
+
+    count = 1_000 if ctx.quick else 10_000
+    root, steps = ctx.project("status", state_backend="sqlite")
+    slugs = datagen.make_many(root, steps, count)
+    with (
+        state.SqliteBackend(root / utils.STATE_DB_FILE) as backend,
+        backend.transaction(),
+    ):
+        for slug in slugs:
+            backend.put({"slug": slug, "current": steps[0], "created": "2024-01-01"})
+    datagen.age(root / "doing")
+
+    def cold() -> None:
+        manifest.manifest_path(root).unlink(missing_ok=True)
+
+    ctx.measure(f"status.all_cold[{count}]", lambda: run_status(["--all"]), setup=cold)
+    ctx.measure(f"status.all_warm[{count}]", lambda: run_status(["--all"]))
+    ctx.measure(f"status.sqlite[{count}]", run_status)
+
+
+def _size_label(size: int) -> str:
+    from ai_sdlc.utils import format_size
+
+    return format_size(size).replace(" ", "")
+
+
+def run(
+    names: list[str] | None = None, *, quick: bool = False, repeat: int | None = None
+) -> list[Metric]:
+    """Run the selected benchmarks (default: all) and return their metrics."""
+    from ai_sdlc import utils
+
+    selected = names or list(BENCHMARKS)
+    unknown = [n for n in selected if n not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"unknown benchmark(s): {', '.join(unknown)}")
+    metrics: list[Metric] = []
+    saved_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="aisdlc-bench-") as tmp:
+        for name in selected:
+            ctx = Context(Path(tmp) / name, quick, repeat or (3 if quick else 5))
+            ctx.workdir.mkdir()
+            os.chdir(ctx.workdir)
+            try:
+                BENCHMARKS[name](ctx)
+            finally:
+                os.chdir(saved_cwd)
+                utils.set_root(None)
+            metrics.extend(ctx.metrics)
+            shutil.rmtree(ctx.workdir, ignore_errors=True)
+    return metrics
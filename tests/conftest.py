@@ -1,9 +1,27 @@
 """Pytest configuration and shared fixtures."""
 
+import json
+import os
+import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pytest
 
+from ai_sdlc import utils
+
+
+@pytest.fixture(autouse=True)
+def _unpinned_root() -> Iterator[None]:
+    """Run every test without a project root pinned by an earlier one.
+
+    Tests pin their root with `utils.set_root`; patching ``utils.ROOT`` would
+    run the discovery first and leave the discovered root pinned afterwards.
+    """
+    utils.set_root(None)
+    yield
+    utils.set_root(None)
+
 
 @pytest.fixture
 def temp_project_dir(tmp_path: Path) -> Path:
@@ -18,3 +36,47 @@ def temp_project_dir(tmp_path: Path) -> Path:
     # tmp_path is a pytest fixture providing a temporary directory unique to the test
     # For more complex setups, you might copy baseline files here
     return tmp_path
+
+
+@pytest.fixture
+def age() -> Callable[..., None]:
+    """Return a helper that backdates a file, or a whole tree, by some seconds.
+
+    Caches keyed on mtimes distrust entries changed within the last second;
+    aged paths are outside that racy window.
+    """
+
+    def backdate(root: Path, seconds: float = 10.0) -> None:
+        past = time.time() - seconds
+        for path in [root, *root.rglob("*")]:
+            os.utime(path, (past, past))
+
+    return backdate
+
+
+@pytest.fixture
+def make_project(temp_project_dir: Path) -> Callable[..., Path]:
+    """Return a factory that writes a project into the temporary directory.
+
+    ``make_project(steps, config="", template=None)`` writes `.aisdlc` with
+    *steps* followed by the TOML text *config*, pins the project root with
+    `utils.set_root` and returns it.  With a *template*, every step but the
+    first also gets ``prompts/<step>.instructions.md`` containing
+    ``template.format(step=step)``.  Calling it again rewrites the config.
+    """
+
+    def make(steps: list[str], config: str = "", template: str | None = None) -> Path:
+        utils.set_root(temp_project_dir)
+        (temp_project_dir / ".aisdlc").write_text(
+            f"steps = {json.dumps(steps)}\n{config}", encoding="utf-8"
+        )
+        if template is not None:
+            prompts = temp_project_dir / "prompts"
+            prompts.mkdir(exist_ok=True)
+            for step in steps[1:]:
+                (prompts / f"{step}.instructions.md").write_text(
+                    template.format(step=step), encoding="utf-8"
+                )
+        return temp_project_dir
+
+    return make
@@ -4,6 +4,8 @@ import json
 import subprocess
 from pathlib import Path
 
+from ai_sdlc import utils
+
 # This assumes 'aisdlc' is installed and in PATH, or you can call it via 'python -m ai_sdlc.cli'
 AISDLC_CMD = ["aisdlc"]  # Or ["python", "-m", "ai_sdlc.cli"]
 
@@ -30,7 +32,7 @@ def run_aisdlc_command(cwd: Path, *args: str) -> subprocess.CompletedProcess[str
 # Remove the mock_cursor_agent fixture since we're now tool-agnostic
 
 
-def test_full_lifecycle_flow(temp_project_dir: Path, mocker) -> None:
+def test_full_lifecycle_flow(temp_project_dir: Path) -> None:
     """Test the entire aisdlc workflow from init through next to done.
 
     This integration test verifies:
@@ -41,11 +43,9 @@ def test_full_lifecycle_flow(temp_project_dir: Path, mocker) -> None:
     - Archiving completed features works
     """
 
-    # Patch ROOT to point to our temp directory for all utils functions
-    mocker.patch("ai_sdlc.utils.ROOT", temp_project_dir)
-    mocker.patch("ai_sdlc.commands.new.ROOT", temp_project_dir)
-    mocker.patch("ai_sdlc.commands.next.ROOT", temp_project_dir)
-    mocker.patch("ai_sdlc.commands.done.ROOT", temp_project_dir)
+    # Pin the project root to our temp directory for all utils functions
+    # (commands resolve it through utils.get_root())
+    utils.set_root(temp_project_dir)
 
     # 1. Run init command
     # This will now create .aisdlc, prompts/, doing/, done/, .aisdlc.lock
@@ -0,0 +1,88 @@
+"""Unit tests for ai_sdlc.archive and the show/archive commands."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import archive
+from ai_sdlc.commands.archive import run_archive
+from ai_sdlc.commands.done import run_done
+from ai_sdlc.commands.show import run_show
+
+STEPS = ["0-idea", "1-prd"]
+
+
+@pytest.fixture
+def project(make_project) -> Path:
+    """A project with one archived workstream directory in done/."""
+    root = make_project(STEPS)
+    workdir = root / "done" / "old"
+    workdir.mkdir(parents=True)
+    for step in STEPS:
+        (workdir / f"{step}-old.md").write_text(f"{step} ✅ " * 200, encoding="utf-8")
+    return root
+
+
+def test_pack_and_read_single_member(tmp_path: Path):
+    """Test that a packed workstream can be read member by member."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "1-prd-x.md").write_text("the prd", encoding="utf-8")
+    (src / "0-idea-x.md").write_text("the idea", encoding="utf-8")
+    done = tmp_path / "done"
+
+    entry = archive.pack(src, done, "x")
+
+    assert entry["files"] == ["0-idea-x.md", "1-prd-x.md"]
+    assert archive.read_member(done, "x", "1-prd-x.md") == b"the prd"
+    assert archive.read_member(done, "x", "2-plus-x.md") is None
+    assert archive.member_names(done, "x") == ["0-idea-x.md", "1-prd-x.md"]
+    with pytest.raises(FileExistsError):
+        archive.pack(src, done, "x")
+    assert not list(done.glob(".*.tmp"))
+
+
+def test_compact_converts_directories_and_show_reads_them(project: Path, capsys):
+    """Test that `archive --compact` packs done/ dirs and `show` still reads them."""
+    run_archive(["--compact"])
+
+    done = project / "done"
+    assert not (done / "old").exists()
+    assert (done / "old.zip").is_file()
+    assert json.loads((done / "index.json").read_text())["old"]["files"] == [
+        "0-idea-old.md",
+        "1-prd-old.md",
+    ]
+    capsys.readouterr()
+
+    run_show(["old", "1"])
+    assert capsys.readouterr().out == "1-prd ✅ " * 200
+
+    with pytest.raises(SystemExit):
+        run_show(["missing", "1-prd"])
+    assert "No workstream 'missing'" in capsys.readouterr().out
+
+
+def test_done_zip_warns_when_the_workstream_dir_cannot_be_removed(
+    project: Path, mocker, capsys
+):
+    """Test that a failed cleanup after archiving is a warning, not an error."""
+    with (project / ".aisdlc").open("a") as f:
+        f.write('archive_format = "zip"\n')
+    workdir = project / "doing" / "feat"
+    workdir.mkdir(parents=True)
+    for step in STEPS:
+        (workdir / f"{step}-feat.md").write_text(step, encoding="utf-8")
+    (project / ".aisdlc.lock").write_text(
+        json.dumps({"slug": "feat", "current": "1-prd", "created": "x"}),
+        encoding="utf-8",
+    )
+    mocker.patch("shutil.rmtree", side_effect=PermissionError("busy"))
+
+    run_done([])
+
+    out = capsys.readouterr().out
+    assert "Archived to" in out and f"Could not remove {workdir}" in out
+    assert (project / "done" / "feat.zip").is_file()
+    assert json.loads((project / ".aisdlc.lock").read_text()) == {}
@@ -0,0 +1,103 @@
+"""Unit tests for `aisdlc batch`."""
+
+import json
+from pathlib import Path
+
+from ai_sdlc.commands.batch import custom_id, parse_custom_id, run_batch
+
+STEPS = ["0-idea", "1-prd", "2-plus"]
+
+
+def _project(make_project) -> Path:
+    root = make_project(
+        STEPS, '[llm]\nmodel = "batch-model"\n', "# {step}\n{{{{ prev_step }}}}\n"
+    )
+    active = root / "doing"
+    for slug in ("auth", "billing"):
+        (active / slug).mkdir(parents=True)
+        (active / slug / f"0-idea-{slug}.md").write_text(
+            f"{slug} idea", encoding="utf-8"
+        )
+    (root / ".aisdlc.lock").write_text(
+        json.dumps({"slug": "auth", "current": "0-idea", "created": "x"})
+    )
+    return active
+
+
+def _result(ident: str, content: str | None, status: int = 200) -> str:
+    body = {
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]
+    }
+    if status != 200:
+        body = {"error": {"message": "rate limited"}}
+    record = {
+        "id": "r",
+        "custom_id": ident,
+        "response": {"status_code": status, "body": body},
+    }
+    return json.dumps(record) + "\n"
+
+
+def test_custom_id_round_trip():
+    """Test that request IDs encode and decode slug and step."""
+    assert parse_custom_id(custom_id("my-feature", "1-prd")) == ("my-feature", "1-prd")
+    assert parse_custom_id("batch_req_123") is None
+    assert parse_custom_id(None) is None
+
+
+def test_export_then_import(temp_project_dir: Path, make_project, capsys):
+    """Test that exported requests are answered into step files and advance state."""
+    active = _project(make_project)
+    requests = temp_project_dir / "requests.jsonl"
+
+    run_batch(["export", "--out", str(requests)])
+    lines = [json.loads(line) for line in requests.read_text().splitlines()]
+    assert [r["custom_id"] for r in lines] == ["auth::1-prd", "billing::1-prd"]
+    assert lines[0]["url"] == "/v1/chat/completions"
+    assert lines[0]["body"]["model"] == "batch-model"
+    assert "auth idea" in lines[0]["body"]["messages"][-1]["content"]
+    assert (active / "auth" / "_prompt-1-prd.md").exists()
+
+    results = temp_project_dir / "results.jsonl"
+    results.write_text(
+        _result("billing::1-prd", "billing PRD")
+        + _result("auth::1-prd", "auth PRD")
+        + _result("auth::2-plus", "too early")
+        + _result("ghost::1-prd", "no such workstream")
+        + "not json\n"
+    )
+    run_batch(["import", str(results)])
+
+    assert (active / "auth" / "1-prd-auth.md").read_text() == "auth PRD"
+    assert (active / "billing" / "1-prd-billing.md").read_text() == "billing PRD"
+    assert not (active / "auth" / "2-plus-auth.md").exists()
+    assert not (active / "auth" / "_prompt-1-prd.md").exists()
+    lock = json.loads((temp_project_dir / ".aisdlc.lock").read_text())
+    assert lock["current"] == "1-prd"
+    out = capsys.readouterr().out
+    assert "✅ advanced" in out and "✅ written" in out
+    assert (
+        "stale: workstream is at 0-idea" in out
+        and "stale: workstream is not active" in out
+    )
+    assert "malformed result" in out
+
+    # Importing the same results again writes nothing new
+    run_batch(["import", str(results)])
+    assert (active / "auth" / "1-prd-auth.md").read_text() == "auth PRD"
+
+
+def test_import_reports_failed_requests(temp_project_dir: Path, make_project, capsys):
+    """Test that failed batch requests are reported and leave the workstream as is."""
+    active = _project(make_project)
+    results = temp_project_dir / "results.jsonl"
+    results.write_text(_result("auth::1-prd", None, status=429))
+
+    run_batch(["import", str(results)])
+
+    assert "request failed: rate limited" in capsys.readouterr().out
+    assert not (active / "auth" / "1-prd-auth.md").exists()
+    assert (
+        json.loads((temp_project_dir / ".aisdlc.lock").read_text())["current"]
+        == "0-idea"
+    )
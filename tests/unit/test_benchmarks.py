@@ -0,0 +1,44 @@
+"""Unit tests for the benchmark suite's data generators and regression check."""
+
+from pathlib import Path
+
+from benchmarks import compare, datagen
+from benchmarks.suite import Metric
+
+
+def test_generators(tmp_path: Path):
+    """Test that synthetic projects, step files and workstreams have the asked shape."""
+    steps = datagen.make_project(tmp_path)
+    assert steps[0] == "0.idea" and (tmp_path / "prompts").is_dir()
+    assert len(datagen.markdown(5000)) == 5000
+    assert datagen.markdown(100, seed=1) == datagen.markdown(100, seed=1)
+
+    workdir = datagen.make_workstream(tmp_path, "big", steps, steps[2], size=10_000)
+    assert (workdir / f"{steps[2]}-big.md").stat().st_size == 10_000
+    assert not (workdir / f"{steps[3]}-big.md").exists()
+    assert len(datagen.make_many(tmp_path, steps, 25)) == 25
+
+
+def test_compare_flags_regressions_past_threshold():
+    """Test that only medians slower than threshold and min delta regress."""
+    baseline = compare.results(
+        [
+            Metric("a", [0.100]),
+            Metric("b", [0.100]),
+            Metric("tiny", [0.0001]),
+            Metric("gone", [1]),
+        ],
+        quick=True,
+    )
+    current = compare.results(
+        [Metric("a", [0.120]), Metric("b", [0.140]), Metric("tiny", [0.0005])],
+        quick=True,
+    )
+
+    changes = {c.name: c for c in compare.compare(baseline, current, threshold=0.25)}
+    assert set(changes) == {"a", "b", "tiny"}
+    assert not changes["a"].regressed and changes["b"].regressed
+    assert not changes["tiny"].regressed  # 5x slower, but well under a millisecond
+
+    relaxed = compare.compare(baseline, current, threshold=0.25, overrides={"b": 0.5})
+    assert not any(c.regressed for c in relaxed)
@@ -0,0 +1,62 @@
+"""Unit tests for ai_sdlc.blobs module."""
+
+import errno
+import os
+from pathlib import Path
+
+from ai_sdlc import blobs
+
+
+def test_store_links_identical_files_to_one_object(tmp_path: Path):
+    """Test that identical files end up sharing the inode of one object."""
+    objects = tmp_path / "objects"
+    a = tmp_path / "a" / "_prompt-1.md"
+    b = tmp_path / "b" / "_prompt-1.md"
+    other = tmp_path / "b" / "other.md"
+    for path, text in ((a, "same prompt"), (b, "same prompt"), (other, "different")):
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    assert blobs.store(a, objects)
+    assert blobs.store(b, objects)
+    assert blobs.store(b, objects)  # Storing again is a no-op
+    assert blobs.store_tree(tmp_path / "b", objects) == (2, 0)
+
+    assert os.path.samefile(a, b)
+    assert a.stat().st_nlink == 3  # a, b and the object
+    assert not a.stat().st_mode & 0o222  # Shared files are read-only
+    assert b.read_text(encoding="utf-8") == "same prompt"
+    assert len([p for p in objects.rglob("*") if p.is_file()]) == 2
+    assert not list(tmp_path.rglob("*.link"))
+
+
+def test_store_without_hardlinks_keeps_a_writable_copy(tmp_path: Path, mocker):
+    """Test that a file that cannot be linked is left untouched and writable."""
+    path = tmp_path / "_prompt-1.md"
+    path.write_text("prompt", encoding="utf-8")
+    mode = path.stat().st_mode
+    mocker.patch("os.link", side_effect=OSError(errno.EXDEV, "cross-device link"))
+
+    assert not blobs.store(path, tmp_path / "objects")
+    assert path.stat().st_mode == mode
+
+
+def test_gc_removes_only_unreferenced_objects(tmp_path: Path):
+    """Test that gc reclaims objects whose workstream files are gone."""
+    objects = tmp_path / "objects"
+    kept = tmp_path / "kept.md"
+    gone = tmp_path / "gone.md"
+    kept.write_text("kept", encoding="utf-8")
+    gone.write_text("gone!", encoding="utf-8")
+    blobs.store(kept, objects)
+    blobs.store(gone, objects)
+    gone.unlink()
+
+    dry = blobs.gc(objects, dry_run=True)
+    assert (dry.removed, dry.kept) == (1, 1)
+    assert len([p for p in objects.rglob("*") if p.is_file()]) == 2
+
+    result = blobs.gc(objects)
+    assert (result.removed, result.reclaimed_bytes, result.kept) == (1, 5, 1)
+    remaining = [p for p in objects.rglob("*") if p.is_file()]
+    assert len(remaining) == 1 and os.path.samefile(remaining[0], kept)
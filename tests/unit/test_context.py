@@ -0,0 +1,92 @@
+"""Unit tests for ai_sdlc.context module."""
+
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import context
+from ai_sdlc.commands import next as next_cmd
+
+
+def test_estimate_tokens_is_proportional():
+    """Test that the estimate grows with the text and counts punctuation."""
+    assert context.estimate_tokens("") == 0
+    assert context.estimate_tokens("hello world") == 3  # 11 chars / 4, rounded up
+    assert context.estimate_tokens("a, b; c.") == 6
+    prose = "The quick brown fox jumps over the lazy dog. " * 100
+    assert 900 <= context.estimate_tokens(prose) <= 1300
+
+
+def test_split_sections_ignores_code_fences():
+    """Test that headings inside fenced code do not start a section."""
+    text = "intro\n# One\nbody\n```\n# not a heading\n```\n## Two\n#hashtag\n"
+    sections = context.split_sections(text)
+    assert sections == [
+        "intro\n",
+        "# One\nbody\n```\n# not a heading\n```\n",
+        "## Two\n#hashtag\n",
+    ]
+    assert "".join(sections) == text
+
+
+def test_assemble_drops_whole_steps_then_trims_sections(tmp_path: Path):
+    """Test the trimming order: least important step, then trailing sections."""
+    prev = tmp_path / "prev.md"
+    prev.write_text(
+        "# Prev\n\n## Keep\n" + "keep " * 100 + "\n## Tail\n" + "tail " * 100,
+        encoding="utf-8",
+    )
+    important = tmp_path / "important.md"
+    important.write_text("important " * 50, encoding="utf-8")
+    minor = tmp_path / "minor.md"
+    minor.write_text("minor " * 50, encoding="utf-8")
+    sources = [
+        ("important", important),
+        ("minor", minor),
+        ("gone", tmp_path / "gone.md"),
+    ]
+
+    roomy = context.assemble("template", ("prev", prev), sources, 10_000)
+    assert [s.step for s in roomy.sources] == ["prev", "important", "minor"]
+    assert [(s.step, s.status) for s in roomy.left_out] == [("gone", "missing")]
+
+    tight = context.assemble("template", ("prev", prev), sources, 180)
+    assert [s.step for s in tight.sources] == ["prev"]
+    assert [s.step for s in tight.left_out] == ["gone", "minor", "important"]
+    assert tight.sources[0].status == "trimmed"
+    assert "## Keep" in tight.sources[0].text and "## Tail" not in tight.sources[0].text
+    assert tight.total_tokens <= 180
+    assert "(dropped, " in tight.report()
+
+    tiny = context.assemble("template", ("minor", minor), [], 20)
+    assert tiny.sources[0].status == "truncated"
+    assert tiny.total_tokens <= 20
+
+
+def test_next_includes_configured_context(temp_project_dir: Path, make_project):
+    """Test that `next` prepends context steps and appends the token report."""
+    make_project(
+        ["0-idea", "1-prd", "2-plus"],
+        'max_tokens = 5000\n\n[context]\n"2-plus" = ["0-idea"]\n',
+        "Review:\n<prev_step></prev_step>\n",
+    )
+    workdir = temp_project_dir / "doing" / "demo"
+    workdir.mkdir(parents=True)
+    (workdir / "0-idea-demo.md").write_text("# Demo\nthe idea", encoding="utf-8")
+    (workdir / "1-prd-demo.md").write_text("the prd", encoding="utf-8")
+
+    files = next_cmd.plan_step(next_cmd.load_config(), "demo", "1-prd")
+    next_cmd.generate_prompt(files)
+
+    text = files.prompt_output_file.read_text(encoding="utf-8")
+    assert text.startswith(
+        '<context step="0-idea">\n# Demo\nthe idea\n</context>\n\nReview:\nthe prd\n'
+    )
+    assert "<!-- aisdlc context (estimated tokens, budget 5,000):" in text
+
+
+def test_context_must_name_earlier_steps():
+    """Test that a context step that is not an earlier step is rejected."""
+    conf = {"steps": ["a", "b", "c"], "context": {"b": ["c"]}}
+    with pytest.raises(ValueError, match="not an earlier step"):
+        context.context_steps(conf, "b")
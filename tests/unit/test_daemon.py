@@ -0,0 +1,86 @@
+"""Unit tests for ai_sdlc.daemon module."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import daemon, utils
+
+CONFIG = 'steps = ["0.idea", "1.prd"]\n'
+
+
+@pytest.fixture
+def running_daemon(tmp_path: Path, monkeypatch):
+    """Start a daemon on a private socket and stop it after the test."""
+    # AF_UNIX paths are limited to ~100 bytes, so keep the socket short
+    sock = Path("/tmp") / f"aisdlc-test-{os.getpid()}.sock"
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(sock))
+    monkeypatch.delenv(daemon.NO_DAEMON_ENV, raising=False)
+    monkeypatch.setattr(utils, "_file_cache", None)
+    thread = threading.Thread(target=daemon.serve, args=(sock,), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if sock.exists():
+            break
+        time.sleep(0.01)
+    yield sock
+    daemon.stop(sock)
+    thread.join(timeout=5)
+
+
+def test_forward_without_daemon(tmp_path: Path, monkeypatch):
+    """Test that forward falls back when no daemon is listening."""
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(tmp_path / "missing.sock"))
+    assert daemon.forward(["status"]) is None
+
+
+def test_forward_ignores_untrusted_socket_paths(
+    running_daemon: Path, tmp_path: Path, monkeypatch
+):
+    """Test that a non-socket or another user's socket is never sent a request."""
+    impostor = tmp_path / "aisdlc.sock"
+    impostor.write_text("", encoding="utf-8")
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(impostor))
+    assert daemon.forward(["status"]) is None
+
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(running_daemon))
+    with monkeypatch.context() as m:
+        m.setattr(os, "getuid", lambda: running_daemon.stat().st_uid + 1)
+        assert daemon.forward(["status"]) is None
+
+
+def test_forward_runs_command_in_daemon(
+    running_daemon: Path, tmp_path: Path, monkeypatch, capsys
+):
+    """Test that commands are executed by the daemon in the client's directory."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / ".aisdlc").write_text(CONFIG, encoding="utf-8")
+    (project / ".aisdlc.lock").write_text(
+        '{"slug": "demo", "current": "0.idea"}', encoding="utf-8"
+    )
+    monkeypatch.chdir(project)
+
+    assert daemon.forward(["status"]) == 0
+    assert "demo" in capsys.readouterr().out
+
+    # Bad invocations report their exit code instead of killing the daemon
+    assert daemon.forward(["bogus"]) == 1
+    assert "Usage" in capsys.readouterr().out
+    assert daemon.forward(["status"]) == 0
+
+
+def test_file_cache_revalidates_on_change(tmp_path: Path):
+    """Test that the file cache notices edits to a cached file."""
+    cache = utils.FileCache()
+    path = tmp_path / "file.txt"
+    path.write_text("old", encoding="utf-8")
+    old = time.time_ns() - 5 * utils._RACY_WINDOW_NS
+    os.utime(path, ns=(old, old))
+    assert cache.get(path, str.upper) == "OLD"
+
+    path.write_text("new!", encoding="utf-8")
+    assert cache.get(path, str.upper) == "NEW!"
@@ -0,0 +1,115 @@
+"""Unit tests for the workstream event history and `aisdlc stats`."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import events
+from ai_sdlc.commands.done import run_done
+from ai_sdlc.commands.new import run_new
+from ai_sdlc.commands.next import PLACEHOLDER, run_next
+from ai_sdlc.commands.stats import percentile, run_stats, summarize
+
+STEPS = ["0-idea", "1-prd"]
+
+
+def _project(make_project) -> dict:
+    make_project(STEPS, template=f"# PRD\n{PLACEHOLDER}\n")
+    return {"steps": STEPS}
+
+
+def _kinds(log: Path) -> list[str]:
+    return [json.loads(line)["event"] for line in log.read_text().splitlines()]
+
+
+def test_lifecycle_is_recorded_and_summarised(
+    temp_project_dir: Path, make_project, capsys
+):
+    """Test that new, next and done record events that stats aggregates."""
+    conf = _project(make_project)
+
+    run_new(["Login", "page"])
+    workdir = temp_project_dir / "doing" / "login-page"
+    (workdir / "0-idea-login-page.md").write_text("idea", encoding="utf-8")
+    run_next([])
+    (workdir / "1-prd-login-page.md").write_text("x" * 400, encoding="utf-8")
+    run_next([])
+    log = workdir / events.EVENTS_FILE
+    # `next` regenerates the prompt on every call, also the one that advances
+    assert _kinds(log) == ["entered", "prompt", "prompt", "output", "entered"]
+    run_done([])
+
+    facts = events.collect(conf)
+    assert list(facts) == ["done/login-page"]
+    [f] = facts.values()
+    assert set(f.entered) == set(STEPS)
+    assert f.output_bytes == {"1-prd": 400}
+    assert f.prompt_bytes["1-prd"] > 0
+    assert f.archived is not None
+
+    capsys.readouterr()
+    run_stats(["--json"])
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["workstreams"] == stats["archived"] == 1
+    assert set(stats["steps"]) == {"1-prd", "(archive)"}
+    assert sum(w["steps"] for w in stats["weekly"].values()) == 1
+    assert stats["prompts"]["1-prd"]["estimated_tokens"] > 0
+
+
+def test_failed_archiving_records_no_archived_event(
+    temp_project_dir: Path, make_project, mocker
+):
+    """Test that the archived event is taken back when packing the zip fails."""
+    _project(make_project)
+    with (temp_project_dir / ".aisdlc").open("a") as f:
+        f.write('archive_format = "zip"\n')
+    run_new(["Feat"])
+    workdir = temp_project_dir / "doing" / "feat"
+    (workdir / "1-prd-feat.md").write_text("prd", encoding="utf-8")
+    run_next([])
+    mocker.patch("ai_sdlc.archive.pack", side_effect=OSError("disk full"))
+
+    with pytest.raises(SystemExit):
+        run_done([])
+
+    assert "archived" not in _kinds(workdir / events.EVENTS_FILE)
+    assert events.collect({"steps": STEPS})["doing/feat"].archived is None
+
+
+def test_collect_reads_only_appended_lines(
+    temp_project_dir: Path, make_project, mocker
+):
+    """Test that collect resumes each log from the cached offset."""
+    conf = _project(make_project)
+    workdir = temp_project_dir / "doing" / "feat"
+    workdir.mkdir(parents=True)
+    events.record(workdir, "entered", step="0-idea")
+    assert events.collect(conf, temp_project_dir)["doing/feat"].entered.keys() == {
+        "0-idea"
+    }
+
+    read = mocker.spy(events, "_read")
+    events.collect(conf, temp_project_dir)
+    assert read.call_count == 0  # Unchanged logs come from the cache
+
+    size = (workdir / events.EVENTS_FILE).stat().st_size
+    events.record(workdir, "entered", step="1-prd")
+    with (workdir / events.EVENTS_FILE).open("a") as f:
+        f.write('{"t": 1, "event": "arch')  # A line still being written
+    facts = events.collect(conf, temp_project_dir)["doing/feat"]
+    assert read.call_args.args[2] == size
+    assert facts.entered.keys() == {"0-idea", "1-prd"}
+    assert facts.archived is None
+
+
+def test_summarize_durations_and_percentile():
+    """Test per-step durations and the nearest-rank percentile."""
+    facts = {
+        f"doing/w{i}": events.Facts(entered={"0-idea": 0.0, "1-prd": 60.0 * i})
+        for i in range(1, 11)
+    }
+    summary = summarize(STEPS, facts)
+    assert sorted(summary.durations["1-prd"]) == [60.0 * i for i in range(1, 11)]
+    assert percentile(summary.durations["1-prd"], 90) == 540.0
+    assert percentile([5.0], 90) == 5.0
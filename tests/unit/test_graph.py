@@ -0,0 +1,115 @@
+"""Unit tests for DAG step dependencies (ai_sdlc.graph) and the commands using them."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import graph
+from ai_sdlc.commands import next as next_cmd
+from ai_sdlc.commands.done import run_done
+from ai_sdlc.commands.run import run_run
+from ai_sdlc.mock_llm import MockServer, reply_for
+
+STEPS = ["0-idea", "1-prd", "2-design", "3-tests"]
+# 3-tests only needs the PRD, so it can be written alongside 2-design
+DEPENDS = '[depends]\n"3-tests" = ["1-prd"]\n'
+TEMPLATE = "# {step}\n{{{{ prev_step }}}}\n"
+
+
+@pytest.fixture
+def project(make_project) -> Path:
+    """A DAG project with a workstream whose PRD is written."""
+    root = make_project(STEPS, DEPENDS, TEMPLATE)
+    workdir = root / "doing" / "auth"
+    workdir.mkdir(parents=True)
+    for step in STEPS[:2]:
+        (workdir / f"{step}-auth.md").write_text(f"{step} text", encoding="utf-8")
+    (root / ".aisdlc.lock").write_text(
+        json.dumps({"slug": "auth", "current": "1-prd", "created": "x"}),
+        encoding="utf-8",
+    )
+    return root
+
+
+def test_dependencies_validation_and_rendering():
+    """Test that the [depends] table is checked, defaulted and drawn as a tree."""
+    assert graph.dependencies({"steps": STEPS}) is None
+    deps = graph.dependencies({"steps": STEPS, "depends": {"3-tests": ["1-prd"]}})
+    assert deps == {
+        "0-idea": [],
+        "1-prd": ["0-idea"],
+        "2-design": ["1-prd"],
+        "3-tests": ["1-prd"],
+    }
+    bad_tables = (
+        {"9-nope": ["0-idea"]},
+        {"3-tests": "1-prd"},
+        {"3-tests": []},
+        {"1-prd": ["1-prd"]},
+        {"1-prd": ["3-tests"]},
+    )
+    for bad in bad_tables:
+        with pytest.raises(ValueError):
+            graph.dependencies({"steps": STEPS, "depends": bad})
+
+    done = {"0-idea", "1-prd"}
+    assert graph.ready(deps, STEPS, done) == ["2-design", "3-tests"]
+    assert graph.leaves(deps, STEPS) == ["2-design", "3-tests"]
+    assert graph.render(deps, STEPS, done, {"3-tests"}) == [
+        "✅ 0-idea",
+        "└─ ✅ 1-prd",
+        "   ├─ ▶ 2-design",
+        "   └─ 📝 3-tests",
+    ]
+
+
+def test_next_prompts_parallel_branches_and_done_checks_leaves(project: Path, capsys):
+    """Test that next prompts every ready branch and done waits for every leaf."""
+    workdir = project / "doing" / "auth"
+    lock = project / ".aisdlc.lock"
+
+    next_cmd.run_next()
+    assert "2 independent steps are ready" in capsys.readouterr().out
+    for step in ("2-design", "3-tests"):
+        prompt = (workdir / f"_prompt-{step}.md").read_text(encoding="utf-8")
+        assert prompt == f"# {step}\n1-prd text\n"
+
+    (workdir / "3-tests-auth.md").write_text("tests", encoding="utf-8")
+    run_done()
+    assert "Waiting for: 2-design" in capsys.readouterr().out
+
+    next_cmd.run_next()
+    assert "Completed step: 3-tests" in capsys.readouterr().out
+    assert not (workdir / "_prompt-3-tests.md").exists()
+    assert (workdir / "_prompt-2-design.md").exists()
+    assert json.loads(lock.read_text())["current"] == "3-tests"
+
+    (workdir / "2-design-auth.md").write_text("design", encoding="utf-8")
+    next_cmd.run_next()
+    out = capsys.readouterr().out
+    assert "Completed step: 2-design" in out and "All steps complete" in out
+    # The furthest step in `steps` order stays the recorded one
+    assert json.loads(lock.read_text())["current"] == "3-tests"
+
+    run_done()
+    assert (project / "done" / "auth" / "2-design-auth.md").exists()
+
+
+def test_run_executes_independent_branches_concurrently(
+    project: Path, make_project, capsys
+):
+    """Test that `aisdlc run` runs every ready step in one round and records them."""
+    workdir = project / "doing" / "auth"
+    with MockServer(port=0).running() as server:
+        llm_table = f'[llm]\nbase_url = "{server.base_url}"\nmodel = "mock"\n'
+        make_project(STEPS, llm_table + DEPENDS)
+        run_run()
+
+    out = capsys.readouterr().out
+    assert "Running 2 independent steps concurrently: 2-design, 3-tests" in out
+    for step in ("2-design", "3-tests"):
+        expected = reply_for(f"# {step}\n1-prd text\n", "mock")
+        assert (workdir / f"{step}-auth.md").read_text(encoding="utf-8") == expected
+        assert not (workdir / f"_prompt-{step}.md").exists()
+    assert json.loads((project / ".aisdlc.lock").read_text())["current"] == "3-tests"
@@ -0,0 +1,126 @@
+"""Unit tests for ai_sdlc.ideas and `aisdlc new --from-file`."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import ideas
+from ai_sdlc.commands.new import idea_text, run_new
+from ai_sdlc.state import get_backend
+
+STEPS = ["0-idea", "1-prd"]
+
+
+def test_parse_csv_jsonl_and_markdown():
+    """Test that each format yields titles and bodies, and malformed entries are reported."""
+    csv_text = (
+        "ID,Summary,Description\n1,Login  page,Users cannot sign in\n,,\n2,Export,\n"
+    )
+    assert ideas.parse(csv_text, "csv") == [
+        ideas.Idea("Login page", "Users cannot sign in"),
+        ideas.Idea("Export"),
+    ]
+    jsonl_text = '"Dark mode"\n\n{"title": "Search", "body": "Find things"}\n'
+    assert ideas.parse(jsonl_text, "jsonl") == [
+        ideas.Idea("Dark mode"),
+        ideas.Idea("Search", "Find things"),
+    ]
+    md_text = (
+        "# Backlog\n\n- [ ] Login page\n  - users cannot sign in\n    - even admins\n"
+        "* Export\n\nNotes, not an idea\n1. Dark mode\n"
+    )
+    assert ideas.parse(md_text, "md") == [
+        ideas.Idea("Login page", "- users cannot sign in\n  - even admins"),
+        ideas.Idea("Export"),
+        ideas.Idea("Dark mode"),
+    ]
+    for text, fmt in (
+        ("title,tag\n ,x\n", "csv"),
+        ("[1]\n", "jsonl"),
+        ("{bad\n", "jsonl"),
+    ):
+        with pytest.raises(ValueError, match="line"):
+            ideas.parse(text, fmt)
+    assert ideas.detect_format(Path("x.NDJSON")) == "jsonl"
+    assert ideas.assign_slugs(["a", "a", "b", "a"], {"a", "a-3"}) == [
+        "a-2",
+        "a-4",
+        "b",
+        "a-5",
+    ]
+
+
+def test_new_from_file_registers_all_in_one_transaction(
+    temp_project_dir: Path, make_project, capsys
+):
+    """Test that bulk creation suffixes taken slugs and tracks every workstream."""
+    make_project(STEPS, 'state_backend = "sqlite"\n')
+    (temp_project_dir / "doing" / "login-page").mkdir(parents=True)
+    (temp_project_dir / "done").mkdir()
+    (temp_project_dir / "done" / "export.zip").write_bytes(b"")
+    source = temp_project_dir / "backlog.md"
+    source.write_text("- Login page\n  Users cannot sign in\n- Export\n- Login page\n")
+
+    run_new(["--from-file", str(source)])
+
+    out = capsys.readouterr().out
+    assert "Created 3 workstream(s)" in out
+    assert "'login-page' is taken; created 'login-page-2'" in out
+    doing = temp_project_dir / "doing"
+    assert (doing / "login-page-2" / "0-idea-login-page-2.md").read_text(
+        encoding="utf-8"
+    ) == idea_text("Login page", "Users cannot sign in")
+    assert (doing / "export-2").is_dir() and (doing / "login-page-3").is_dir()
+    backend = get_backend({"state_backend": "sqlite"})
+    tracked = {ws["slug"]: ws["current"] for ws in backend.list()}
+    assert tracked == dict.fromkeys(
+        ["login-page-2", "export-2", "login-page-3"], "0-idea"
+    )
+    assert backend.get()["slug"] == "login-page-2"
+
+
+def test_new_from_file_with_json_lock_selects_the_first_workstream(
+    temp_project_dir: Path, make_project, capsys
+):
+    """Test that the JSON lock selects the first idea, and bad files create nothing."""
+    make_project(STEPS, 'state_backend = "json"\n')
+    source = temp_project_dir / "ideas.jsonl"
+    source.write_text('"One"\n"Two"\n', encoding="utf-8")
+
+    run_new(["--from-file", str(source)])
+
+    assert "selected 'one', the other 1 are untracked" in capsys.readouterr().out
+    lock = json.loads((temp_project_dir / ".aisdlc.lock").read_text())
+    assert (lock["slug"], lock["current"]) == ("one", "0-idea")
+    assert sorted(p.name for p in (temp_project_dir / "doing").iterdir()) == [
+        "one",
+        "two",
+    ]
+
+    source.write_text('"Three"\n42\n', encoding="utf-8")
+    with pytest.raises(SystemExit):
+        run_new(["--from-file", str(source)])
+    assert "line 2" in capsys.readouterr().out
+    assert not (temp_project_dir / "doing" / "three").exists()
+
+
+def test_new_from_file_reports_workstreams_it_could_not_register(
+    temp_project_dir: Path, make_project, mocker, capsys
+):
+    """Test that a busy state lock names the workstreams left created but untracked."""
+    make_project(STEPS, 'state_backend = "sqlite"\n')
+    mocker.patch(
+        "ai_sdlc.state.SqliteBackend.transaction",
+        side_effect=TimeoutError("state busy"),
+    )
+    source = temp_project_dir / "ideas.jsonl"
+    source.write_text('"One"\n"Two"\n', encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        run_new(["--from-file", str(source)])
+
+    out = capsys.readouterr().out
+    assert "state busy" in out
+    assert "Created but untracked: one, two." in out
+    assert (temp_project_dir / "doing" / "two" / "0-idea-two.md").exists()
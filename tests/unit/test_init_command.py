@@ -4,12 +4,13 @@ from pathlib import Path
 
 import pytest
 
+from ai_sdlc import utils
 from ai_sdlc.commands import init
 
 
 def test_run_init(temp_project_dir: Path, mocker):
     """Test that init command creates necessary directories and files."""
-    mocker.patch("ai_sdlc.utils.ROOT", temp_project_dir)
+    utils.set_root(temp_project_dir)
 
     # Mock package resources
     mock_files = mocker.patch("ai_sdlc.commands.init.pkg_resources.files")
@@ -30,3 +31,51 @@ def test_run_init(temp_project_dir: Path, mocker):
 
     # Verify lock file would have been written
     assert mock_write_text.called
+
+
+def test_init_recursive_links_shared_templates(tmp_path: Path, monkeypatch, capsys):
+    """Test that --recursive --link initialises many directories from one cached copy."""
+    from ai_sdlc import template_cache
+
+    monkeypatch.setenv(template_cache.CACHE_ENV, str(tmp_path / "cache"))
+    fresh, existing = tmp_path / "svc-a", tmp_path / "svc-b"
+    fresh.mkdir()
+    existing.mkdir()
+    (existing / ".aisdlc").write_text("custom = true\n", encoding="utf-8")
+    (existing / ".aisdlc.lock").write_text('{"slug": "kept"}', encoding="utf-8")
+
+    init.run_init(["--recursive", "--link", "hardlink", str(fresh), str(existing)])
+    out = capsys.readouterr().out
+
+    [shared] = (tmp_path / "cache").iterdir()
+    for project in (fresh, existing):
+        linked = project / "prompts" / init.PROMPT_FILE_NAMES[0]
+        assert (
+            linked.stat().st_ino == (shared / init.PROMPT_FILE_NAMES[0]).stat().st_ino
+        )
+    assert (existing / ".aisdlc").read_text(encoding="utf-8") == "custom = true\n"
+    assert (existing / ".aisdlc.lock").read_text(encoding="utf-8") == '{"slug": "kept"}'
+    assert "✅ initialised" in out and "✅ added" in out
+    assert f"{2 * len(init.PROMPT_FILE_NAMES)} hardlink" in out
+
+    # Re-running is a no-op, and a missing directory fails the run
+    with pytest.raises(SystemExit):
+        init.run_init(["--recursive", str(fresh), str(tmp_path / "missing")])
+    out = capsys.readouterr().out
+    assert "ℹ️ already initialised" in out and "not a directory" in out
+
+
+def test_template_cache_is_versioned_by_content(tmp_path: Path, monkeypatch):
+    """Test that the cache directory depends on the template contents and is reused."""
+    from ai_sdlc import template_cache
+
+    monkeypatch.setenv(template_cache.CACHE_ENV, str(tmp_path))
+    first = template_cache.ensure({"a.md": "one"})
+    assert template_cache.ensure({"a.md": "one"}) == first
+    assert template_cache.ensure({"a.md": "two"}) != first
+    assert not (first / "a.md").stat().st_mode & 0o222  # Shared copies are read-only
+
+    target = tmp_path / "project-a.md"
+    assert template_cache.install(first / "a.md", target, "symlink") == "symlink"
+    assert target.resolve() == (first / "a.md").resolve()
+    assert target.read_text() == "one"
@@ -0,0 +1,215 @@
+"""Unit tests for ai_sdlc.llm, the mock endpoint and the run command."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import llm
+from ai_sdlc.commands.run import run_run
+from ai_sdlc.mock_llm import MockServer, reply_for
+
+STEPS = ["0-idea", "1-prd", "2-plus"]
+
+
+async def _with_server(server: MockServer, settings: llm.Settings, body):
+    await server.start()
+    settings.base_url = server.base_url
+    try:
+        async with llm.Client(settings) as client:
+            return await body(client)
+    finally:
+        await server.close()
+
+
+def test_settings_validation():
+    """Test that the [llm] table is checked."""
+    assert llm.settings({}).provider == "openai"
+    assert llm.settings({"llm": {"model": "m", "retries": 0}}).model == "m"
+    bad_tables = (
+        {"modle": "m"},
+        {"provider": "nope"},
+        {"retries": -1},
+        {"base_url": "ftp://x"},
+        {"cache": "yes"},
+    )
+    for bad in bad_tables:
+        with pytest.raises(ValueError):
+            llm.settings({"llm": bad})
+
+
+def test_stream_to_file_reuses_connection(tmp_path: Path):
+    """Test that responses stream into the file and share one connection."""
+    server = MockServer(port=0)
+    settings = llm.Settings(model="mock-1")
+    chunks: list[str] = []
+
+    async def body(client: llm.Client):
+        first = await client.complete_to_file(
+            "# Title\nhello", tmp_path / "a.md", chunks.append
+        )
+        second = await client.complete_to_file("again", tmp_path / "b.md")
+        return first, second, client.pool.opened
+
+    first, second, opened = asyncio.run(_with_server(server, settings, body))
+    expected = reply_for("# Title\nhello", "mock-1")
+    assert (tmp_path / "a.md").read_text(encoding="utf-8") == expected
+    assert "".join(chunks) == expected and len(chunks) > 1
+    assert first.chars == len(expected) and first.attempts == 1
+    assert first.first_token_seconds is not None
+    assert (tmp_path / "b.md").exists() and second.attempts == 1
+    assert opened == 1 and server.connections == 1
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_stream_skips_events_without_choices(tmp_path: Path):
+    """Test that usage and prompt filter events with empty choices are skipped."""
+    server = MockServer(port=0, empty_choices=True)
+
+    async def body(client: llm.Client):
+        return await client.complete_to_file("x y", tmp_path / "out.md")
+
+    result = asyncio.run(_with_server(server, llm.Settings(retries=0), body))
+    expected = reply_for("x y", llm.Settings().model)
+    assert (tmp_path / "out.md").read_text(encoding="utf-8") == expected
+    assert result.chars == len(expected)
+    with pytest.raises(llm.LLMError, match="malformed"):
+        llm._delta(b'{"choices": {}}')
+
+
+def test_retries_with_backoff(tmp_path: Path):
+    """Test that 503 replies are retried until the request succeeds."""
+    server = MockServer(port=0, fail_first=2)
+    settings = llm.Settings(backoff=0, retries=2)
+
+    async def body(client: llm.Client):
+        return await client.complete_to_file("x", tmp_path / "out.md")
+
+    result = asyncio.run(_with_server(server, settings, body))
+    assert result.attempts == 3
+    assert server.requests == 3
+
+
+def test_gives_up_after_retries_and_on_client_errors(tmp_path: Path):
+    """Test that exhausted retries and 4xx replies raise LLMError and leave no file."""
+    out = tmp_path / "out.md"
+
+    async def body(client: llm.Client):
+        return await client.complete_to_file("x", out)
+
+    failing = MockServer(port=0, fail_first=5)
+    with pytest.raises(llm.LLMError, match="503"):
+        asyncio.run(_with_server(failing, llm.Settings(backoff=0, retries=1), body))
+
+    server = MockServer(port=0)
+    settings = llm.Settings(retries=3)
+
+    async def wrong_path(client: llm.Client):
+        client.settings.base_url = client.settings.base_url.replace("/v1", "/v2")
+        return await client.complete_to_file("x", out)
+
+    with pytest.raises(llm.HTTPError) as err:
+        asyncio.run(_with_server(server, settings, wrong_path))
+    assert err.value.status == 404 and server.requests == 1
+    assert not out.exists() and not llm.part_file(out).exists()
+
+
+def test_cancelled_stream_leaves_no_part_file(tmp_path: Path):
+    """Test that cancelling a completion mid-stream removes its partial output."""
+    server = MockServer(port=0, delay=0.02)
+    out = tmp_path / "out.md"
+
+    async def body(client: llm.Client):
+        task = asyncio.create_task(client.complete_to_file("x", out))
+        while not llm.part_file(out).exists():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_with_server(server, llm.Settings(), body))
+    assert not out.exists() and not llm.part_file(out).exists()
+
+
+def test_read_timeout(tmp_path: Path):
+    """Test that a stalled stream times out."""
+    server = MockServer(port=0, delay=0.5)
+    settings = llm.Settings(timeout=0.05, retries=0)
+
+    async def body(client: llm.Client):
+        return await client.complete_to_file("x", tmp_path / "out.md")
+
+    with pytest.raises(llm.LLMError, match="attempt"):
+        asyncio.run(_with_server(server, settings, body))
+
+
+def test_run_command_end_to_end(temp_project_dir: Path, make_project, capsys):
+    """Test that `aisdlc run` writes the step file and advances the workstream."""
+    workdir = temp_project_dir / "doing" / "auth"
+    workdir.mkdir(parents=True)
+    (workdir / "0-idea-auth.md").write_text("an idea", encoding="utf-8")
+    lock = temp_project_dir / ".aisdlc.lock"
+    lock.write_text(json.dumps({"slug": "auth", "current": "0-idea", "created": "x"}))
+
+    with MockServer(port=0).running() as server:
+        llm_table = f'[llm]\nbase_url = "{server.base_url}"\nmodel = "mock"\n'
+        make_project(STEPS, llm_table, "# PRD\n{{{{ prev_step }}}}\n")
+        run_run(["--quiet"])
+
+    expected = reply_for("# PRD\nan idea\n", "mock")
+    assert (workdir / "1-prd-auth.md").read_text(encoding="utf-8") == expected
+    assert json.loads(lock.read_text())["current"] == "1-prd"
+    assert not (workdir / "_prompt-1-prd.md").exists()
+    assert "Advanced to step: 1-prd" in capsys.readouterr().out
+
+
+def _pipeline_project(make_project, base_url: str) -> Path:
+    root = make_project(
+        STEPS,
+        f'[llm]\nbase_url = "{base_url}"\nmodel = "mock"\n',
+        "# {step}\n{{{{ prev_step }}}}\n",
+    )
+    workdir = root / "doing" / "auth"
+    workdir.mkdir(parents=True)
+    (workdir / "0-idea-auth.md").write_text("an idea", encoding="utf-8")
+    (root / ".aisdlc.lock").write_text(
+        json.dumps({"slug": "auth", "current": "0-idea", "created": "x"})
+    )
+    return workdir
+
+
+def test_run_through_chains_steps(temp_project_dir: Path, make_project, capsys):
+    """Test that `--through` runs every step up to the target and times each."""
+    with MockServer(port=0).running() as server:
+        workdir = _pipeline_project(make_project, server.base_url)
+        run_run(["--through", "2", "--quiet", "--no-cache"])
+
+    prd = reply_for("# 1-prd\nan idea\n", "mock")
+    assert (workdir / "1-prd-auth.md").read_text(encoding="utf-8") == prd
+    assert (workdir / "2-plus-auth.md").exists()
+    assert (
+        json.loads((temp_project_dir / ".aisdlc.lock").read_text())["current"]
+        == "2-plus"
+    )
+    assert server.requests == 2
+    out = capsys.readouterr().out
+    assert "Wall time" in out and "total" in out
+
+
+def test_run_through_resumes_after_interruption(make_project, capsys):
+    """Test that a step file written before a crash is adopted without a model call."""
+    with MockServer(port=0).running() as server:
+        workdir = _pipeline_project(make_project, server.base_url)
+        (workdir / "1-prd-auth.md").write_text(
+            "written before the crash", encoding="utf-8"
+        )
+        run_run(["--through", "2-plus", "--quiet", "--no-cache"])
+        assert server.requests == 1
+        assert (
+            "2-plus" in server.prompts[0]
+            and "written before the crash" in server.prompts[0]
+        )
+
+        run_run(["--through", "2-plus"])
+    assert "All steps complete" in capsys.readouterr().out
@@ -0,0 +1,120 @@
+"""Unit tests for ai_sdlc.manifest and `aisdlc status --all`."""
+
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import archive, manifest
+from ai_sdlc.commands.status import run_status
+
+STEPS = ["0-idea", "1-prd", "2-design"]
+CONF = {"steps": STEPS}
+
+
+@pytest.fixture
+def project(make_project, age) -> Path:
+    """A project with two active workstreams and one finished one."""
+    root = make_project(STEPS)
+    files = {
+        "doing/auth": ["0-idea-auth.md", "1-prd-auth.md", "_prompt-2-design.md"],
+        "doing/billing": ["0-idea-billing.md", "_prompt-1-prd.md", "notes.txt"],
+        "done/search": ["0-idea-search.md", "1-prd-search.md", "2-design-search.md"],
+    }
+    for rel, names in files.items():
+        (root / rel).mkdir(parents=True)
+        for name in names:
+            (root / rel / name).write_text(name, encoding="utf-8")
+    for path in sorted(root.rglob("*"), reverse=True):
+        age(path, 3600)  # Shown as "1h" in the AGE column
+    return root
+
+
+def test_refresh_derives_steps_and_pending_prompts(project: Path):
+    """Test that the current step comes from the step files present."""
+    snapshot = manifest.refresh(CONF, include_done=True)
+    by_slug = {ws.slug: ws for ws in snapshot.workstreams}
+    assert list(by_slug) == ["auth", "billing", "search"]
+    assert by_slug["auth"].current_step(STEPS) == "1-prd"
+    assert by_slug["auth"].pending_prompts == ["_prompt-2-design.md"]
+    assert by_slug["billing"].current_step(STEPS) == "0-idea"
+    assert by_slug["search"].done and by_slug["search"].pending_prompts == []
+    assert snapshot.rescanned == 3
+
+
+def test_refresh_only_relists_changed_workstreams(project: Path, mocker, age):
+    """Test that unchanged directory mtimes reuse the cached file lists."""
+    manifest.refresh(CONF)
+    listed = mocker.spy(manifest, "_list_dir")
+    assert manifest.refresh(CONF).rescanned == 0
+    assert listed.call_count == 0
+
+    (project / "doing/auth/2-design-auth.md").write_text("design", encoding="utf-8")
+    age(project / "doing/auth")
+    snapshot = manifest.refresh(CONF)
+    assert snapshot.rescanned == 1
+    auth = next(ws for ws in snapshot.workstreams if ws.slug == "auth")
+    assert auth.current_step(STEPS) == "2-design"
+    assert auth.pending_prompts == []
+
+
+def test_refresh_relists_directories_in_racy_window(project: Path):
+    """Test that a directory changed just now is listed again next time."""
+    (project / "doing/billing/1-prd-billing.md").write_text("prd", encoding="utf-8")
+    manifest.refresh(CONF)
+    assert manifest.refresh(CONF).rescanned == 1
+
+
+def test_refresh_reads_zip_archives(project: Path, age):
+    """Test that archived workstreams are listed from the zip directory."""
+    done = project / "done"
+    archive.pack(done / "search", done, "zipped")
+    age(done / "zipped.zip")
+    snapshot = manifest.refresh(CONF, include_done=True)
+    zipped = next(ws for ws in snapshot.workstreams if ws.slug == "zipped")
+    assert zipped.done and zipped.step_mtimes == {}  # Members are named after "search"
+
+    archive.pack(project / "doing/auth", done, "auth")
+    age(done / "auth.zip")
+    age(done)
+    snapshot = manifest.refresh(CONF, include_done=True)
+    archived = [ws for ws in snapshot.workstreams if ws.slug == "auth" and ws.done]
+    assert archived[0].current_step(STEPS) == "1-prd"
+
+
+def test_refresh_keeps_done_entries_when_not_requested(project: Path):
+    """Test that an active-only refresh does not discard the done cache."""
+    manifest.refresh(CONF, include_done=True)
+    manifest.refresh(CONF)
+    assert manifest.refresh(CONF, include_done=True).rescanned == 0
+
+
+def test_status_all_table(project: Path, capsys):
+    """Test the `status --all` output."""
+    run_status(["--all", "--done"])
+    out = capsys.readouterr().out
+    assert "Workstreams (2 active, 1 done)" in out
+    assert "auth                 1-prd                   1h  _prompt-2-design.md" in out
+    assert "2-design (done)" in out
+
+    run_status(["--all"])
+    out = capsys.readouterr().out
+    assert "Workstreams (2 active)" in out
+    assert "search" not in out
+
+
+def test_status_all_steps_shows_every_step_age(project: Path, capsys, age):
+    """Test that `status --steps` lists the age of each step file below its row."""
+    age(project / "doing/auth/0-idea-auth.md", 2 * 86400)
+
+    run_status(["--steps"])
+
+    out = capsys.readouterr().out
+    assert "Workstreams (2 active)" in out
+    assert "    0-idea 2d · 1-prd 1h · 2-design —" in out
+    assert "    0-idea 1h · 1-prd — · 2-design —" in out
+
+
+def test_status_all_rejects_slug(project: Path):
+    """Test that --slug and --all are mutually exclusive."""
+    with pytest.raises(SystemExit):
+        run_status(["--all", "--slug", "auth"])
@@ -0,0 +1,77 @@
+"""Unit tests for ai_sdlc.commands.next module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc.commands import next as next_cmd
+
+STEPS = ["0-idea", "1-prd", "2-plus"]
+
+
+@pytest.fixture
+def project(make_project) -> Path:
+    """A project with three steps and prompt templates for steps 1 and 2."""
+    return make_project(STEPS, template=f"# {{step}}\n{next_cmd.PLACEHOLDER}\n")
+
+
+def _workstream(root: Path, slug: str, *steps: str) -> Path:
+    workdir = root / "doing" / slug
+    workdir.mkdir(parents=True)
+    for step in steps:
+        (workdir / f"{step}-{slug}.md").write_text(
+            f"{step} of {slug}", encoding="utf-8"
+        )
+    return workdir
+
+
+def test_next_all_processes_every_workstream(project: Path, capsys):
+    """Test that --all generates or advances each workstream in doing/."""
+    a = _workstream(project, "a", "0-idea")
+    b = _workstream(project, "b", "0-idea", "1-prd")
+    c = _workstream(project, "c", "0-idea", "1-prd", "2-plus")
+    tracked = _workstream(project, "tracked", "0-idea", "1-prd")
+    (project / ".aisdlc.lock").write_text(
+        json.dumps({"slug": "tracked", "current": "0-idea", "created": "x"}),
+        encoding="utf-8",
+    )
+
+    next_cmd.run_next(["--all", "--workers", "2"])
+    out = capsys.readouterr().out
+
+    assert (a / "_prompt-1-prd.md").read_text(
+        encoding="utf-8"
+    ) == "# 1-prd\n0-idea of a\n"
+    assert (b / "_prompt-2-plus.md").exists()
+    assert not list(c.glob("_prompt-*"))
+    assert "all steps complete" in out
+    # The tracked workstream already had its next file, so only its state moves
+    assert json.loads((project / ".aisdlc.lock").read_text())["current"] == "1-prd"
+    assert not list(tracked.glob("_prompt-*"))
+    assert "4 workstreams" in out
+
+
+def test_next_rejects_bad_workers(project: Path):
+    """Test that an invalid worker count is reported as a usage error."""
+    with pytest.raises(SystemExit):
+        next_cmd.run_next(["--all", "--workers", "0"])
+
+
+def test_stream_merge_matches_str_replace(project: Path, mocker):
+    """Test that the streaming merge equals str.replace, across chunk boundaries."""
+    mocker.patch("ai_sdlc.utils.COPY_CHUNK", 7)  # Force placeholders to straddle chunks
+    template = f"head {next_cmd.PLACEHOLDER} middle ✨ {next_cmd.PLACEHOLDER}{next_cmd.PLACEHOLDER} tail"
+    (project / "prompts" / "1-prd.instructions.md").write_text(
+        template, encoding="utf-8"
+    )
+    prev = "previous step ✅ " * 5000
+    workdir = _workstream(project, "big", "0-idea")
+    (workdir / "0-idea-big.md").write_text(prev, encoding="utf-8")
+
+    files = next_cmd.plan_step({"steps": STEPS}, "big", "0-idea")
+    next_cmd.generate_prompt(files)
+
+    expected = template.replace(next_cmd.PLACEHOLDER, prev)
+    assert files.prompt_output_file.read_text(encoding="utf-8") == expected
+    assert not list(workdir.glob("*.tmp"))
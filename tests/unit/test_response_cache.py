@@ -0,0 +1,71 @@
+"""Unit tests for ai_sdlc.response_cache."""
+
+import asyncio
+from pathlib import Path
+
+from ai_sdlc import llm, response_cache
+from ai_sdlc.mock_llm import MockServer, reply_for
+
+
+def test_key_covers_prompt_and_sampling():
+    """Test that the key changes with the prompt and every sampling setting."""
+    base = llm.Settings().sampling()
+    key = response_cache.cache_key("prompt", base)
+    assert key == response_cache.cache_key("prompt", dict(base))
+    assert key != response_cache.cache_key("prompt!", base)
+    assert key != response_cache.cache_key("prompt", {**base, "model": "other"})
+    assert key != response_cache.cache_key("prompt", {**base, "temperature": 0.7})
+
+
+def test_expiry_and_lru_eviction(tmp_path: Path, mocker):
+    """Test that old entries expire and the least recently used go first."""
+    clock = mocker.patch("ai_sdlc.response_cache.time.time", return_value=1000.0)
+    with response_cache.ResponseCache(
+        tmp_path / "r.db", max_bytes=25, max_age=100
+    ) as cache:
+        cache.put("a", "a" * 10, "m")
+        clock.return_value = 1001.0
+        cache.put("b", "b" * 10, "m")
+        clock.return_value = 1002.0
+        assert cache.get("a") == "a" * 10  # a is now more recently used than b
+        cache.put("c", "c" * 10, "m")
+        assert cache.get("b") is None
+        assert cache.stats() == (2, 20)
+
+        clock.return_value = 1101.0
+        assert cache.get("a") is None  # Created more than max_age ago
+        assert cache.get("c") == "c" * 10
+
+
+def test_client_answers_repeated_prompts_from_cache(tmp_path: Path):
+    """Test that an identical prompt costs no second model call unless refreshed."""
+    server = MockServer(port=0)
+    out = tmp_path / "out.md"
+
+    async def scenario():
+        await server.start()
+        settings = llm.Settings(base_url=server.base_url, model="mock")
+        try:
+            cache = response_cache.open_cache(settings, tmp_path)
+            async with llm.Client(settings, cache) as client:
+                first = await client.complete_to_file("same prompt", out)
+                out.unlink()
+                second = await client.complete_to_file("same prompt", out)
+            cache = response_cache.open_cache(settings, tmp_path)
+            async with llm.Client(settings, cache, refresh=True) as client:
+                third = await client.complete_to_file("same prompt", out)
+            return first, second, third
+        finally:
+            await server.close()
+
+    first, second, third = asyncio.run(scenario())
+    assert first.notes == ["response cache miss"] and first.attempts == 1
+    assert second.notes == ["response cache hit"] and second.attempts == 0
+    assert out.read_text(encoding="utf-8") == reply_for("same prompt", "mock")
+    assert third.notes == ["response cache refreshed"]
+    assert server.requests == 2
+
+
+def test_disabled_cache():
+    """Test that `cache = false` turns the cache off."""
+    assert response_cache.open_cache(llm.Settings(cache=False)) is None
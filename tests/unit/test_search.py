@@ -0,0 +1,92 @@
+"""Unit tests for ai_sdlc.search and the search command."""
+
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import search
+from ai_sdlc.commands.search import run_search
+
+STEPS = ["0-idea", "1-prd"]
+
+
+@pytest.fixture
+def project(make_project) -> Path:
+    """A project with two active workstreams and one archived one."""
+    root = make_project(STEPS)
+    texts = {
+        ("doing", "auth"): [
+            "login with oauth tokens",
+            "PRD: oauth login, oauth refresh",
+        ],
+        ("doing", "billing"): ["invoices and payments", "PRD: payments via stripe"],
+        ("done", "search"): ["full text search", "PRD: search ranking with bm25"],
+    }
+    for (where, slug), bodies in texts.items():
+        workdir = root / where / slug
+        workdir.mkdir(parents=True)
+        for step, body in zip(STEPS, bodies, strict=True):
+            (workdir / f"{step}-{slug}.md").write_text(body, encoding="utf-8")
+    return root
+
+
+def test_bm25_ranking_and_filters(project: Path):
+    """Test that term frequency ranks documents and filters narrow results."""
+    with search.SearchIndex(search.index_path(project), project) as index:
+        assert index.update(list(search.all_docs({"steps": STEPS}, project))) == 6
+
+        hits = index.query("oauth")
+        assert [h.path for h in hits] == [
+            "doing/auth/1-prd-auth.md",
+            "doing/auth/0-idea-auth.md",
+        ]
+        assert hits[0].score > hits[1].score
+
+        assert [h.slug for h in index.query("prd", step="1-prd", slug="search")] == [
+            "search"
+        ]
+        assert index.query("kubernetes") == []
+
+
+def test_update_only_rereads_changed_files(project: Path, mocker, age):
+    """Test that unchanged files are skipped and vanished ones are pruned."""
+    for path in project.rglob("*.md"):
+        age(path)
+    conf = {"steps": STEPS}
+    with search.SearchIndex(search.index_path(project), project) as index:
+        index.update(list(search.all_docs(conf, project)))
+        read = mocker.spy(search, "read_doc")
+
+        edited = project / "doing" / "billing" / "0-idea-billing.md"
+        edited.write_text("invoices, refunds and chargebacks", encoding="utf-8")
+        age(edited)
+        (project / "doing" / "auth" / "1-prd-auth.md").unlink()
+
+        assert (
+            index.update(list(search.all_docs(conf, project)), prune_prefixes=[""]) == 2
+        )
+        assert read.call_count == 1
+        assert [h.slug for h in index.query("chargebacks")] == ["billing"]
+        assert len(index) == 5
+
+
+def test_search_command_builds_index_and_follows_done(project: Path, capsys):
+    """Test that the command builds the index on first use and refresh tracks moves."""
+    run_search(["payments"])
+    out = capsys.readouterr().out
+    assert "Index updated: 6 change(s)" in out
+    assert "doing/billing/1-prd-billing.md" in out
+
+    # Archive 'billing' by hand, as `aisdlc done` would, and refresh just that workstream
+    (project / "done").mkdir(exist_ok=True)
+    (project / "doing" / "billing").rename(project / "done" / "billing")
+    search.refresh(
+        {"steps": STEPS},
+        [project / "done" / "billing"],
+        gone=[project / "doing" / "billing"],
+    )
+
+    run_search(["payments", "--step", "1"])
+    out = capsys.readouterr().out
+    assert "done/billing/1-prd-billing.md" in out
+    assert "doing/billing" not in out
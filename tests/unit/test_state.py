@@ -0,0 +1,68 @@
+"""Unit tests for ai_sdlc.state module."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import state, utils
+
+
+def test_sqlite_backend_migrates_json_lock(temp_project_dir: Path):
+    """Test that an existing JSON lock is imported into a new database."""
+    utils.set_root(temp_project_dir)
+    lock = {"slug": "legacy", "current": "1-prd", "created": "2025-01-01T00:00:00"}
+    (temp_project_dir / utils.LOCK_FILE).write_text(json.dumps(lock), encoding="utf-8")
+
+    with state.get_backend({"state_backend": "sqlite"}) as backend:
+        assert backend.get() == lock
+        assert backend.get("legacy") == lock
+        assert [h["step"] for h in backend.history("legacy")] == ["1-prd"]
+    with pytest.raises(sqlite3.ProgrammingError):  # Closed on leaving the block
+        backend.get()
+
+    # Re-opening must not import the lock twice
+    with state.get_backend({"state_backend": "sqlite"}) as again:
+        assert len(again.list()) == 1
+        assert len(again.history("legacy")) == 1
+
+
+def test_sqlite_backend_many_workstreams(temp_project_dir: Path):
+    """Test that the SQLite backend tracks parallel workstreams and their history."""
+    utils.set_root(temp_project_dir)
+    backend = state.get_backend({"state_backend": "sqlite"})
+    for i in range(200):
+        backend.put(
+            {
+                "slug": f"feature-{i}",
+                "current": "0-idea",
+                "created": f"2025-01-01T00:00:{i:03d}",
+            }
+        )
+
+    assert len(backend.list()) == 200
+    assert backend.get()["slug"] == "feature-199"  # Last written is selected
+
+    ws = backend.get("feature-7")
+    ws["current"] = "1-prd"
+    backend.put(ws)
+    assert backend.get()["slug"] == "feature-7"
+    assert [h["step"] for h in backend.history("feature-7")] == ["0-idea", "1-prd"]
+
+    backend.remove("feature-7")
+    assert backend.get("feature-7") == {}
+    assert backend.get() != {}  # Falls back to another active workstream
+    assert len(backend.list()) == 199
+
+
+def test_json_backend_single_workstream(temp_project_dir: Path):
+    """Test that the JSON backend keeps exactly the one workstream in the lock file."""
+    utils.set_root(temp_project_dir)
+    backend = state.get_backend({})
+    backend.put({"slug": "a", "current": "0-idea", "created": "x"})
+    assert backend.get("b") == {}
+    backend.remove("b")
+    assert backend.get()["slug"] == "a"
+    backend.remove("a")
+    assert backend.list() == []
@@ -0,0 +1,103 @@
+"""Unit tests for ai_sdlc.templates module."""
+
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import templates
+from ai_sdlc.templates import Slots, TemplateError, render
+
+SCAFFOLD_PROMPTS = Path(templates.__file__).parent / "scaffold_template" / "prompts"
+STEPS = ["0.idea", "1.prd", "2.prd-plus", "3.system-template"]
+
+
+@pytest.fixture
+def workstream(tmp_path: Path) -> tuple[Path, Slots]:
+    """Step files for the first three steps of workstream 'demo'."""
+    files = {}
+    for step in STEPS[:3]:
+        files[step] = tmp_path / f"{step}-demo.md"
+        files[step].write_text(f"{step} output", encoding="utf-8")
+    files["0.idea"].write_text("# Demo idea\n\n## Problem\n", encoding="utf-8")
+    return tmp_path, Slots("demo", STEPS, files, "2.prd-plus")
+
+
+def test_multiline_block_in_shipped_template(workstream):
+    """Test that a <prev_step> block on its own lines is filled, keeping the tags."""
+    tmp, slots = workstream
+    out = tmp / "out.md"
+    render(SCAFFOLD_PROMPTS / "3.system-template.instructions.md", out, slots)
+
+    text = out.read_text(encoding="utf-8")
+    assert "<prev_step>\n2.prd-plus output\n</prev_step>" in text
+    assert "{the contents of the prd-plus go here}" not in text
+
+
+def test_slots_and_includes(workstream):
+    """Test named slots, earlier steps, includes and unknown names in one render."""
+    tmp, slots = workstream
+    prompts = tmp / "prompts"
+    (prompts / "partials").mkdir(parents=True)
+    (prompts / "partials" / "role.md").write_text(
+        "Role for {{ slug }}.\n", encoding="utf-8"
+    )
+    template = prompts / "3.system-template.instructions.md"
+    template.write_text(
+        '{% include "partials/role.md" %}'
+        "Idea: {{ title }}\n"
+        "PRD: {{ 1.prd }}\n"
+        "Prev: <prev_step></prev_step> / {{prev_step}}\n"
+        "Keep {{ not_a_slot }}\n",
+        encoding="utf-8",
+    )
+    out = tmp / "out.md"
+    render(template, out, slots)
+
+    assert out.read_text(encoding="utf-8") == (
+        "Role for demo.\n"
+        "Idea: Demo idea\n"
+        "PRD: 1.prd output\n"
+        "Prev: 2.prd-plus output / 2.prd-plus output\n"
+        "Keep {{ not_a_slot }}\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        '{% include "loop.md" %}',
+        "{{ 3.system-template }}",
+        '{% include "../outside.md" %}',
+    ],
+)
+def test_unresolvable_slots_raise(workstream, body):
+    """Test that recursive includes, future steps and escaping includes are rejected."""
+    tmp, slots = workstream
+    (tmp / "outside.md").write_text("x", encoding="utf-8")
+    prompts = tmp / "prompts"
+    prompts.mkdir()
+    (prompts / "loop.md").write_text(body, encoding="utf-8")
+
+    with pytest.raises(TemplateError):
+        render(prompts / "loop.md", tmp / "out.md", slots)
+    assert not list(tmp.glob("out.md*"))
+
+
+def test_compiled_form_cached_by_content_hash(workstream, mocker):
+    """Test that a fresh process reuses the on-disk compiled form."""
+    tmp, slots = workstream
+    cache_dir = tmp / ".aisdlc-cache"
+    template = tmp / "t.md"
+    template.write_text("a <prev_step></prev_step> b", encoding="utf-8")
+
+    render(template, tmp / "first.md", slots, cache_dir)
+    assert len(list((cache_dir / "templates").glob("*.json"))) == 1
+
+    fresh = templates.TemplateCache()
+    mocker.patch("ai_sdlc.templates._template_cache", fresh)
+    compile_spy = mocker.spy(templates, "compile_template")
+    render(template, tmp / "second.md", slots, cache_dir)
+
+    assert compile_spy.call_count == 0
+    assert fresh.stats["disk_hits"] == 1
+    assert (tmp / "second.md").read_text(encoding="utf-8") == "a 2.prd-plus output b"
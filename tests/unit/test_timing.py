@@ -0,0 +1,66 @@
+"""Unit tests for ai_sdlc.timing and the --trace/--profile flags."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import cli, timing
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    """Record phases for one test, starting from a clean slate."""
+    monkeypatch.setattr(timing, "_enabled", False)
+    monkeypatch.setattr(timing, "_phases", [])
+    timing.enable()
+
+
+def test_disabled_phases_record_nothing(monkeypatch):
+    """Test that phases are free no-ops until recording is enabled."""
+    monkeypatch.setattr(timing, "_enabled", False)
+    monkeypatch.setattr(timing, "_phases", [])
+    with timing.phase("quiet", bytes=1) as span:
+        span["bytes"] = 2
+    assert timing._phases == []
+
+
+def test_trace_events(recording, tmp_path: Path):
+    """Test that nested spans and their details are saved as Chrome trace events."""
+    with timing.phase("outer"), timing.phase("inner", step="1.prd") as span:
+        span["bytes"] = 42
+    with pytest.raises(KeyError), timing.phase("failing"):
+        raise KeyError("x")
+
+    out = tmp_path / "trace.json"
+    timing.write_trace(str(out), ["aisdlc", "next"])
+    trace = json.loads(out.read_text())
+    events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert list(events) == ["outer", "inner", "failing"]
+    assert events["inner"]["args"] == {"step": "1.prd", "bytes": 42}
+    assert events["outer"]["ts"] <= events["inner"]["ts"]
+    assert events["inner"]["dur"] <= events["outer"]["dur"]
+    assert events["failing"]["args"] == {"error": "KeyError"}
+    assert trace["otherData"]["argv"] == ["aisdlc", "next"]
+
+
+def test_cli_trace_and_profile(make_project, mocker, monkeypatch, capsys):
+    """Test that --trace and --profile run the command locally and write their files."""
+    monkeypatch.setattr(timing, "_enabled", False)
+    monkeypatch.setattr(timing, "_phases", [])
+    root = make_project(["0.idea", "1.prd"])
+    forward = mocker.patch("ai_sdlc.daemon.forward", return_value=0)
+    (root / ".aisdlc.lock").write_text('{"slug": "demo", "current": "0.idea"}')
+    trace, stats = root / "t.json", root / "p.pstats"
+
+    monkeypatch.setattr(
+        sys, "argv", ["aisdlc", "status", f"--trace={trace}", f"--profile={stats}"]
+    )
+    cli.main()
+
+    forward.assert_not_called()
+    assert "demo" in capsys.readouterr().out
+    names = {e["name"] for e in json.loads(trace.read_text())["traceEvents"]}
+    assert {"run status", "config load", "lock read"} <= names
+    assert stats.stat().st_size > 0
@@ -0,0 +1,119 @@
+"""Unit tests for `aisdlc upgrade-prompts`."""
+
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import prompt_baseline, template_cache
+from ai_sdlc.commands import upgrade_prompts
+from ai_sdlc.commands.init import (
+    PROMPT_FILE_NAMES,
+    Scaffold,
+    init_project,
+    load_scaffold,
+)
+
+FIRST, SECOND, THIRD = PROMPT_FILE_NAMES[:3]
+
+
+def _scaffold(version: str) -> Scaffold:
+    return Scaffold("", {name: f"# {name} {version}\n" for name in PROMPT_FILE_NAMES})
+
+
+def _project(root: Path, **kwargs) -> Path:
+    root.mkdir()
+    init_project(root, _scaffold("v1"), **kwargs)
+    return root / "prompts"
+
+
+@pytest.fixture
+def release_v2(mocker):
+    """Make the packaged templates a newer release than the one projects got."""
+    mocker.patch.object(upgrade_prompts, "load_scaffold", return_value=_scaffold("v2"))
+
+
+def test_upgrade_rewrites_only_unmodified_outdated_files(
+    tmp_path: Path, release_v2, capsys
+):
+    """Test that edited files are kept, unmodified ones upgraded and missing ones added."""
+    prompts = _project(tmp_path / "svc")
+    (prompts / FIRST).write_text("my own prompt\n", encoding="utf-8")
+    (prompts / SECOND).unlink()
+
+    upgrade_prompts.run_upgrade_prompts(["--dry-run", str(tmp_path / "svc")])
+    assert (prompts / THIRD).read_text(encoding="utf-8") == f"# {THIRD} v1\n"
+
+    upgrade_prompts.run_upgrade_prompts([str(tmp_path / "svc")])
+    out = capsys.readouterr().out
+
+    assert (prompts / FIRST).read_text(encoding="utf-8") == "my own prompt\n"
+    assert (prompts / SECOND).read_text(encoding="utf-8") == f"# {SECOND} v2\n"
+    assert (prompts / THIRD).read_text(encoding="utf-8") == f"# {THIRD} v2\n"
+    assert f"Kept customised {prompts / FIRST} (edited since it was installed)" in out
+    assert f"{len(PROMPT_FILE_NAMES) - 2} updated, 1 added, 1 customised" in out
+    baseline = prompt_baseline.load(prompts)
+    assert baseline[THIRD] == prompt_baseline.text_digest(f"# {THIRD} v2\n")
+    assert baseline[FIRST] == prompt_baseline.text_digest(f"# {FIRST} v1\n")
+
+    upgrade_prompts.run_upgrade_prompts([str(tmp_path / "svc")])
+    assert "0 updated, 0 added, 1 customised" in capsys.readouterr().out
+
+
+def test_upgrade_relinks_shared_templates(tmp_path: Path, monkeypatch, release_v2):
+    """Test that hardlinked prompts are relinked to the new release, not written through."""
+    monkeypatch.setenv(template_cache.CACHE_ENV, str(tmp_path / "cache"))
+    old = template_cache.ensure({n: t for n, t in _scaffold("v1").prompts.items() if t})
+    projects = [_project(tmp_path / name, shared=old) for name in ("a", "b")]
+
+    upgrade_prompts.run_upgrade_prompts(
+        ["--workers", "2", *(str(p.parent) for p in projects)]
+    )
+
+    assert (old / FIRST).read_text(encoding="utf-8") == f"# {FIRST} v1\n"
+    new = (projects[0] / FIRST).stat()
+    assert new.st_nlink == 3  # The new cached copy and both projects
+    assert (projects[1] / FIRST).stat().st_ino == new.st_ino
+    assert (projects[0] / FIRST).read_text(encoding="utf-8") == f"# {FIRST} v2\n"
+
+
+def test_upgrade_without_baseline_treats_differences_as_customised(
+    tmp_path: Path, release_v2, capsys
+):
+    """Test that projects from before baselines were recorded are never overwritten."""
+    prompts = _project(tmp_path / "old")
+    (prompts / prompt_baseline.BASELINE_FILE).unlink()
+
+    upgrade_prompts.run_upgrade_prompts([str(tmp_path / "old")])
+
+    assert (prompts / FIRST).read_text(encoding="utf-8") == f"# {FIRST} v1\n"
+    assert "no baseline; differs from package" in capsys.readouterr().out
+
+
+def test_released_digests_cover_the_packaged_templates():
+    """Test that every packaged template is listed as a released version."""
+    for name, text in load_scaffold().prompts.items():
+        assert text is not None
+        assert prompt_baseline.released(name, prompt_baseline.text_digest(text)), name
+
+
+def test_upgrade_without_baseline_replaces_released_templates(
+    tmp_path: Path, capsys, mocker
+):
+    """Test that a pre-baseline project's untouched templates are upgraded."""
+    root = tmp_path / "old"
+    root.mkdir()
+    init_project(root, load_scaffold())
+    prompts = root / "prompts"
+    (prompts / prompt_baseline.BASELINE_FILE).unlink()
+    (prompts / FIRST).write_text("my own prompt\n", encoding="utf-8")
+    mocker.patch.object(upgrade_prompts, "load_scaffold", return_value=_scaffold("v2"))
+
+    upgrade_prompts.run_upgrade_prompts([str(root)])
+
+    out = capsys.readouterr().out
+    assert (prompts / SECOND).read_text(encoding="utf-8") == f"# {SECOND} v2\n"
+    assert (prompts / FIRST).read_text(encoding="utf-8") == "my own prompt\n"
+    assert f"{len(PROMPT_FILE_NAMES) - 1} updated, 0 added, 1 customised" in out
+    assert prompt_baseline.load(prompts)[SECOND] == prompt_baseline.text_digest(
+        f"# {SECOND} v2\n"
+    )
@@ -1,6 +1,7 @@
 """Unit tests for ai_sdlc.utils module."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -30,7 +31,7 @@ def test_slugify_edge_cases():
     assert utils.slugify("a" * 100) == "a" * 100  # Long strings
 
 
-def test_load_config_success(temp_project_dir: Path, mocker):
+def test_load_config_success(temp_project_dir: Path):
     """Test successful loading of valid .aisdlc configuration."""
     mock_aisdlc_content = """
     version = "0.1.0"
@@ -42,9 +43,7 @@ def test_load_config_success(temp_project_dir: Path, mocker):
     aisdlc_file = temp_project_dir / ".aisdlc"
     aisdlc_file.write_text(mock_aisdlc_content, encoding="utf-8")
 
-    mocker.patch(
-        "ai_sdlc.utils.ROOT", temp_project_dir
-    )  # Ensure ROOT points to test dir
+    utils.set_root(temp_project_dir)  # Ensure ROOT points to test dir
 
     config = utils.load_config()
     assert config["version"] == "0.1.0"
@@ -52,9 +51,9 @@ def test_load_config_success(temp_project_dir: Path, mocker):
     assert config["prompt_dir"] == "prompts"
 
 
-def test_load_config_missing(temp_project_dir: Path, mocker):
+def test_load_config_missing(temp_project_dir: Path):
     """Test that load_config exits when .aisdlc file is missing."""
-    mocker.patch("ai_sdlc.utils.ROOT", temp_project_dir)
+    utils.set_root(temp_project_dir)
     with pytest.raises(SystemExit) as exc_info:
         utils.load_config()
     assert exc_info.value.code == 1
@@ -64,7 +63,7 @@ def test_load_config_corrupted(temp_project_dir: Path, mocker):
     """Test that load_config handles corrupted TOML gracefully."""
     aisdlc_file = temp_project_dir / ".aisdlc"
     aisdlc_file.write_text("this is not valid toml content {", encoding="utf-8")  # Corrupted TOML
-    mocker.patch("ai_sdlc.utils.ROOT", temp_project_dir)
+    utils.set_root(temp_project_dir)
     mock_exit = mocker.patch("sys.exit")  # Prevent test suite from exiting
 
     # Should call sys.exit(1)
@@ -72,9 +71,9 @@ def test_load_config_corrupted(temp_project_dir: Path, mocker):
     mock_exit.assert_called_once_with(1)
 
 
-def test_read_write_lock(temp_project_dir: Path, mocker):
+def test_read_write_lock(temp_project_dir: Path):
     """Test reading and writing lock files."""
-    mocker.patch("ai_sdlc.utils.ROOT", temp_project_dir)
+    utils.set_root(temp_project_dir)
     lock_data = {"slug": "test-slug", "current": "01-idea", "created": "2025-01-01T00:00:00"}
 
     # Test write_lock
@@ -96,21 +95,112 @@ def test_read_write_lock(temp_project_dir: Path, mocker):
     assert utils.read_lock() == {}  # Should return empty dict on corruption
 
 
-def test_read_lock_empty_file(temp_project_dir: Path, mocker):
+def test_read_lock_empty_file(temp_project_dir: Path):
     """Test reading an empty lock file."""
-    mocker.patch("ai_sdlc.utils.ROOT", temp_project_dir)
+    utils.set_root(temp_project_dir)
     lock_file = temp_project_dir / ".aisdlc.lock"
     lock_file.write_text("", encoding="utf-8")
     # Empty file should cause JSONDecodeError and return {}
     assert utils.read_lock() == {}
 
 
-def test_write_lock_os_error(temp_project_dir: Path, mocker):
+def test_write_lock_os_error(temp_project_dir: Path):
     """Test that write_lock raises OSError on write failure."""
-    mocker.patch("ai_sdlc.utils.ROOT", temp_project_dir)
+    utils.set_root(temp_project_dir)
     # Create a directory with the lock file name to cause write error
     lock_file = temp_project_dir / ".aisdlc.lock"
     lock_file.mkdir()
     
     with pytest.raises(OSError):
         utils.write_lock({"slug": "test"})
+
+
+def test_load_config_cache_layers(temp_project_dir: Path, mocker):
+    """Test that load_config is served from the memo, then the sidecar, then a parse."""
+    utils.set_root(temp_project_dir)
+    mocker.patch("ai_sdlc.utils._config_cache", utils.ConfigCache())
+    aisdlc_file = temp_project_dir / ".aisdlc"
+    aisdlc_file.write_text('steps = ["01-idea", "02-prd"]\n', encoding="utf-8")
+    old = 1_000_000_000_000_000_000
+    os.utime(aisdlc_file, ns=(old, old))
+
+    first = utils.load_config()
+    first["steps"].append("mutated")  # Callers get their own copy
+    assert utils.load_config()["steps"] == ["01-idea", "02-prd"]
+    assert utils.config_cache_stats() == {
+        "memo_hits": 1,
+        "sidecar_hits": 0,
+        "misses": 1,
+    }
+
+    # A new process (fresh memo) is answered from the sidecar
+    mocker.patch("ai_sdlc.utils._config_cache", utils.ConfigCache())
+    assert utils.load_config()["steps"] == ["01-idea", "02-prd"]
+    assert utils.config_cache_stats()["sidecar_hits"] == 1
+
+    # Same size and mtime but different content must not hit the sidecar
+    mocker.patch("ai_sdlc.utils._config_cache", utils.ConfigCache())
+    aisdlc_file.write_text('steps = ["01-idea", "02-prX"]\n', encoding="utf-8")
+    os.utime(aisdlc_file, ns=(old, old))
+    assert utils.load_config()["steps"] == ["01-idea", "02-prX"]
+    assert utils.config_cache_stats()["misses"] == 1
+
+
+def test_lock_transaction_serialises_updates(temp_project_dir: Path):
+    """Test that concurrent read-modify-write cycles under the state lock lose no updates."""
+    import threading
+
+    utils.set_root(temp_project_dir)
+    utils.write_lock({"n": 0})
+
+    def bump() -> None:
+        for _ in range(25):
+            with utils.lock_transaction(timeout=30):
+                data = utils.read_lock()
+                data["n"] += 1
+                utils.write_lock(data)
+
+    threads = [threading.Thread(target=bump) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert utils.read_lock() == {"n": 200}
+    assert not list(temp_project_dir.glob("*.tmp"))  # No temp files left behind
+
+
+def test_lock_transaction_timeout(temp_project_dir: Path):
+    """Test that waiting for a held state lock is bounded."""
+    import threading
+
+    utils.set_root(temp_project_dir)
+    held, release = threading.Event(), threading.Event()
+
+    def holder() -> None:
+        with utils.lock_transaction():
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait(5)
+    try:
+        with pytest.raises(TimeoutError), utils.lock_transaction(timeout=0.05):
+            pass
+    finally:
+        release.set()
+        thread.join()
+
+    # Nested use on the owning thread joins the outer lock instead of deadlocking
+    with utils.lock_transaction(), utils.lock_transaction(timeout=0.05):
+        pass
+
+
+def test_write_lock_failure_keeps_previous_state(temp_project_dir: Path, mocker):
+    """Test that a failed write leaves the previous lock content intact."""
+    utils.set_root(temp_project_dir)
+    utils.write_lock({"slug": "kept"})
+    mocker.patch("ai_sdlc.utils.os.replace", side_effect=OSError("disk full"))
+    with pytest.raises(OSError):
+        utils.write_lock({"slug": "lost"})
+    assert utils.read_lock() == {"slug": "kept"}
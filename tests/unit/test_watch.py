@@ -0,0 +1,144 @@
+"""Unit tests for ai_sdlc.watch and the watch command."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from ai_sdlc import watch
+from ai_sdlc.commands import watch as watch_cmd
+from ai_sdlc.state import get_backend
+
+STEPS = ["0-idea", "1-prd", "2-plus"]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def project(make_project) -> Path:
+    """A project with a tracked workstream waiting for its 1-prd file."""
+    project = make_project(STEPS, template="# {step}\n{{{{ prev_step }}}}\n")
+    workdir = project / "doing" / "auth"
+    workdir.mkdir(parents=True)
+    (workdir / "0-idea-auth.md").write_text("idea", encoding="utf-8")
+    (workdir / "_prompt-1-prd.md").write_text("prompt", encoding="utf-8")
+    (project / ".aisdlc.lock").write_text(
+        json.dumps({"slug": "auth", "current": "0-idea", "created": "x"}),
+        encoding="utf-8",
+    )
+    return project
+
+
+def test_debouncer_waits_for_stable_non_empty_files(tmp_path: Path):
+    """Test that a file is due only after it stopped changing for the settle period."""
+    clock = FakeClock()
+    debouncer = watch.Debouncer(2.0, clock)
+    path = tmp_path / "1-prd-auth.md"
+    path.write_text("", encoding="utf-8")
+    debouncer.touch(path)
+    assert debouncer.timeout() == 2.0
+    clock.now += 2
+    assert debouncer.due() == []  # Still empty: keep waiting
+
+    path.write_text("partial", encoding="utf-8")
+    clock.now += 2
+    assert debouncer.due() == []  # Changed since the last look: settle again
+    clock.now += 1
+    assert debouncer.due() == []
+    clock.now += 1
+    assert debouncer.due() == [path]
+    assert debouncer.timeout() is None
+
+
+def test_polling_watcher_reports_changed_workdirs(tmp_path: Path):
+    """Test that polling detects new files and new workstream directories."""
+    (tmp_path / "a").mkdir()
+    watcher = watch.PollingWatcher(tmp_path, interval=0.01)
+    assert watcher.wait(0) == set()
+    (tmp_path / "a" / "x.md").write_text("x", encoding="utf-8")
+    (tmp_path / "b").mkdir()
+    assert watcher.wait(0) == {tmp_path / "a", tmp_path / "b"}
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+def test_inotify_watcher_reports_changed_workdirs(tmp_path: Path):
+    """Test that inotify reports writes in existing and newly created workstreams."""
+    (tmp_path / "a").mkdir()
+    watcher = watch.InotifyWatcher(tmp_path)
+    try:
+        assert watcher.wait(0) == set()
+        (tmp_path / "a" / "x.md").write_text("x", encoding="utf-8")
+        assert watcher.wait(1) == {tmp_path / "a"}
+        (tmp_path / "b").mkdir()
+        assert watcher.wait(1) == {tmp_path / "b"}
+        (tmp_path / "b" / "y.md").write_text("y", encoding="utf-8")
+        assert watcher.wait(1) == {tmp_path / "b"}
+    finally:
+        watcher.close()
+
+
+class OneShotWatcher:
+    """Never reports changes; the loop stops once a file has advanced."""
+
+    def wait(self, timeout):
+        return set()
+
+    def close(self):
+        pass
+
+
+def test_watch_loop_advances_tracked_workstream(project: Path, capsys):
+    """Test that a saved step file advances the lock and swaps the prompt."""
+    workdir = project / "doing" / "auth"
+    (workdir / "1-prd-auth.md").write_text("the prd", encoding="utf-8")
+    conf = {"steps": STEPS}
+    backend = get_backend(conf)
+    calls = iter(range(3))
+    watch_cmd.watch_loop(
+        conf,
+        backend,
+        OneShotWatcher(),
+        watch.Debouncer(0),
+        stop=lambda: next(calls, None) is None,
+    )
+
+    assert backend.get("auth")["current"] == "1-prd"
+    assert not (workdir / "_prompt-1-prd.md").exists()
+    assert (workdir / "_prompt-2-plus.md").read_text(
+        encoding="utf-8"
+    ) == "# 2-plus\nthe prd\n"
+    out = capsys.readouterr().out
+    assert "auth: advanced to 1-prd" in out
+    assert "prompt ready" in out
+
+
+def test_awaited_untracked_workstream(project: Path):
+    """Test that untracked workstreams advance only while their prompt is pending."""
+    conf = {"steps": STEPS}
+    backend = get_backend(conf)
+    workdir = project / "doing" / "billing"
+    workdir.mkdir()
+    (workdir / "0-idea-billing.md").write_text("idea", encoding="utf-8")
+    (workdir / "1-prd-billing.md").write_text("prd", encoding="utf-8")
+    assert watch_cmd.awaited(conf, backend, workdir) is None
+
+    (workdir / "_prompt-1-prd.md").write_text("prompt", encoding="utf-8")
+    files, tracked = watch_cmd.awaited(conf, backend, workdir)
+    assert (files.next_step, tracked) == ("1-prd", False)
+
+
+def test_watch_rejects_bad_arguments(project: Path):
+    """Test that invalid options are usage errors."""
+    with pytest.raises(SystemExit):
+        watch_cmd.run_watch(["--settle", "soon"])
+    with pytest.raises(SystemExit):
+        watch_cmd.run_watch(["--interval", "0", "--poll"])